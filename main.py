@@ -57,6 +57,20 @@ def main():
         action="store_true",
         help="Run without actually posting to LinkedIn"
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve scraped pages only from the local response cache"
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Call the AI provider even when a cached response exists"
+    )
+    parser.add_argument(
+        "--source",
+        help="Scrape only this source (a key under `sources:` in config.yaml)"
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -82,6 +96,15 @@ def main():
         # Load configuration
         logger.info("Loading configuration...")
         config = load_config()
+        if args.offline:
+            config.setdefault('scraping', {})['offline'] = True
+        if args.no_llm_cache:
+            config.setdefault('content', {}).setdefault('generation', {}).setdefault('cache', {})['bypass'] = True
+        if args.source:
+            sources = config.get('sources', {})
+            if args.source not in sources:
+                raise ValueError(f"Unknown source: {args.source}")
+            config['sources'] = {args.source: {**sources[args.source], 'enabled': True}}
         
         # Create orchestrator
         orchestrator = AutomationOrchestrator(
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Batch scoring benchmark
+Checks that vectorized batch scoring gives the same scores and categories as
+per-article scoring, then times both on large synthetic article sets
+(the per-article path is timed on a sample and extrapolated).
+
+Usage:
+    python scripts/bench_batch_scoring.py [--articles 10000,1000000] [--keywords 1000] [--tfidf]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_keyword_matcher import synthetic_articles, synthetic_categories
+from src.analyzers.topic_analyzer import TopicAnalyzer
+from src.utils.config_loader import load_config
+
+
+def check_golden(analyzer: TopicAnalyzer, articles: list) -> int:
+    """Compare batch scores and categories with the per-article path"""
+    scores, categories = analyzer.score_batch(articles, tfidf=False)
+    mismatches = 0
+    for article, score, category in zip(articles, scores.tolist(), categories):
+        probe = dict(article)
+        expected = analyzer._calculate_relevance_score(probe)
+        if expected != score or probe.get('category') != category:
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized batch scoring")
+    parser.add_argument('--articles', default='10000,1000000', help="Comma-separated article counts")
+    parser.add_argument('--keywords', type=int, default=1000, help="Keywords spread over the repo categories")
+    parser.add_argument('--baseline-sample', type=int, default=20000,
+                        help="Articles timed with per-article scoring (extrapolated)")
+    parser.add_argument('--tfidf', action='store_true', help="Also time TF-IDF weighting")
+    args = parser.parse_args()
+
+    config = load_config()
+    base = config.get('topic_categories', {})
+    repo_keywords = sum(len((data or {}).get('keywords', [])) for data in base.values())
+    results = []
+    for keyword_count in sorted({repo_keywords, args.keywords}):
+        categories = synthetic_categories(keyword_count, base)
+        analyzer = TopicAnalyzer({**config, 'topic_categories': categories})
+
+        golden = synthetic_articles(2000, seed=3)
+        golden.append({'title': 'New AI tools and an AI tool for C++ e-commerce', 'summary': None})
+        golden.append({'title': '', 'summary': ''})
+        golden.append({'title': 'Café AI_tool — naïve ａｉ tools', 'summary': 'İstanbul\nAI\ttool ai-tool ai tools'})
+        mismatches = check_golden(analyzer, golden)
+        print(f"Golden check ({keyword_count} keywords): {mismatches} mismatches")
+        if mismatches:
+            sys.exit(1)
+
+        sample = synthetic_articles(args.baseline_sample, seed=5)
+        started = time.perf_counter()
+        for article in sample:
+            analyzer._calculate_relevance_score(article)
+        baseline_us = (time.perf_counter() - started) / len(sample) * 1e6
+        results.append((keyword_count, analyzer, baseline_us))
+
+    print(f"\n{'keywords':>8} {'articles':>9} {'mode':<8} {'batch s':>8} {'us/article':>11} "
+          f"{'per-article s (est)':>20} {'speedup':>8}")
+    for article_count in (int(n) for n in args.articles.split(',')):
+        articles = synthetic_articles(article_count)
+        for keyword_count, analyzer, baseline_us in results:
+            for tfidf in ((False, True) if args.tfidf else (False,)):
+                started = time.perf_counter()
+                analyzer.score_batch(articles, tfidf=tfidf)
+                elapsed = time.perf_counter() - started
+                estimate = baseline_us * article_count / 1e6
+                print(f"{keyword_count:>8} {article_count:>9} {'tfidf' if tfidf else 'keyword':<8} "
+                      f"{elapsed:>8.2f} {elapsed / article_count * 1e6:>11.2f} "
+                      f"{estimate:>20.1f} {estimate / elapsed:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
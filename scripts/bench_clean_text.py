@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for BaseScraper._clean_text
+Checks the fast extractor against the BeautifulSoup path on a golden corpus,
+then times both.
+
+Usage:
+    python scripts/bench_clean_text.py [feed.xml ...] [--number 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+import warnings
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from src.scrapers.html_text import clean_text
+
+warnings.filterwarnings('ignore')  # bs4 warns on URL-like plain strings
+
+# Representative feed summaries and hand-picked edge cases
+SAMPLES = [
+    '<p>OpenAI&#8217;s new <a href="https://example.com/a">AI tool</a> boosts productivity &amp; automation.</p>'
+    '<p>The post <a href="https://techcrunch.com/x">Something</a> appeared first on '
+    '<a href="https://techcrunch.com">TechCrunch</a>.</p>',
+    '<img src="https://example.com/i.jpg" width="300"/><p>Remote work&nbsp;is here to stay &#8212; '
+    'hiring trends for 2025.</p><!-- tracking pixel -->',
+    'OpenAI releases a new AI tool that boosts productivity for remote teams',
+    'Jobs &amp; skills: what &quot;future of work&quot; means',
+    '<div><script>var x = "<b>";</script><style>p { color: red }</style>Visible text</div>',
+    '<p>Unclosed <b>bold <i>italic</p> tail',
+    'a < b > c & d',
+    '&lt;b&gt;escaped markup&lt;/b&gt;',
+    '<![CDATA[Inside CDATA]]> after',
+    '<!DOCTYPE html><html><body>Doc&copy</body></html>',
+    '&#150; &#129; &#0; &#99999999; &foo; &amp-x &',
+    '<ruby>漢<rp>(</rp><rt>kan</rt><rp>)</rp></ruby> <template>hidden<b>x</b></template>shown',
+]
+
+FUZZ_TOKENS = [
+    '<p>', '</p>', '<b>', '</b>', '<br>', '<br/>', '<script>', '</script>', '<style>', '</style>',
+    '<template>', '</template>', '<rt>', '</rt>', '<!-- c -->', '<!--', '-->', '<![CDATA[x]]>',
+    '<!DOCTYPE html>', '<?pi ?>', '&amp;', '&amp', '&#8217;', '&#x27;', '&#150;', '&nbsp;',
+    '&copy', '&foo;', '&', '&#', '<', '>', 'word', 'two words', ' ', '\n', '<a href="x>y">',
+    '</a>', '<img src=x>', '</br>', '<p/>', '</ p>', '< b>', '&lt;b&gt;', 'é',
+]
+
+
+def reference_clean_text(text: str) -> str:
+    """The original BeautifulSoup-based implementation"""
+    if not text:
+        return ""
+    text = BeautifulSoup(text, 'html.parser').get_text()
+    text = ' '.join(text.split())
+    return text.strip()
+
+
+def build_corpus(feed_paths, fuzz_count: int):
+    """Samples + summaries from local feed files + seeded random markup"""
+    corpus = list(SAMPLES)
+
+    if feed_paths:
+        import feedparser
+        for path in feed_paths:
+            feed = feedparser.parse(path)
+            corpus.extend(entry.get('summary', '') for entry in feed.entries)
+
+    rng = random.Random(42)
+    for _ in range(fuzz_count):
+        corpus.append(''.join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(1, 12))))
+
+    return corpus
+
+
+def check_golden(corpus) -> int:
+    """Compare outputs; return the number of mismatches"""
+    mismatches = 0
+    for text in corpus:
+        expected = reference_clean_text(text)
+        actual = clean_text(text)
+        if expected != actual:
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"  MISMATCH {text!r}\n    expected {expected!r}\n    actual   {actual!r}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML text cleaning")
+    parser.add_argument('feeds', nargs='*', help="Local RSS/Atom files to harvest summaries from")
+    parser.add_argument('--fuzz', type=int, default=20000, help="Random markup cases for the golden check")
+    parser.add_argument('--number', type=int, default=2000, help="Timing iterations per sample")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.feeds, args.fuzz)
+    print(f"Golden check on {len(corpus)} inputs...")
+    mismatches = check_golden(corpus)
+    print(f"  {mismatches} mismatches")
+
+    print(f"\n{'input':<12} {'bs4 (us)':>10} {'fast (us)':>10} {'speedup':>8}")
+    timed = [('markup', SAMPLES[0]), ('mixed', SAMPLES[1]), ('plain', SAMPLES[2]),
+             ('entities', SAMPLES[3])]
+    for label, text in timed:
+        old = timeit.timeit(lambda: reference_clean_text(text), number=args.number)
+        new = timeit.timeit(lambda: clean_text(text), number=args.number)
+        print(f"{label:<12} {old / args.number * 1e6:>10.1f} {new / args.number * 1e6:>10.1f} "
+              f"{old / new:>7.1f}x")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Feed parser benchmark
+Checks the streaming lxml parser against feedparser on sample feeds, then
+compares latency and peak memory on large feeds when only the first
+max_articles entries are kept. The streaming side runs `_process_feed` with a
+feed cache, as real fetches do (validators, seen-entry tracking), so the
+figures hold for production. Each memory measurement runs in a fresh process.
+
+Usage:
+    python scripts/bench_feed_parser.py [feed.xml ...] [--entries 5000] [--max-articles 10]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scrapers.feed_cache import FeedCache
+from src.scrapers.forbes_scraper import ForbesScraper
+from src.scrapers.feed_parser import FeedFormatError, iter_entries
+
+SAMPLES = {
+    'rss2': b'''<?xml version="1.0"?><rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+        xmlns:atom="http://www.w3.org/2005/Atom"><channel><title>t</title><link>http://a/</link>
+        <item><title>A &amp; B</title><link>http://a/1</link>
+        <content:encoded><![CDATA[<p>full <b>body</b></p>]]></content:encoded></item>
+        <item><title><![CDATA[X <b>y</b>]]></title><link> http://a/2 </link><description>&lt;p&gt;d&lt;/p&gt;</description>
+        <guid isPermaLink="false">g2</guid><pubDate>Mon, 06 Jan 2025 10:00:00 GMT</pubDate></item>
+        </channel></rss>''',
+    'atom': b'''<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>t</title>
+        <entry><title type="html">T &lt;i&gt;x&lt;/i&gt;</title><link rel="self" href="http://s"/><link href="http://alt"/>
+        <id>urn:1</id><updated>2025-01-02T00:00:00Z</updated>
+        <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><p>hi <b>there</b></p></div></content></entry>
+        <entry><title>T2</title><link rel="alternate" href="http://alt2"/><id>urn:2</id>
+        <published>2025-01-03T00:00:00Z</published><summary>S2</summary></entry></feed>''',
+    'rss1': b'''<?xml version="1.0"?><rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+        xmlns="http://purl.org/rss/1.0/"><channel rdf:about="http://a/"><title>t</title></channel>
+        <item rdf:about="http://a/r1"><title>R1</title><link>http://a/r1</link><description>one</description></item>
+        </rdf:RDF>''',
+    'entities': b'''<rss version="2.0"><channel><item><title>Caf&eacute;&nbsp;news</title>
+        <link>http://a/e</link><description>x</description></item></channel></rss>''',
+}
+
+
+def large_feed(entries: int, summary_bytes: int) -> bytes:
+    """A deterministic RSS feed of the given size"""
+    body = ('lorem ipsum dolor sit amet ' * (summary_bytes // 27 + 1))[:summary_bytes]
+    items = ''.join(
+        f"<item><title>Story {i} about AI tools</title><link>http://example.com/{i}</link>"
+        f"<guid>id-{i}</guid><pubDate>Mon, 06 Jan 2025 12:00:00 GMT</pubDate>"
+        f"<description>&lt;p&gt;{body}&lt;/p&gt;</description></item>"
+        for i in range(entries)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>big</title>{items}</channel></rss>'.encode()
+
+
+def scraper(max_articles: int) -> ForbesScraper:
+    """A plain RSS scraper to run both parsers through, with an empty, unsaved feed cache"""
+    bench = ForbesScraper({'name': 'Bench', 'max_articles': max_articles})
+    # Never saved, so nothing is written to this path
+    bench.feed_cache = FeedCache(path=os.path.join(tempfile.gettempdir(), 'bench_feed_parser', 'feeds.json'))
+    return bench
+
+
+def process(bench: ForbesScraper, content: bytes):
+    """Parse a freshly fetched feed body the way fetch_rss does"""
+    return bench._process_feed('http://bench/feed', content, {})
+
+
+def comparable(articles):
+    """Article fields that don't depend on parse time"""
+    return [{k: a[k] for k in ('title', 'url', 'summary')} for a in articles]
+
+
+def check_golden(documents, max_articles: int) -> int:
+    """Compare both parsers' article dicts; return the number of mismatching documents"""
+    import feedparser
+
+    mismatches = 0
+    for name, content in documents.items():
+        bench = scraper(max_articles)
+        expected = comparable(bench._collect_entries(feedparser.parse(content).entries, set()))
+        actual = comparable(process(bench, content))
+        try:
+            list(iter_entries(content))
+            route = 'stream'
+        except FeedFormatError:
+            route = 'feedparser fallback'
+        status = 'ok' if expected == actual else 'MISMATCH'
+        mismatches += status != 'ok'
+        print(f"  {name:<12} {route:<20} {status}")
+        if status != 'ok':
+            print(f"    expected {expected}\n    actual   {actual}")
+    return mismatches
+
+
+def measure(parser_name: str, path: str, max_articles: int) -> dict:
+    """Parse one file in this process and report latency and peak RSS growth"""
+    import resource
+
+    with open(path, 'rb') as f:
+        content = f.read()
+    bench = scraper(max_articles)
+    if parser_name == 'feedparser':
+        import feedparser
+        parse = lambda: bench._collect_entries(feedparser.parse(content).entries, set())
+    else:
+        parse = lambda: process(bench, content)
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    articles = parse()
+    elapsed = time.perf_counter() - started
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return {'seconds': elapsed, 'rss_growth_mb': (after - before) / scale, 'articles': len(articles)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming feed parsing against feedparser")
+    parser.add_argument('feeds', nargs='*', help="Local RSS/Atom files to include")
+    parser.add_argument('--entries', type=int, default=5000, help="Entries in the synthesized large feed")
+    parser.add_argument('--summary-bytes', type=int, default=1000)
+    parser.add_argument('--max-articles', type=int, default=10)
+    parser.add_argument('--worker', nargs=2, metavar=('PARSER', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.worker[0], args.worker[1], args.max_articles)))
+        return
+
+    documents = dict(SAMPLES)
+    for path in args.feeds:
+        with open(path, 'rb') as f:
+            documents[os.path.basename(path)] = f.read()
+
+    print("Golden check (first max_articles entries):")
+    mismatches = check_golden(documents, args.max_articles)
+
+    large_path = os.path.join(
+        os.environ.get('TMPDIR', '/tmp'), f"bench_feed_{args.entries}_{args.summary_bytes}.xml"
+    )
+    with open(large_path, 'wb') as f:
+        f.write(large_feed(args.entries, args.summary_bytes))
+    targets = [large_path] + list(args.feeds)
+
+    print(f"\n{'feed':<28} {'MB':>6} {'parser':<11} {'ms':>9} {'peak RSS +MB':>13}")
+    for path in targets:
+        size = os.path.getsize(path) / 1e6
+        for parser_name in ('feedparser', 'stream'):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--worker', parser_name, path,
+                 '--max-articles', str(args.max_articles)],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{os.path.basename(path)[:28]:<28} {size:>6.1f} {parser_name:<11} "
+                  f"{result['seconds'] * 1000:>9.1f} {result['rss_growth_mb']:>13.1f}")
+
+    os.remove(large_path)
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
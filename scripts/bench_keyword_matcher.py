@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Keyword matcher benchmark
+Checks KeywordMatcher against a per-keyword word-boundary regex reference
+(plural "s" on the last word included), then times it against the original substring loop while growing the keyword
+list and the article count, to show per-article cost stays flat.
+
+Usage:
+    python scripts/bench_keyword_matcher.py [--keywords 10,1000,5000] [--articles 10000,100000]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers.keyword_matcher import KeywordMatcher
+from src.utils.config_loader import load_config
+
+VOCABULARY = [f"w{i}" for i in range(20000)] + [
+    'ai', 'tool', 'tools', 'chatgpt', 'automation', 'jobs', 'hiring', 'remote', 'work', 'skills',
+    'machine', 'learning', 'startup', 'startups', 'innovation', 'viral', 'c++', 'e-commerce', 'llm',
+    'llms', 'node.js', 'node.jss',
+]
+
+
+def synthetic_categories(keyword_count: int, base: dict, seed: int = 7) -> dict:
+    """Repo categories plus random one- to three-word keywords spread over them"""
+    rng = random.Random(seed)
+    categories = {key: {**data, 'keywords': list(data.get('keywords', []))} for key, data in base.items()}
+    keys = list(categories)
+    for _ in range(max(0, keyword_count - sum(len(c['keywords']) for c in categories.values()))):
+        words = ' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(1, 3)))
+        categories[rng.choice(keys)]['keywords'].append(words)
+    return categories
+
+
+def synthetic_articles(count: int, seed: int = 11) -> list:
+    """Articles of realistic length drawn from the same vocabulary"""
+    rng = random.Random(seed)
+    return [
+        {
+            'title': ' '.join(rng.choice(VOCABULARY) for _ in range(10)),
+            'summary': ' '.join(rng.choice(VOCABULARY) for _ in range(40)),
+        }
+        for _ in range(count)
+    ]
+
+
+def reference_counts(categories: dict, article: dict) -> list:
+    """One boundary regex per keyword; tokens may be separated by any non-word run
+
+    A trailing "s" is allowed unless the keyword already ends in "s" or its
+    plural is listed as a keyword of its own (then that one matches instead).
+    """
+    text = f"{article.get('title') or ''} {article.get('summary') or ''}".lower()
+    keywords = [keyword.lower().strip() for data in categories.values() for keyword in data.get('keywords', [])]
+    listed = {tuple(re.findall(r'\w+', keyword)) for keyword in keywords if re.fullmatch(r'[\w\s-]+', keyword)}
+    counts = []
+    for data in categories.values():
+        matches = 0
+        for keyword in data.get('keywords', []):
+            keyword = keyword.lower().strip()
+            if not keyword:
+                continue
+            if re.fullmatch(r'[\w\s-]+', keyword):
+                tokens = re.findall(r'\w+', keyword)
+                body = r'\W+'.join(re.escape(token) for token in tokens)
+                plural = tuple(tokens[:-1]) + (tokens[-1] + 's',)
+                if not tokens[-1].endswith('s') and plural not in listed:
+                    body += 's?'
+            else:
+                body = re.escape(keyword) + ('s?' if keyword[-1].isalnum() else '')
+            matches += bool(re.search(r'(?<!\w)' + body + r'(?!\w)', text))
+        counts.append(matches)
+    return counts
+
+
+def substring_counts(categories: dict, article: dict) -> list:
+    """The original per-category, per-keyword substring loop"""
+    title = article.get('title', '').lower()
+    summary = article.get('summary', '').lower()
+    combined_text = f"{title} {summary}"
+    return [
+        sum(1 for keyword in data.get('keywords', []) if keyword.lower() in combined_text)
+        for data in categories.values()
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark topic keyword matching")
+    parser.add_argument('--keywords', default='10,1000,5000', help="Comma-separated keyword counts")
+    parser.add_argument('--articles', default='10000,100000', help="Comma-separated article counts")
+    parser.add_argument('--baseline-sample', type=int, default=1000,
+                        help="Articles timed with the substring loop (extrapolated)")
+    args = parser.parse_args()
+
+    base = load_config().get('topic_categories', {})
+    keyword_counts = [int(n) for n in args.keywords.split(',')]
+    article_counts = [int(n) for n in args.articles.split(',')]
+
+    golden_articles = synthetic_articles(300, seed=3)
+    golden_articles.append({'title': 'New AI tools and an AI tool for C++ e-commerce', 'summary': 'Remote-work hiring'})
+    # Plural-only mentions of the shipped singular keywords
+    golden_articles.append({'title': 'AI tools for startups', 'summary': 'LLMs, neural networks, careers and insights'})
+    golden_articles.append({'title': 'Node.js vs node.jss', 'summary': 'AI assistants, hirings, jobs'})
+    mismatches = 0
+    for keyword_count in keyword_counts:
+        categories = synthetic_categories(keyword_count, base)
+        matcher = KeywordMatcher(categories)
+        for article in golden_articles:
+            if matcher.article_counts(article) != reference_counts(categories, article):
+                mismatches += 1
+    print(f"Golden check: {mismatches} mismatches\n")
+
+    print(f"{'keywords':>8} {'articles':>9} {'matcher s':>10} {'us/article':>11} {'substring us/article':>21}")
+    for keyword_count in keyword_counts:
+        categories = synthetic_categories(keyword_count, base)
+        matcher = KeywordMatcher(categories)
+
+        sample = synthetic_articles(args.baseline_sample, seed=5)
+        started = time.perf_counter()
+        for article in sample:
+            substring_counts(categories, article)
+        baseline_us = (time.perf_counter() - started) / len(sample) * 1e6
+
+        for article_count in article_counts:
+            articles = synthetic_articles(article_count)
+            started = time.perf_counter()
+            for article in articles:
+                matcher.article_counts(article)
+            elapsed = time.perf_counter() - started
+            print(f"{keyword_count:>8} {article_count:>9} {elapsed:>10.2f} "
+                  f"{elapsed / article_count * 1e6:>11.1f} {baseline_us:>21.1f}")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Prompt batching benchmark
+Compares one prompt per topic with batched multi-topic prompts: requests
+sent and prompt tokens (counted with tiktoken when installed, otherwise
+estimated at 4 characters per token). Also checks that batched replies
+parse, including truncated and malformed ones.
+
+Usage:
+    python scripts/bench_prompt_batching.py [--topics 10] [--batch-sizes 1,2,5,10]
+"""
+import argparse
+import json
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.generators.post_generator import PostGenerator
+from src.utils.config_loader import load_config
+
+
+def token_counter():
+    """Token count function and its name"""
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding('cl100k_base')
+        return (lambda text: len(encoding.encode(text))), 'tiktoken cl100k_base'
+    except ImportError:
+        return (lambda text: len(text) // 4), 'estimated (chars / 4)'
+
+
+def sample_topics(count: int) -> list:
+    """Topics shaped like the analyzer's output"""
+    return [{
+        'title': f"Company {i} ships an AI assistant for spreadsheet analysis",
+        'summary': f"The release {i} adds natural-language queries, charts and automated reports for teams.",
+        'source': 'TechCrunch',
+        'url': f"https://example.com/{i}",
+    } for i in range(count)]
+
+
+def check_parsing(generator: PostGenerator) -> None:
+    """Parse well-formed, reordered, fenced, truncated and malformed replies"""
+    replies = {
+        'ordered': (json.dumps({'posts': [{'id': 1, 'post': 'one'}, {'id': 2, 'post': 'two'}]}), ['one', 'two']),
+        'reordered': (json.dumps({'posts': [{'id': 2, 'post': 'two'}, {'id': 1, 'post': 'one'}]}), ['one', 'two']),
+        'fenced list': ('```json\n["one", "two"]\n```', ['one', 'two']),
+        'truncated': ('{"posts": [{"id": 1, "post": "one"}, {"id": 2, "post": "tw', ['one', None]),
+        'malformed': ('{"posts": [{"id": "x", "post": "one"}, {"id": 2, "post": ""}]}', [None, None]),
+        'not json': ('Sorry, I cannot help with that.', [None, None]),
+    }
+    for name, (reply, expected) in replies.items():
+        parsed = generator._parse_batch(reply, 2)
+        print(f"  {name:<12} {'ok' if parsed == expected else f'MISMATCH {parsed}'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched post prompts")
+    parser.add_argument('--topics', type=int, default=10, help="Topics to generate posts for")
+    parser.add_argument('--batch-sizes', default='1,2,5,10', help="Comma-separated topics per request")
+    args = parser.parse_args()
+
+    generator = PostGenerator(load_config())
+    count_tokens, counter_name = token_counter()
+    topics = sample_topics(args.topics)
+
+    print(f"Prompt tokens: {counter_name}\n")
+    print(f"{'batch size':>10} {'requests':>9} {'prompt tokens':>14} {'per topic':>10} {'reduction':>10}")
+    baseline = None
+    for batch_size in (int(n) for n in args.batch_sizes.split(',')):
+        groups = [topics[start:start + batch_size] for start in range(0, len(topics), batch_size)]
+        prompts = [
+            generator._create_prompt(group[0]) if len(group) == 1 else generator._create_batch_prompt(group)
+            for group in groups
+        ]
+        tokens = sum(count_tokens(prompt) for prompt in prompts)
+        baseline = baseline or tokens
+        print(f"{batch_size:>10} {len(prompts):>9} {tokens:>14} {tokens / len(topics):>10.0f} "
+              f"{baseline / tokens:>9.1f}x")
+
+    print("\nBatched reply parsing:")
+    check_parsing(generator)
+
+
+if __name__ == '__main__':
+    main()
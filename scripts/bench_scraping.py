@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Scraping throughput benchmark
+Runs ScraperManager.scrape_all_sources against the local fixture server at
+several source counts and reports articles/sec, p50/p99 seconds per source
+and peak RSS. Each scale runs in a fresh process so peak RSS is per scale.
+
+Usage:
+    python scripts/bench_scraping.py [--scales 6,60,600] [--mode async] [--latency 50]
+    python scripts/bench_scraping.py --save baseline.json
+    python scripts/bench_scraping.py --baseline baseline.json --tolerance 0.2
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixture_server import add_server_arguments, server_from_args
+
+# Every Nth source has no feed and goes through TechCrunch's HTML fallback
+WEB_SOURCE_EVERY = 6
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process, or None where unsupported"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def bench_config(base_url: str, sources: int, mode: str, max_articles: int, state_dir: str):
+    """The repo config pointed at the fixture server with caches out of the way"""
+    from src.utils.config_loader import load_config
+
+    config = load_config()
+    scraping = config.setdefault('scraping', {})
+    scraping['mode'] = mode
+    # The fixture server is a single host: lift per-host limits so they don't dominate
+    scraping['per_host_limit'] = scraping.get('max_concurrency', 20)
+    scraping['rate_limit'] = {'requests_per_second': 1e6, 'burst': 1e6}
+    scraping['feed_cache'] = {'enabled': False}
+    scraping['response_cache'] = {'enabled': False}
+    scraping['offline'] = False
+    scraping['circuit_breaker'] = {**scraping.get('circuit_breaker', {}),
+                                   'path': os.path.join(state_dir, 'source_health.json')}
+
+    config['sources'] = {}
+    for n in range(sources):
+        source = {'name': f"Fixture {n}", 'enabled': True, 'max_articles': max_articles}
+        if n % WEB_SOURCE_EVERY == WEB_SOURCE_EVERY - 1:
+            source['scraper'] = 'src.scrapers.techcrunch_scraper:TechCrunchScraper'
+            source['url'] = f"{base_url}/pages/{n}.html"
+        else:
+            source['scraper'] = 'src.scrapers.forbes_scraper:ForbesScraper'
+            source['rss_feed'] = f"{base_url}/feeds/{n}.xml"
+        config['sources'][f"fixture_{n}"] = source
+    return config
+
+
+def run_scale(base_url: str, sources: int, mode: str, max_articles: int, max_workers: int) -> dict:
+    """Scrape once in this process and measure"""
+    from loguru import logger
+
+    logger.remove()
+    logger.add(sys.stderr, level='ERROR')
+
+    from src.scrapers.scraper_manager import ScraperManager
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        manager = ScraperManager(bench_config(base_url, sources, mode, max_articles, state_dir))
+        started = time.perf_counter()
+        articles = manager.scrape_all_sources(max_workers=max_workers)
+        elapsed = time.perf_counter() - started
+
+    timings = list(manager.source_timings.values())
+    return {
+        'sources': sources,
+        'mode': mode,
+        'articles': len(articles),
+        'seconds': round(elapsed, 3),
+        'articles_per_sec': round(len(articles) / elapsed, 1) if elapsed else 0.0,
+        'p50': round(percentile(timings, 50), 4),
+        'p99': round(percentile(timings, 99), 4),
+        'peak_rss_mb': round(peak_rss_mb(), 1) if peak_rss_mb() is not None else None,
+        'http': manager.transport.stats(),
+    }
+
+
+def compare(results, baseline_path: str, tolerance: float) -> int:
+    """Count throughput regressions beyond tolerance against a saved run"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r['mode'], r['sources']): r for r in json.load(f)}
+
+    regressions = 0
+    for result in results:
+        before = baseline.get((result['mode'], result['sources']))
+        if not before or not before['articles_per_sec']:
+            continue
+        change = result['articles_per_sec'] / before['articles_per_sec'] - 1
+        flag = 'REGRESSION' if change < -tolerance else 'ok'
+        regressions += flag == 'REGRESSION'
+        print(f"  {result['mode']:<7} {result['sources']:>5} sources: {change:+.0%} articles/sec  {flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraping throughput against local fixtures")
+    parser.add_argument('--scales', default='6,60,600', help="Comma-separated source counts")
+    parser.add_argument('--mode', choices=['threads', 'async', 'both'], default='both')
+    parser.add_argument('--max-articles', type=int, default=10, help="max_articles per source")
+    parser.add_argument('--max-workers', type=int, default=3, help="Thread pool size in threads mode")
+    parser.add_argument('--save', help="Write results as JSON")
+    parser.add_argument('--baseline', help="Compare against results saved with --save")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed articles/sec drop")
+    parser.add_argument('--worker', nargs=3, metavar=('URL', 'SOURCES', 'MODE'), help=argparse.SUPPRESS)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    if args.worker:
+        url, sources, mode = args.worker
+        print(json.dumps(run_scale(url, int(sources), mode, args.max_articles, args.max_workers)))
+        return
+
+    modes = ['threads', 'async'] if args.mode == 'both' else [args.mode]
+    scales = [int(scale) for scale in args.scales.split(',')]
+
+    results = []
+    with server_from_args(args) as server:
+        print(f"Fixture server at {server.base_url} (latency {args.latency:.0f}±{args.jitter:.0f} ms, "
+              f"error rate {args.error_rate:.0%})\n")
+        print(f"{'mode':<7} {'sources':>7} {'articles':>8} {'seconds':>8} {'art/s':>8} "
+              f"{'p50 s':>7} {'p99 s':>7} {'RSS MB':>7} {'reused':>7}")
+
+        for mode in modes:
+            for sources in scales:
+                output = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__),
+                     '--worker', server.base_url, str(sources), mode,
+                     '--max-articles', str(args.max_articles), '--max-workers', str(args.max_workers)],
+                    capture_output=True, text=True, check=True,
+                ).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+                results.append(result)
+                rss = f"{result['peak_rss_mb']:.1f}" if result['peak_rss_mb'] is not None else 'n/a'
+                print(f"{mode:<7} {sources:>7} {result['articles']:>8} {result['seconds']:>8.2f} "
+                      f"{result['articles_per_sec']:>8.1f} {result['p50']:>7.3f} {result['p99']:>7.3f} "
+                      f"{rss:>7} {result['http']['reused_connections']:>7}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        print(f"\nAgainst {args.baseline}:")
+        sys.exit(1 if compare(results, args.baseline, args.tolerance) else 0)
+
+
+if __name__ == '__main__':
+    main()
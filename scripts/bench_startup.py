@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+CLI startup benchmark
+Runs each main.py mode in a fresh process under `python -X importtime`,
+offline and in a scratch directory (cold caches, empty database), and
+reports wall time, import time, and which heavy modules were imported.
+Exits non-zero when a mode fails or exceeds its time budget, so it can
+guard cold-start regressions in CI.
+
+Modes run offline: --test-scrape --offline, --generate-samples (template
+fallback unless an API key is set), --mode manual --offline --dry-run, and
+--mode auto --offline --dry-run, which is stopped once the scheduler waits.
+
+Usage:
+    python scripts/bench_startup.py [--repeat 3] [--budget 3.0] [--modes test-scrape,generate-samples]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODES = {
+    'test-scrape': ['--test-scrape', '--offline'],
+    'generate-samples': ['--generate-samples'],
+    'manual': ['--mode', 'manual', '--offline', '--dry-run'],
+    'auto': ['--mode', 'auto', '--offline', '--dry-run'],
+}
+# The auto mode never exits; it is timed until the scheduler starts waiting
+READY_MARKER = 'Waiting for scheduled time'
+
+HEAVY_MODULES = ['numpy', 'httpx', 'requests', 'feedparser', 'bs4', 'openai', 'anthropic', 'google.generativeai']
+
+_IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def run_mode(args: list, workdir: str) -> tuple:
+    """Run main.py once; return (wall seconds, importtime stderr lines, whether it succeeded)"""
+    env = {**os.environ, 'DATABASE_PATH': os.path.join(workdir, 'bench.db'), 'PYTHONDONTWRITEBYTECODE': '1'}
+    command = [sys.executable, '-X', 'importtime', str(ROOT / 'main.py'), *args]
+    started = time.perf_counter()
+    process = subprocess.Popen(command, cwd=workdir, env=env, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, text=True)
+    lines = []
+    ready = False
+    for line in process.stderr:
+        lines.append(line)
+        if READY_MARKER in line:
+            ready = True
+            process.terminate()
+            break
+    elapsed = time.perf_counter() - started
+    process.wait()
+    return elapsed, lines, ready or process.returncode == 0
+
+
+def import_stats(lines: list) -> tuple:
+    """Total top-level import time (s), modules imported, heavy modules among them"""
+    total_us = 0
+    modules = set()
+    for line in lines:
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        modules.add(match.group(4))
+        if len(match.group(3)) == 1:
+            total_us += int(match.group(2))
+    heavy = [name for name in HEAVY_MODULES if name in modules]
+    return total_us / 1e6, len(modules), heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI cold start per mode")
+    parser.add_argument('--modes', default=','.join(MODES), help="Comma-separated modes to run")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per mode (the fastest is reported)")
+    parser.add_argument('--budget', type=float, default=3.0, help="Max wall seconds per mode")
+    args = parser.parse_args()
+
+    print(f"{'mode':<17} {'wall s':>7} {'import s':>9} {'modules':>8}  heavy modules imported (or attempted)")
+    over_budget, failed = [], []
+    for mode in args.modes.split(','):
+        best = None
+        for _ in range(args.repeat):
+            # Fresh directory per run: no warm caches, database or logs
+            with tempfile.TemporaryDirectory() as workdir:
+                os.symlink(ROOT / 'config', os.path.join(workdir, 'config'))
+                elapsed, lines, succeeded = run_mode(MODES[mode], workdir)
+            if not succeeded:
+                failed.append(mode)
+                break
+            if best is None or elapsed < best[0]:
+                best = (elapsed, lines)
+        if best is None:
+            print(f"{mode:<17} {'failed':>7}")
+            continue
+        elapsed, lines = best
+        import_seconds, module_count, heavy = import_stats(lines)
+        print(f"{mode:<17} {elapsed:>7.2f} {import_seconds:>9.2f} {module_count:>8}  {', '.join(heavy) or '-'}")
+        if elapsed > args.budget:
+            over_budget.append(mode)
+
+    if failed:
+        print(f"\nFailed to run: {', '.join(failed)}")
+    if over_budget:
+        print(f"\nOver the {args.budget:.1f}s budget: {', '.join(over_budget)}")
+    if failed or over_budget:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Story clustering benchmark
+Streams synthetic articles about many latent stories (plus vocabulary
+shared by all of them) through online clustering, with the inverted index
+and with a full scan of every cluster. Reports the cost per article as the
+number of clusters grows and how well clusters match the stories.
+
+Usage:
+    python scripts/bench_story_clusters.py [--articles 100000] [--stories 20000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers.story_clusters import StoryClusters
+
+COMMON = ['launch', 'company', 'users', 'market', 'billion', 'deal', 'model', 'data', 'team',
+          'plans', 'growth', 'tools', 'cloud', 'chips', 'security', 'startup', 'funding', 'update']
+
+
+def synthetic_stream(count: int, stories: int, seed: int = 11) -> list:
+    """(story, article) pairs; each story has its own entity and words, arrivals skewed"""
+    rng = random.Random(seed)
+
+    def word() -> str:
+        return ''.join(rng.choice('bcdfghklmnprstvz') + rng.choice('aeiou') for _ in range(3))
+
+    vocab = [(f"{word().title()} {word().title()}", [word() for _ in range(8)]) for _ in range(stories)]
+    stream = []
+    for i in range(count):
+        story = min(int(rng.paretovariate(1.2)) - 1, stories - 1) if rng.random() < 0.3 else rng.randrange(stories)
+        entity, words = vocab[story]
+        title = f"{entity} {' '.join(rng.sample(words, 3))} {rng.choice(COMMON)}"
+        summary = ' '.join(rng.sample(words, 4) + rng.sample(COMMON, 6))
+        stream.append((story, {'title': title, 'summary': summary, 'url': f"https://example.com/{i}",
+                               'source': f"Source {rng.randrange(30)}", 'relevance_score': rng.uniform(1, 9)}))
+    return stream
+
+
+class FullScanClusters(StoryClusters):
+    """Compares every article with every cluster (no index)"""
+
+    def _candidates(self, vector):
+        return set(self._clusters)
+
+
+def purity(stream: list, assigned: list) -> tuple:
+    """Share of articles in their cluster's majority story, and in their story's majority cluster"""
+    by_cluster, by_story = {}, {}
+    for (story, _), cluster_id in zip(stream, assigned):
+        by_cluster.setdefault(cluster_id, Counter())[story] += 1
+        by_story.setdefault(story, Counter())[cluster_id] += 1
+    total = len(assigned)
+    return (sum(c.most_common(1)[0][1] for c in by_cluster.values()) / total,
+            sum(c.most_common(1)[0][1] for c in by_story.values()) / total)
+
+
+def run(cls, stream: list, path: str, report_every: int) -> tuple:
+    """Cluster the stream; returns (timings per segment, assigned cluster ids)"""
+    clusters = cls({'analysis': {'clustering': {'enabled': True, 'path': path}}})
+    timings, assigned = [], []
+    started = time.perf_counter()
+    for i, (_, article) in enumerate(stream, 1):
+        assigned.append(clusters.add(article, now=1_700_000_000 + i)['id'])
+        if i % report_every == 0:
+            elapsed = time.perf_counter() - started
+            timings.append((i, len(clusters), elapsed / report_every * 1e6))
+            started = time.perf_counter()
+    return timings, assigned
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark online story clustering")
+    parser.add_argument('--articles', type=int, default=100000, help="Articles streamed")
+    parser.add_argument('--stories', type=int, default=20000, help="Latent stories")
+    parser.add_argument('--full-scan-limit', type=int, default=20000,
+                        help="Articles streamed through the full-scan baseline")
+    args = parser.parse_args()
+
+    stream = synthetic_stream(args.articles, args.stories)
+    report_every = max(1, args.articles // 5)
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'method':<10} {'articles':>9} {'clusters':>9} {'us/article':>11}")
+        indexed, assigned = run(StoryClusters, stream, os.path.join(tmp, 'a.json'), report_every)
+        for done, clusters, us in indexed:
+            print(f"{'index':<10} {done:>9} {clusters:>9} {us:>11.1f}")
+
+        sample = stream[:min(args.full_scan_limit, len(stream))]
+        scan, scan_assigned = run(FullScanClusters, sample, os.path.join(tmp, 'b.json'),
+                                  max(1, len(sample) // 4))
+        for done, clusters, us in scan:
+            print(f"{'full scan':<10} {done:>9} {clusters:>9} {us:>11.1f}")
+
+    homogeneity, completeness = purity(stream, assigned)
+    stories = len({story for story, _ in stream})
+    print(f"\nIndexed: {len(set(assigned))} clusters for {stories} stories, "
+          f"homogeneity {homogeneity:.3f}, completeness {completeness:.3f}")
+    same = sum(a == b for a, b in zip(assigned, scan_assigned))
+    print(f"Full scan agrees on {same}/{len(scan_assigned)} assignments")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Topic selection benchmark
+Compares the original selection (full sort, one pick per category, then
+fill by score) with heap top-k + MMR selection on synthetic scored
+candidates in which a few sources flood the top with near-identical
+stories. Reports latency and how spread out the picks are.
+
+Usage:
+    python scripts/bench_topic_selection.py [--candidates 1000,100000] [--count 5]
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers.topic_analyzer import TopicAnalyzer
+from src.utils.config_loader import load_config
+
+WORDS = ['model', 'agents', 'funding', 'layoffs', 'chips', 'cloud', 'robotics', 'privacy', 'hiring',
+         'remote', 'startup', 'security', 'open', 'source', 'search', 'devices', 'energy', 'health']
+
+
+def synthetic_candidates(count: int, categories: list, seed: int = 13) -> list:
+    """Scored articles; 'Wire' and 'Daily' repost two high-scoring stories with small edits"""
+    rng = random.Random(seed)
+    stories = [' '.join(rng.choice(WORDS) for _ in range(12)) for _ in range(2)]
+    articles = []
+    for i in range(count):
+        if rng.random() < 0.05:
+            source = rng.choice(['Wire', 'Daily'])
+            words = rng.choice(stories).split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            title, summary = ' '.join(words[:6]), ' '.join(words)
+            score = rng.uniform(8.0, 10.0)
+            category = rng.choice(categories)
+        else:
+            source = f"Source {rng.randrange(40)}"
+            title = ' '.join(rng.choice(WORDS) for _ in range(6))
+            summary = ' '.join(rng.choice(WORDS) for _ in range(20))
+            score = rng.uniform(1.0, 9.0)
+            category = rng.choice(categories)
+        articles.append({'title': title, 'summary': summary, 'url': f"https://example.com/{i}",
+                         'source': source, 'category': category, 'relevance_score': score})
+    return articles
+
+
+def original_select(scored_articles: list, count: int) -> list:
+    """The original sort + two-pass selection"""
+    scored_articles = sorted(scored_articles, key=lambda x: x['relevance_score'], reverse=True)
+    selected = []
+    categories_used = set()
+    for article in scored_articles:
+        category = article.get('category', 'general')
+        if category not in categories_used:
+            selected.append(article)
+            categories_used.add(category)
+            if len(selected) >= count:
+                break
+    if len(selected) < count:
+        for article in scored_articles:
+            if article not in selected:
+                selected.append(article)
+                if len(selected) >= count:
+                    break
+    return selected[:count]
+
+
+def heap_mmr_select(analyzer: TopicAnalyzer, scored_articles: list, count: int) -> list:
+    """Candidate pool per category, then MMR with source caps"""
+    return analyzer._select_diverse_topics(analyzer._candidate_pool(scored_articles, count), count)
+
+
+def spread(picks: list) -> dict:
+    """Distinct sources and categories, mean pairwise word overlap, mean score"""
+    word_sets = [set(f"{a['title']} {a['summary']}".split()) for a in picks]
+    pairs = list(itertools.combinations(word_sets, 2))
+    overlap = sum(len(x & y) / len(x | y) for x, y in pairs) / len(pairs) if pairs else 0.0
+    return {
+        'sources': len({a['source'] for a in picks}),
+        'categories': len({a['category'] for a in picks}),
+        'overlap': overlap,
+        'score': sum(a['relevance_score'] for a in picks) / len(picks),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark trending topic selection")
+    parser.add_argument('--candidates', default='1000,100000', help="Comma-separated candidate counts")
+    parser.add_argument('--count', type=int, default=5, help="Topics to select")
+    args = parser.parse_args()
+
+    config = load_config()
+    analyzer = TopicAnalyzer(config)
+    categories = list(config.get('topic_categories', {})) or ['general']
+
+    print(f"{'candidates':>10} {'selector':<10} {'ms':>9} {'sources':>8} {'categories':>11} "
+          f"{'word overlap':>13} {'mean score':>11}")
+    for candidate_count in (int(n) for n in args.candidates.split(',')):
+        articles = synthetic_candidates(candidate_count, categories)
+        for name, select in (('original', original_select),
+                             ('heap+mmr', lambda a, k: heap_mmr_select(analyzer, a, k))):
+            started = time.perf_counter()
+            picks = select(articles, args.count)
+            elapsed = (time.perf_counter() - started) * 1000
+            stats = spread(picks)
+            print(f"{candidate_count:>10} {name:<10} {elapsed:>9.1f} {stats['sources']:>8} "
+                  f"{stats['categories']:>11} {stats['overlap']:>13.2f} {stats['score']:>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Record/replay fixture server for the scrapers
+Serves recorded (or synthesized) feeds and pages locally with configurable
+latency, error rate and response sizes, so scraping can be exercised and
+benchmarked without hitting live sites.
+
+Usage:
+    python scripts/fixture_server.py record URL [URL ...] [--fixtures DIR]
+    python scripts/fixture_server.py serve [--port 8765] [--latency 50] [--error-rate 0.05]
+
+Routes:
+    /feeds/<n>.xml     recorded feed n (cycled), or a synthesized RSS feed
+    /pages/<n>.html    recorded page n (cycled), or a synthesized article list
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_FIXTURES = 'data/fixtures'
+
+WORDS = ('ai', 'automation', 'remote', 'work', 'startup', 'funding', 'model', 'agents',
+         'hiring', 'skills', 'productivity', 'cloud', 'launch', 'future', 'data', 'team')
+
+
+class FixtureStore:
+    """Recorded responses on disk: <dir>/feeds/*.xml, <dir>/pages/*.html and index.json"""
+
+    def __init__(self, path: str = DEFAULT_FIXTURES):
+        self.path = Path(path)
+        self.feeds = self._load('feeds')
+        self.pages = self._load('pages')
+
+    def _load(self, kind: str) -> List[bytes]:
+        folder = self.path / kind
+        if not folder.is_dir():
+            return []
+        return [file.read_bytes() for file in sorted(folder.iterdir()) if file.is_file()]
+
+    def record(self, urls: List[str]) -> None:
+        """Fetch live URLs through the shared transport and store them as fixtures"""
+        from src.scrapers.http_session import get_transport
+
+        index_path = self.path / 'index.json'
+        index = json.loads(index_path.read_text()) if index_path.exists() else {}
+        transport = get_transport()
+
+        for url in urls:
+            response = transport.get(url)
+            response.raise_for_status()
+            content = response.content
+            head = content[:1024].lower()
+            kind, ext = ('feeds', 'xml') if (b'<rss' in head or b'<feed' in head) else ('pages', 'html')
+
+            folder = self.path / kind
+            folder.mkdir(parents=True, exist_ok=True)
+            name = f"{len(list(folder.iterdir())):04d}.{ext}"
+            (folder / name).write_bytes(content)
+            index[f"{kind}/{name}"] = url
+            print(f"  recorded {url} -> {kind}/{name} ({len(content)} bytes)")
+
+        index_path.write_text(json.dumps(index, indent=2))
+
+
+def synth_feed(n: int, base_url: str, entries: int, summary_bytes: int) -> bytes:
+    """Build a deterministic RSS feed for source n"""
+    rng = random.Random(n)
+    items = []
+    for i in range(entries):
+        title = ' '.join(rng.choice(WORDS) for _ in range(8)).capitalize()
+        body = ' '.join(rng.choice(WORDS) for _ in range(max(1, summary_bytes // 8)))[:summary_bytes]
+        items.append(
+            f"<item><title>{title}</title>"
+            f"<link>{base_url}/pages/{n}-{i}.html</link>"
+            f"<guid>fixture-{n}-{i}</guid>"
+            f"<pubDate>Mon, 06 Jan 2025 12:{i % 60:02d}:00 GMT</pubDate>"
+            f"<description>&lt;p&gt;{body}&lt;/p&gt;</description></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Fixture feed {n}</title><link>{base_url}/</link>"
+        + ''.join(items) + '</channel></rss>'
+    ).encode('utf-8')
+
+
+def synth_page(n: int, base_url: str, entries: int, page_bytes: int) -> bytes:
+    """Build a deterministic article-list page (TechCrunch-style markup) for source n"""
+    rng = random.Random(n)
+    blocks = []
+    for i in range(entries):
+        title = ' '.join(rng.choice(WORDS) for _ in range(8)).capitalize()
+        blocks.append(
+            f'<article class="post-block"><h2 class="post-block__title">'
+            f'<a href="{base_url}/pages/{n}-{i}.html">{title}</a></h2>'
+            f'<div class="post-block__content">{" ".join(rng.choice(WORDS) for _ in range(30))}</div>'
+            f'</article>'
+        )
+    html = f"<html><head><title>Fixture page {n}</title></head><body>{''.join(blocks)}"
+    padding = max(0, page_bytes - len(html))
+    html += f"<p>{'lorem ' * (padding // 6)}</p></body></html>"
+    return html.encode('utf-8')
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    request_queue_size = 1024  # hundreds of sources may connect at once
+    daemon_threads = True
+
+
+class FixtureServer:
+    """Threaded local HTTP server replaying fixtures with injected latency and errors"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, store: Optional[FixtureStore] = None,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503, entries: int = 20, summary_bytes: int = 400,
+                 page_bytes: int = 50_000, seed: int = 42):
+        """Latency and jitter are in seconds"""
+        self.store = store or FixtureStore()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.entries = entries
+        self.summary_bytes = summary_bytes
+        self.page_bytes = page_bytes
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._cache: Dict[str, Tuple[bytes, str]] = {}
+        self.requests = 0
+        self.errors = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, so client pools are exercised
+
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = _HTTPServer((host, port), Handler)
+        self.base_url = f"http://{host}:{self.httpd.server_address[1]}"
+        self._thread: Optional[threading.Thread] = None
+
+    def _draw(self) -> Tuple[float, bool]:
+        """Pick this request's delay and whether it fails"""
+        with self._rng_lock:
+            self.requests += 1
+            delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+            failed = self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        return max(0.0, delay), failed
+
+    def _body(self, path: str) -> Optional[Tuple[bytes, str]]:
+        """Resolve a path to (body, content type)"""
+        if path in self._cache:
+            return self._cache[path]
+
+        kind, _, name = path.strip('/').partition('/')
+        stem = name.rsplit('.', 1)[0]
+        try:
+            n = int(stem.split('-')[0])
+        except ValueError:
+            return None
+
+        if kind == 'feeds':
+            body = (self.store.feeds[n % len(self.store.feeds)] if self.store.feeds
+                    else synth_feed(n, self.base_url, self.entries, self.summary_bytes))
+            result = (body, 'application/rss+xml; charset=utf-8')
+        elif kind == 'pages':
+            body = (self.store.pages[n % len(self.store.pages)] if self.store.pages
+                    else synth_page(n, self.base_url, self.entries, self.page_bytes))
+            result = (body, 'text/html; charset=utf-8')
+        else:
+            return None
+
+        self._cache[path] = result
+        return result
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        """Serve one request"""
+        delay, failed = self._draw()
+        if delay:
+            time.sleep(delay)
+
+        resolved = None if failed else self._body(request.path.split('?', 1)[0])
+        if failed or resolved is None:
+            status = self.error_status if failed else 404
+            request.send_response(status)
+            request.send_header('Content-Length', '0')
+            request.end_headers()
+            return
+
+        body, content_type = resolved
+        request.send_response(200)
+        request.send_header('Content-Type', content_type)
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def start(self) -> 'FixtureServer':
+        """Serve on a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='fixture-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> 'FixtureServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """Arguments shared by this script and the benchmarks"""
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help="Directory of recorded fixtures")
+    parser.add_argument('--latency', type=float, default=50, help="Response latency in ms")
+    parser.add_argument('--jitter', type=float, default=20, help="+/- latency jitter in ms")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument('--error-status', type=int, default=503, help="Status code for injected failures")
+    parser.add_argument('--entries', type=int, default=20, help="Entries per synthesized feed/page")
+    parser.add_argument('--summary-bytes', type=int, default=400, help="Summary size per synthesized entry")
+    parser.add_argument('--page-bytes', type=int, default=50_000, help="Size of synthesized pages")
+
+
+def server_from_args(args, port: int = 0) -> FixtureServer:
+    """Build a server from parsed arguments"""
+    return FixtureServer(
+        port=port,
+        store=FixtureStore(args.fixtures),
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        entries=args.entries,
+        summary_bytes=args.summary_bytes,
+        page_bytes=args.page_bytes,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record/replay fixture server for scrapers")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record = commands.add_parser('record', help="Record live feeds/pages as fixtures")
+    record.add_argument('urls', nargs='+')
+    record.add_argument('--fixtures', default=DEFAULT_FIXTURES)
+
+    serve = commands.add_parser('serve', help="Replay fixtures over HTTP")
+    serve.add_argument('--port', type=int, default=8765)
+    add_server_arguments(serve)
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        FixtureStore(args.fixtures).record(args.urls)
+        return
+
+    server = server_from_args(args, port=args.port)
+    print(f"Serving {len(server.store.feeds)} recorded feeds / {len(server.store.pages)} recorded pages "
+          f"(synthesized otherwise) at {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"{server.requests} requests, {server.errors} injected errors")
+
+
+if __name__ == '__main__':
+    main()
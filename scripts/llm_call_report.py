@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+LLM call report
+Summarizes the provider calls stored in the `llm_calls` table by provider
+and model: time to first token and total latency (p50/p95), input and
+output tokens, output tokens per second, retries, posts cut off at the
+word limit, and failures. Use it to compare providers and models on real
+latency and token cost.
+
+Usage:
+    python scripts/llm_call_report.py [--days 7] [--kind post|batch]
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.db_manager import DatabaseManager
+from src.generators.call_metrics import summarize_calls
+
+
+def seconds(value) -> str:
+    """Format seconds, or '-' when there is no value"""
+    return f"{value:.2f}" if value is not None else '-'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report LLM call latency and tokens per provider and model")
+    parser.add_argument('--days', type=float, default=7, help="Report calls made in the last N days")
+    parser.add_argument('--kind', choices=['post', 'batch'], help="Only single-post or batched calls")
+    args = parser.parse_args()
+
+    load_dotenv()
+    db = DatabaseManager()
+    since = (datetime.now() - timedelta(days=args.days)).isoformat()
+    calls = [call for call in db.get_llm_calls(since) if not args.kind or call['kind'] == args.kind]
+    db.close()
+    if not calls:
+        print(f"No LLM calls recorded in the last {args.days:g} days")
+        return
+
+    print(f"{'provider/model':<36} {'calls':>6} {'ttft p50':>9} {'ttft p95':>9} {'lat p50':>8} {'lat p95':>8} "
+          f"{'in tok':>8} {'out tok':>8} {'tok/s':>6} {'retries':>8} {'cut':>5} {'failed':>7}")
+    for stats in summarize_calls(calls):
+        name = f"{stats['provider']}/{stats['model']}"
+        rate = f"{stats['tokens_per_second']:.0f}" if stats['tokens_per_second'] else '-'
+        print(f"{name:<36} {stats['calls']:>6} {seconds(stats['ttft_p50']):>9} {seconds(stats['ttft_p95']):>9} "
+              f"{seconds(stats['latency_p50']):>8} {seconds(stats['latency_p95']):>8} "
+              f"{stats['input_tokens']:>8} {stats['output_tokens']:>8} {rate:>6} "
+              f"{stats['retries']:>8} {stats['cut_off']:>5} {stats['errors']:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+"""
+Batch scorer - vectorized relevance scoring for large article sets
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.analyzers.keyword_matcher import KeywordMatcher
+
+_HASH_BASE = np.uint64(1000003)
+_HASH_INVERSE = np.uint64(pow(1000003, -1, 2 ** 64))
+# Vocabulary pre-filter: one bit per value of the top bits of a token hash
+_FILTER_BITS = 20
+_WORD_TABLE: Optional[np.ndarray] = None
+
+
+def _word_table() -> np.ndarray:
+    """Code point -> matches `\\w` (str.isalnum() or '_'), built on first use"""
+    global _WORD_TABLE
+    if _WORD_TABLE is None:
+        table = np.fromiter((chr(point).isalnum() for point in range(0x110000)), dtype=bool, count=0x110000)
+        table[ord('_')] = True
+        _WORD_TABLE = table
+    return _WORD_TABLE
+
+
+def _powers(base: np.uint64, count: int) -> np.ndarray:
+    """base**0 .. base**(count - 1), wrapping mod 2**64"""
+    powers = np.full(max(count, 1), base, dtype=np.uint64)
+    powers[0] = 1
+    return np.cumprod(powers, dtype=np.uint64)
+
+
+def _token_hash(token: str) -> int:
+    """The polynomial hash `_token_ids` computes for a token"""
+    value = 0
+    for position, char in enumerate(token):
+        value += ord(char) * pow(int(_HASH_BASE), position, 2 ** 64)
+    return value % 2 ** 64
+
+
+class BatchScorer:
+    """Scores many articles at once with a sparse document-keyword matrix
+
+    Produces the same scores and categories as TopicAnalyzer's per-article
+    scoring. With `tfidf=True`, each keyword hit is weighted by
+    (1 + log tf) * idf over the scored corpus instead of counting once.
+    """
+
+    def __init__(self, topic_categories: Dict, chunk_size: int = 20000):
+        """Build the keyword vocabulary and keyword -> category weights"""
+        self.matcher = KeywordMatcher(topic_categories)
+        self.categories = self.matcher.categories
+        self.weights = np.array(
+            [(data or {}).get('weight', 1.0) for data in topic_categories.values()], dtype=np.float64
+        )
+        self.chunk_size = chunk_size
+
+        # Keyword ids: token phrases first, then punctuated keywords matched by regex
+        phrases = list(self.matcher._phrases)
+        self.keyword_count = len(phrases) + len(self.matcher._irregular)
+
+        # Keyword tokens (plural spellings included) -> ids starting at 1; 0 marks tokens no keyword uses
+        spellings = phrases + list(self.matcher._variants)
+        self.vocabulary: Dict[str, int] = {
+            token: token_id
+            for token_id, token in enumerate(sorted({t for phrase in spellings for t in phrase}), start=1)
+        }
+        self._base = len(self.vocabulary) + 1
+
+        # Vocabulary as sorted token hashes, behind a bitmap that rejects most other tokens
+        entries = sorted((_token_hash(token), len(token), token_id) for token, token_id in self.vocabulary.items())
+        self._token_hashes = np.array([entry[0] for entry in entries] or [0], dtype=np.uint64)
+        self._token_lengths = np.array([entry[1] for entry in entries] or [-1], dtype=np.int64)
+        self._token_values = np.array([entry[2] for entry in entries] or [0], dtype=np.int64)
+        self._token_filter = np.zeros(1 << _FILTER_BITS, dtype=bool)
+        self._token_filter[self._token_hashes[:len(entries)] >> np.uint64(64 - _FILTER_BITS)] = True
+        self._power_cache = (_powers(_HASH_BASE, 0), _powers(_HASH_INVERSE, 0))
+
+        # Keyword x category multiplicities (a keyword may be listed under several categories)
+        self.keyword_categories = np.zeros((self.keyword_count, len(self.categories)), dtype=np.float64)
+        for keyword_id, phrase in enumerate(phrases):
+            for category_index in self.matcher._phrases[phrase]:
+                self.keyword_categories[keyword_id, category_index] += 1
+        for offset, (_, category_index) in enumerate(self.matcher._irregular):
+            self.keyword_categories[len(phrases) + offset, category_index] += 1
+
+        # Phrases grouped by token count, as sorted id-sequence hashes; a plural maps to its keyword
+        keyword_ids = {phrase: keyword_id for keyword_id, phrase in enumerate(phrases)}
+        keyword_ids.update(
+            (plural, keyword_ids[phrase]) for plural, phrase in self.matcher._variants.items()
+        )
+        self._by_length: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        grouped: Dict[int, List[Tuple[int, int]]] = {}
+        for phrase, keyword_id in keyword_ids.items():
+            ids = [self.vocabulary[token] for token in phrase]
+            grouped.setdefault(len(phrase), []).append((self._hash_ids(ids), keyword_id))
+        for length, group in grouped.items():
+            group.sort()
+            self._by_length[length] = (
+                np.array([h for h, _ in group], dtype=np.int64),
+                np.array([k for _, k in group], dtype=np.int64),
+            )
+
+        if self._base ** max(self._by_length, default=1) >= 2 ** 63:
+            raise ValueError("Keyword vocabulary too large for n-gram hashing")
+
+    def _hash_ids(self, ids) -> int:
+        """Hash a keyword's token ids as digits in base len(vocabulary) + 1"""
+        value = 0
+        for token_id in ids:
+            value = value * self._base + token_id
+        return value
+
+    def _powers(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Hash base powers and inverse powers for `count` code points, cached across chunks"""
+        if len(self._power_cache[0]) < count:
+            size = int(count * 1.25)
+            self._power_cache = (_powers(_HASH_BASE, size), _powers(_HASH_INVERSE, size))
+        powers, inverse = self._power_cache
+        return powers[:count], inverse[:count]
+
+    def _token_ids(self, joined: str, text_starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vocabulary ids, token positions and documents of the keyword tokens in a chunk
+
+        Tokenizes the whole chunk as one code point array instead of running
+        the regex per text: `\\w` runs are found from a lookup table and each
+        run is hashed with a prefix-sum polynomial hash (mod 2**64).
+        """
+        points = np.frombuffer(joined.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        padded = np.zeros(len(points) + 2, dtype=np.int8)
+        padded[1:-1] = _word_table()[points]
+        edges = np.diff(padded)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        powers, inverse = self._powers(len(points))
+        prefix = np.zeros(len(points) + 1, dtype=np.uint64)
+        np.cumsum(points * powers, dtype=np.uint64, out=prefix[1:])
+        hashes = (prefix[ends] - prefix[starts]) * inverse[starts]
+
+        candidates = np.flatnonzero(self._token_filter[hashes >> np.uint64(64 - _FILTER_BITS)])
+        hashes = hashes[candidates]
+        found = np.minimum(np.searchsorted(self._token_hashes, hashes), len(self._token_hashes) - 1)
+        hit = (self._token_hashes[found] == hashes) & (
+            self._token_lengths[found] == ends[candidates] - starts[candidates]
+        )
+        positions = candidates[hit]
+        docs = np.searchsorted(text_starts, starts[positions], side='right') - 1
+        return self._token_values[found[hit]], positions, docs
+
+    def _match_chunk(self, texts: Sequence[str], offset: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (doc, keyword) ids of every keyword occurrence in a chunk"""
+        # Texts are joined with '\n', a non-word character, so no match spans two texts
+        joined = '\n'.join(texts)
+        text_starts = np.zeros(len(texts), dtype=np.int64)
+        text_starts[1:] = np.cumsum([len(text) + 1 for text in texts[:-1]])
+        ids, positions, docs = self._token_ids(joined, text_starts)
+
+        doc_parts, keyword_parts = [], []
+        for length, (hashes, keyword_ids) in self._by_length.items():
+            span = len(ids) - length + 1
+            if span <= 0:
+                continue
+            # Consecutive keyword tokens: adjacent positions in the same text
+            valid = (positions[length - 1:] - positions[:span] == length - 1) & (docs[length - 1:] == docs[:span])
+            value = np.zeros(span, dtype=np.int64)
+            for j in range(length):
+                value = value * self._base + ids[j:j + span]
+
+            starts = np.flatnonzero(valid)
+            found = np.minimum(np.searchsorted(hashes, value[starts]), len(hashes) - 1)
+            hit = hashes[found] == value[starts]
+            doc_parts.append(docs[starts[hit]])
+            keyword_parts.append(keyword_ids[found[hit]])
+
+        # Keywords with punctuation ("C++") are rare; one regex pass over the chunk each
+        irregular_id = len(self.matcher._phrases)
+        for pattern, _ in self.matcher._irregular:
+            match_starts = [match.start() for match in pattern.finditer(joined)]
+            doc_parts.append(np.searchsorted(text_starts, match_starts, side='right') - 1)
+            keyword_parts.append(np.full(len(match_starts), irregular_id, dtype=np.int64))
+            irregular_id += 1
+
+        if not doc_parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(doc_parts) + offset, np.concatenate(keyword_parts)
+
+    def category_matrix(self, texts: Iterable[str], tfidf: bool = False) -> np.ndarray:
+        """Documents x categories matrix of keyword evidence (counts, or TF-IDF mass)"""
+        texts = [text.lower() for text in texts]
+        count = len(texts)
+
+        doc_parts, keyword_parts = [], []
+        for start in range(0, count, self.chunk_size):
+            docs, keywords = self._match_chunk(texts[start:start + self.chunk_size], start)
+            doc_parts.append(docs)
+            keyword_parts.append(keywords)
+
+        matrix = np.zeros((count, len(self.categories)), dtype=np.float64)
+        if not doc_parts or not self.keyword_count:
+            return matrix
+
+        # Sparse (doc, keyword) entries with term frequencies, sorted by doc
+        docs = np.concatenate(doc_parts).astype(np.int64)
+        keywords = np.concatenate(keyword_parts)
+        pairs, term_counts = np.unique(docs * self.keyword_count + keywords, return_counts=True)
+        if not len(pairs):
+            return matrix
+        pair_docs, pair_keywords = np.divmod(pairs, self.keyword_count)
+
+        if tfidf:
+            doc_freq = np.bincount(pair_keywords, minlength=self.keyword_count)
+            idf = np.log((1 + count) / (1 + doc_freq)) + 1
+            values = (1 + np.log(term_counts)) * idf[pair_keywords]
+        else:
+            # Each keyword counts once per article, as in per-article scoring
+            values = np.ones(len(pairs), dtype=np.float64)
+
+        # (doc x keyword) @ (keyword x category), summed over each document's run of entries
+        contributions = self.keyword_categories[pair_keywords] * values[:, None]
+        starts = np.flatnonzero(np.r_[True, pair_docs[1:] != pair_docs[:-1]])
+        matrix[pair_docs[starts]] = np.add.reduceat(contributions, starts, axis=0)
+        return matrix
+
+    def score_texts(self, texts: Iterable[str], tfidf: bool = False) -> Tuple[np.ndarray, List[Optional[str]]]:
+        """Scores and categories (None when nothing matched) for raw "title summary" texts"""
+        matrix = self.category_matrix(texts, tfidf=tfidf)
+        # Accumulate in category order so scores are bit-identical to per-article scoring
+        scores = np.ones(len(matrix), dtype=np.float64)
+        for index, weight in enumerate(self.weights):
+            scores += matrix[:, index] * weight
+        if not matrix.shape[1]:
+            return scores, [None] * len(scores)
+
+        # Per-article scoring keeps the last matching category in config order
+        matched = matrix > 0
+        last = matrix.shape[1] - 1 - np.argmax(matched[:, ::-1], axis=1)
+        categories = [
+            self.categories[index] if any_match else None
+            for index, any_match in zip(last.tolist(), matched.any(axis=1).tolist())
+        ]
+        return scores, categories
+
+    def score_articles(self, articles: Sequence[Dict], tfidf: bool = False) -> Tuple[np.ndarray, List[Optional[str]]]:
+        """Scores and categories for article dicts"""
+        texts = [f"{article.get('title') or ''} {article.get('summary') or ''}" for article in articles]
+        return self.score_texts(texts, tfidf=tfidf)
@@ -0,0 +1,89 @@
+"""
+Keyword matcher - counts topic keyword matches for every category in one pass
+"""
+from typing import Dict, List, Tuple
+import re
+
+_TOKEN = re.compile(r'\w+')
+# Keywords made only of word characters, spaces and hyphens match as token sequences
+_REGULAR_KEYWORD = re.compile(r'^[\w\s-]+$')
+
+
+class KeywordMatcher:
+    """Whole-word, case-insensitive keyword matching compiled from `topic_categories`
+
+    Keywords become token tuples ("AI tool" -> ("ai", "tool")). Matching walks
+    the article's tokens once and only looks up n-grams at tokens that start
+    some keyword, so cost grows with text length, not with keyword count.
+    A plural "s" on the last word counts as the same keyword ("AI tools",
+    "LLMs", "startups").
+    """
+
+    def __init__(self, topic_categories: Dict):
+        """Compile keywords for every category"""
+        self.categories: List[str] = list(topic_categories)
+
+        # keyword tokens -> category indexes (one entry per listing, as before)
+        self._phrases: Dict[Tuple[str, ...], List[int]] = {}
+        # first token -> n-gram lengths of keywords starting with it
+        self._lengths: Dict[str, Tuple[int, ...]] = {}
+        # Plural spelling -> keyword tokens ("ai", "tools") -> ("ai", "tool")
+        self._variants: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        # Keywords with other punctuation ("C++") fall back to a boundary regex
+        self._irregular: List[Tuple[re.Pattern, int]] = []
+
+        lengths: Dict[str, set] = {}
+        for index, category_data in enumerate(topic_categories.values()):
+            for keyword in (category_data or {}).get('keywords', []):
+                keyword = keyword.lower().strip()
+                if not keyword:
+                    continue
+                if not _REGULAR_KEYWORD.match(keyword):
+                    plural = 's?' if keyword[-1].isalnum() else ''
+                    pattern = re.compile(r'(?<!\w)' + re.escape(keyword) + plural + r'(?!\w)')
+                    self._irregular.append((pattern, index))
+                    continue
+                tokens = tuple(_TOKEN.findall(keyword))
+                self._phrases.setdefault(tokens, []).append(index)
+                lengths.setdefault(tokens[0], set()).add(len(tokens))
+
+        # A keyword listed in both forms keeps both; otherwise the plural aliases the singular
+        for tokens in list(self._phrases):
+            if tokens[-1].endswith('s'):
+                continue
+            plural = tokens[:-1] + (tokens[-1] + 's',)
+            if plural not in self._phrases:
+                self._variants[plural] = tokens
+                lengths.setdefault(plural[0], set()).add(len(plural))
+
+        self._lengths = {token: tuple(sorted(sizes)) for token, sizes in lengths.items()}
+
+    def match_counts(self, text: str) -> List[int]:
+        """Number of distinct keywords matched per category, in category order"""
+        text = text.lower()
+        tokens = _TOKEN.findall(text)
+        counts = [0] * len(self.categories)
+
+        matched = set()
+        lengths = self._lengths
+        for position, token in enumerate(tokens):
+            sizes = lengths.get(token)
+            if sizes is None:
+                continue
+            for size in sizes:
+                phrase = tuple(tokens[position:position + size])
+                phrase = self._variants.get(phrase, phrase)
+                if phrase not in matched and phrase in self._phrases:
+                    matched.add(phrase)
+                    for index in self._phrases[phrase]:
+                        counts[index] += 1
+
+        for pattern, index in self._irregular:
+            if pattern.search(text):
+                counts[index] += 1
+
+        return counts
+
+    def article_counts(self, article: Dict) -> List[int]:
+        """Match counts over an article's title and summary"""
+        return self.match_counts(f"{article.get('title') or ''} {article.get('summary') or ''}")
@@ -0,0 +1,326 @@
+"""
+Story clusters - online clustering of the article stream into stories
+"""
+from typing import Dict, Iterable, List, Optional, Set
+from pathlib import Path
+import heapq
+import json
+import math
+import threading
+import time
+import zlib
+
+from loguru import logger
+
+from src.analyzers.trend_tracker import extract_terms
+from src.utils.shared_state import save_json_atomic
+
+DEFAULT_CLUSTERING_CONFIG = {
+    'enabled': False,
+    'threshold': 0.35,          # Cosine similarity to a centroid that joins its cluster
+    'dimensions': 2 ** 18,      # Size of the hashed feature space
+    'centroid_terms': 64,       # Strongest features kept per centroid
+    'index_terms': 16,          # Strongest centroid features a cluster is indexed under
+    'common_share': 0.05,       # Features indexing more than this share of clusters aren't scanned
+    'velocity_hours': 6,        # Decay time constant of the arrival rate
+    'active_hours': 24,         # A cluster needs an article this recent to be a topic
+    'max_age_hours': 72,        # Clusters idle this long are forgotten
+    'max_urls': 200,            # Member URLs remembered per cluster (and recognized when re-read)
+    'size_weight': 1.0,         # Score added per ln(cluster size)
+    'velocity_weight': 1.0,     # Score added per article/hour of recent arrivals
+    'source_weight': 0.5,       # Score added per additional source
+    'path': 'data/cache/story_clusters.json',
+}
+
+# Named entities say more about which story an article belongs to than single words
+_ENTITY_WEIGHT = 2.0
+# Index lists are always scanned up to this length
+_MIN_SCAN = 100
+# Article fields kept as a cluster's representative
+_TOPIC_FIELDS = ('title', 'url', 'summary', 'source', 'published', 'category', 'relevance_score')
+
+
+class StoryClusters:
+    """Single-pass clustering of articles by cosine similarity of hashed TF-IDF vectors
+
+    An article joins the most similar cluster above `threshold` or starts a
+    new one. Centroids are running means truncated to their strongest
+    features. An inverted index from each cluster's strongest features
+    limits the comparison to clusters sharing one with the article, so adding
+    an article doesn't scan every cluster. State is persisted between runs.
+    """
+
+    def __init__(self, config: Dict):
+        """Initialize clusters and load persisted state"""
+        self.config = {**DEFAULT_CLUSTERING_CONFIG, **config.get('analysis', {}).get('clustering', {})}
+        self.enabled = self.config['enabled']
+        self.path = Path(self.config['path'])
+        self._lock = threading.Lock()
+        self._clusters: Dict[int, Dict] = {}
+        self._postings: Dict[int, Set[int]] = {}
+        self._urls: Dict[str, int] = {}
+        # Online document frequencies of hashed features, for IDF weighting
+        self._doc_freq: Dict[int, int] = {}
+        self._documents = 0
+        self._next_id = 1
+        self._dirty = False
+
+        if self.enabled:
+            self._load()
+
+    def hashed_terms(self, article: Dict) -> Dict[int, float]:
+        """Hashed term weights of an article's title and summary"""
+        dimensions = self.config['dimensions']
+        terms: Dict[int, float] = {}
+        for term, kind in extract_terms(article).items():
+            # crc32 is stable across processes, unlike hash()
+            index = zlib.crc32(term.encode('utf-8')) % dimensions
+            terms[index] = terms.get(index, 0.0) + (_ENTITY_WEIGHT if kind == 'entity' else 1.0)
+        return terms
+
+    def features(self, terms: Dict[int, float]) -> Dict[int, float]:
+        """L2-normalized TF-IDF vector, with IDF from the articles clustered so far"""
+        documents = self._documents + 1
+        vector = {
+            index: weight * math.log((1 + documents) / (1 + self._doc_freq.get(index, 0)))
+            for index, weight in terms.items()
+        }
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {index: weight / norm for index, weight in vector.items()} if norm else {}
+
+    @staticmethod
+    def _similarity(vector: Dict[int, float], cluster: Dict) -> float:
+        """Cosine similarity of a unit vector and a cluster centroid"""
+        centroid = cluster['centroid']
+        dot = sum(weight * centroid.get(index, 0.0) for index, weight in vector.items())
+        return dot / cluster['norm'] if cluster['norm'] else 0.0
+
+    def _candidates(self, vector: Dict[int, float]) -> Set[int]:
+        """Clusters sharing a feature with the vector, skipping features nearly every cluster has"""
+        # Short index lists are always scanned, so small cluster sets are compared in full
+        limit = max(_MIN_SCAN, self.config['common_share'] * len(self._clusters))
+        candidates: Set[int] = set()
+        for index in vector:
+            posting = self._postings.get(index)
+            if posting and len(posting) <= limit:
+                candidates.update(posting)
+        return candidates
+
+    def add(self, article: Dict, now: Optional[float] = None) -> Optional[Dict]:
+        """Assign a scored article to a cluster; return the cluster (None if it has no terms)"""
+        if not self.enabled:
+            return None
+        now = now if now is not None else time.time()
+        url = article.get('url')
+
+        with self._lock:
+            # Articles seen before (e.g. re-read from the database) aren't counted twice
+            if url and url in self._urls:
+                return self._clusters.get(self._urls[url])
+
+            terms = self.hashed_terms(article)
+            vector = self.features(terms)
+            self._documents += 1
+            for index in terms:
+                self._doc_freq[index] = self._doc_freq.get(index, 0) + 1
+            if not vector:
+                return None
+
+            best: Optional[int] = None
+            best_similarity = self.config['threshold']
+            for cluster_id in self._candidates(vector):
+                similarity = self._similarity(vector, self._clusters[cluster_id])
+                # Ties go to the older cluster
+                if similarity > best_similarity or (similarity == best_similarity
+                                                    and (best is None or cluster_id < best)):
+                    best, best_similarity = cluster_id, similarity
+
+            if best is None:
+                cluster = self._new_cluster(now)
+            else:
+                cluster = self._clusters[best]
+            self._update(cluster, vector, article, now)
+
+            # Only URLs kept in the cluster are indexed, so the index survives a reload
+            # and eviction removes every entry it holds
+            if url and len(cluster['urls']) < self.config['max_urls']:
+                cluster['urls'].append(url)
+                self._urls[url] = cluster['id']
+            self._dirty = True
+            return cluster
+
+    def _new_cluster(self, now: float) -> Dict:
+        """Create an empty cluster"""
+        cluster = {
+            'id': self._next_id, 'centroid': {}, 'norm': 0.0, 'size': 0,
+            'first_seen': now, 'last_seen': now, 'momentum': 0.0,
+            'sources': {}, 'best': None, 'urls': [], 'posted': False,
+        }
+        self._clusters[cluster['id']] = cluster
+        self._next_id += 1
+        return cluster
+
+    def _update(self, cluster: Dict, vector: Dict[int, float], article: Dict, now: float) -> None:
+        """Fold an article into a cluster's centroid, index entries and statistics"""
+        size = cluster['size']
+        centroid = {index: weight * size for index, weight in cluster['centroid'].items()}
+        for index, weight in vector.items():
+            centroid[index] = centroid.get(index, 0.0) + weight
+        strongest = heapq.nlargest(self.config['centroid_terms'], centroid.items(), key=lambda item: item[1])
+        cluster['centroid'] = {index: weight / (size + 1) for index, weight in strongest}
+        self._reindex(cluster, {index for index, _ in strongest[:self.config['index_terms']]})
+        cluster['norm'] = math.sqrt(sum(weight * weight for weight in cluster['centroid'].values()))
+        cluster['size'] = size + 1
+
+        # Arrival rate: a count decaying with `velocity_hours`
+        last_seen = max(cluster['last_seen'], now)
+        elapsed = last_seen - cluster['last_seen']
+        cluster['momentum'] = cluster['momentum'] * math.exp(-elapsed / self._velocity_seconds) + 1
+        cluster['last_seen'] = last_seen
+
+        source = article.get('source') or ''
+        cluster['sources'][source] = cluster['sources'].get(source, 0) + 1
+        best = cluster['best']
+        if best is None or article.get('relevance_score', 0.0) > best.get('relevance_score', 0.0):
+            cluster['best'] = {field: article.get(field) for field in _TOPIC_FIELDS if field in article}
+
+    def _reindex(self, cluster: Dict, keys: Set[int]) -> None:
+        """Move a cluster's index entries to a new set of features"""
+        old = cluster.get('keys', set())
+        for index in old - keys:
+            posting = self._postings.get(index)
+            if posting is not None:
+                posting.discard(cluster['id'])
+                if not posting:
+                    del self._postings[index]
+        for index in keys - old:
+            self._postings.setdefault(index, set()).add(cluster['id'])
+        cluster['keys'] = keys
+
+    @property
+    def _velocity_seconds(self) -> float:
+        return self.config['velocity_hours'] * 3600
+
+    def velocity(self, cluster: Dict, now: Optional[float] = None) -> float:
+        """Recent arrivals per hour"""
+        now = now if now is not None else time.time()
+        elapsed = max(0.0, now - cluster['last_seen'])
+        return cluster['momentum'] * math.exp(-elapsed / self._velocity_seconds) / self.config['velocity_hours']
+
+    def topics(self, now: Optional[float] = None) -> List[Dict]:
+        """Active, unposted clusters as topic dicts (oldest cluster first)
+
+        A topic is the cluster's best-scored article plus its size, velocity
+        and sources; its relevance score adds ln(size), velocity and source
+        diversity to the article's own score.
+        """
+        if not self.enabled:
+            return []
+        now = now if now is not None else time.time()
+        active_since = now - self.config['active_hours'] * 3600
+
+        topics = []
+        with self._lock:
+            for cluster_id in sorted(self._clusters):
+                cluster = self._clusters[cluster_id]
+                if cluster['posted'] or cluster['last_seen'] < active_since or not cluster['best']:
+                    continue
+                best = cluster['best']
+                velocity = self.velocity(cluster, now)
+                score = (best.get('relevance_score') or 1.0) \
+                    + self.config['size_weight'] * math.log(cluster['size']) \
+                    + self.config['velocity_weight'] * velocity \
+                    + self.config['source_weight'] * (len(cluster['sources']) - 1)
+                topics.append({
+                    **best,
+                    'relevance_score': score,
+                    'cluster_id': cluster_id,
+                    'cluster_size': cluster['size'],
+                    'velocity': round(velocity, 2),
+                    'sources': list(cluster['sources']),
+                    'related_urls': [url for url in cluster['urls'] if url != best.get('url')][:10],
+                })
+        return topics
+
+    def mark_posted(self, cluster_ids: Iterable[int]) -> None:
+        """Keep clusters that have been posted about from becoming topics again"""
+        with self._lock:
+            for cluster_id in cluster_ids:
+                if cluster_id in self._clusters:
+                    self._clusters[cluster_id]['posted'] = True
+                    self._dirty = True
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """Forget clusters idle for longer than `max_age_hours`"""
+        now = now if now is not None else time.time()
+        cutoff = now - self.config['max_age_hours'] * 3600
+        with self._lock:
+            stale = [cluster_id for cluster_id, cluster in self._clusters.items() if cluster['last_seen'] < cutoff]
+            for cluster_id in stale:
+                cluster = self._clusters.pop(cluster_id)
+                self._reindex(cluster, set())
+                for url in cluster['urls']:
+                    if self._urls.get(url) == cluster_id:
+                        del self._urls[url]
+            if stale:
+                self._dirty = True
+        return len(stale)
+
+    def _load(self) -> None:
+        """Load persisted clusters and rebuild the index"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load story clusters {self.path}: {str(e)}")
+            return
+        if state.get('dimensions') != self.config['dimensions']:
+            logger.warning("Story cluster feature space changed; starting with no clusters")
+            return
+
+        self._next_id = state.get('next_id', 1)
+        self._documents = state.get('documents', 0)
+        self._doc_freq = dict(zip(*state.get('doc_freq', [[], []])))
+        for stored in state.get('clusters', []):
+            cluster = {key: value for key, value in stored.items() if key not in ('features', 'weights')}
+            cluster['centroid'] = dict(zip(stored['features'], stored['weights']))
+            cluster['norm'] = math.sqrt(sum(weight * weight for weight in stored['weights']))
+            self._clusters[cluster['id']] = cluster
+            strongest = heapq.nlargest(self.config['index_terms'], cluster['centroid'].items(),
+                                       key=lambda item: item[1])
+            self._reindex(cluster, {index for index, _ in strongest})
+            for url in cluster['urls']:
+                self._urls[url] = cluster['id']
+
+    def save(self, now: Optional[float] = None) -> None:
+        """Evict idle clusters and persist the rest atomically (only if anything changed)"""
+        if not self.enabled:
+            return
+        self.evict(now)
+        with self._lock:
+            if not self._dirty:
+                return
+            state = {
+                'dimensions': self.config['dimensions'],
+                'next_id': self._next_id,
+                'documents': self._documents,
+                'doc_freq': [list(self._doc_freq), list(self._doc_freq.values())],
+                'clusters': [
+                    {
+                        **{key: value for key, value in cluster.items() if key not in ('centroid', 'norm', 'keys')},
+                        'features': list(cluster['centroid']),
+                        'weights': list(cluster['centroid'].values()),
+                    }
+                    for cluster in self._clusters.values()
+                ],
+            }
+            try:
+                save_json_atomic(self.path, state)
+                self._dirty = False
+            except Exception as e:
+                logger.warning(f"Could not save story clusters {self.path}: {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self._clusters)
@@ -0,0 +1,128 @@
+"""
+Story index - near-duplicate detection across sources with MinHash LSH
+"""
+from typing import Dict, List, Optional
+import hashlib
+import re
+
+import numpy as np
+
+# Smallest prime above 2**32; with 32-bit shingle hashes and 31-bit coefficients
+# (a * h + b) stays below 2**64, so permutations vectorize in uint64
+_PRIME = np.uint64(4294967311)
+
+DEFAULT_DEDUP_CONFIG = {
+    'enabled': True,
+    'threshold': 0.5,            # Estimated Jaccard similarity that counts as the same story
+    'num_perm': 64,              # MinHash signature length
+    'bands': 16,                 # LSH bands (num_perm / bands rows each)
+    'shingle_size': 5,           # Character shingles
+    'cross_source_weight': 0.5,  # Score added per extra source covering the story
+}
+
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+def shingles(text: str, size: int = 5) -> set:
+    """Character shingles over normalized text, hashed to 32-bit ints"""
+    normalized = _NON_WORD.sub(' ', text.lower()).strip()
+    if len(normalized) <= size:
+        grams = {normalized} if normalized else set()
+    else:
+        grams = {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+    return {int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=4).digest(), 'big')
+            for gram in grams}
+
+
+class StoryIndex:
+    """Collapses near-duplicate articles into canonical stories as they arrive"""
+
+    def __init__(self, threshold: float = 0.5, num_perm: int = 64, bands: int = 16,
+                 shingle_size: int = 5, seed: int = 1):
+        """Initialize empty index"""
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint64)
+
+        self._buckets: Dict[tuple, List[int]] = {}
+        self._stories: List[Dict] = []
+        self._signatures: List[np.ndarray] = []
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'StoryIndex':
+        """Build an index from the `analysis.dedup` config section"""
+        dedup_config = {**DEFAULT_DEDUP_CONFIG, **config.get('analysis', {}).get('dedup', {})}
+        return cls(
+            threshold=dedup_config['threshold'],
+            num_perm=dedup_config['num_perm'],
+            bands=dedup_config['bands'],
+            shingle_size=dedup_config['shingle_size'],
+        )
+
+    def signature(self, article: Dict) -> Optional[np.ndarray]:
+        """MinHash signature over title and summary shingles"""
+        text = f"{article.get('title', '')} {article.get('summary', '')}"
+        hashes = shingles(text, self.shingle_size)
+        if not hashes:
+            return None
+        values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        return ((values[:, None] * self._a + self._b) % _PRIME).min(axis=0)
+
+    def _similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return np.count_nonzero(first == second) / self.num_perm
+
+    def add(self, article: Dict) -> Dict:
+        """Index an article and return its canonical story (the article itself if new)"""
+        signature = self.signature(article)
+        if signature is None:
+            return article
+
+        band_keys = [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+        # Candidates share at least one band; confirm with the full signature
+        candidates = {story_id for key in band_keys for story_id in self._buckets.get(key, ())}
+        best: Optional[int] = None
+        best_similarity = self.threshold
+        for story_id in sorted(candidates):
+            similarity = self._similarity(signature, self._signatures[story_id])
+            if similarity >= best_similarity and (best is None or similarity > best_similarity):
+                best, best_similarity = story_id, similarity
+
+        if best is not None:
+            story = self._stories[best]
+            self._merge(story, article)
+            return story
+
+        story_id = len(self._stories)
+        article.setdefault('sources', [article.get('source', '')])
+        article.setdefault('related_urls', [])
+        self._stories.append(article)
+        self._signatures.append(signature)
+        for key in band_keys:
+            self._buckets.setdefault(key, []).append(story_id)
+        return article
+
+    @staticmethod
+    def _merge(story: Dict, duplicate: Dict) -> None:
+        """Record a duplicate's source and URL on the canonical story"""
+        source = duplicate.get('source', '')
+        if source not in story['sources']:
+            story['sources'].append(source)
+        url = duplicate.get('url', '')
+        if url and url != story.get('url') and url not in story['related_urls']:
+            story['related_urls'].append(url)
+
+    def __len__(self) -> int:
+        return len(self._stories)
@@ -1,10 +1,28 @@
 """
 Topic Analyzer - identifies trending topics from scraped articles
 """
-from typing import Dict, List
+from typing import AsyncIterable, Callable, Dict, Iterable, List, Optional, Set, Tuple
 from collections import Counter
+import heapq
+import itertools
 import re
 from loguru import logger
+import numpy as np
+
+from src.analyzers.batch_scorer import BatchScorer
+from src.analyzers.keyword_matcher import KeywordMatcher
+from src.analyzers.story_clusters import StoryClusters
+from src.analyzers.story_index import DEFAULT_DEDUP_CONFIG, StoryIndex
+from src.analyzers.trend_tracker import DEFAULT_TRENDS_CONFIG, extract_terms
+
+DEFAULT_SELECTION_CONFIG = {
+    'diversity': 0.4,            # MMR trade-off: 0 ranks by relevance only, 1 by novelty only
+    'category_similarity': 0.8,  # Similarity counted between two picks from the same category
+    'max_per_source': 2,         # Picks allowed from one source while others remain (0 = no cap)
+    'pool_per_source': 1,        # Candidates kept per category and source, as a multiple of the topic count
+}
+
+_SIMILARITY_WORD = re.compile(r'[a-z0-9]{3,}')
 
 
 class TopicAnalyzer:
@@ -14,6 +32,32 @@ class TopicAnalyzer:
         """Initialize topic analyzer"""
         self.config = config
         self.topic_categories = config.get('topic_categories', {})
+        # Keywords are compiled once; each article is scanned in a single pass
+        self.keyword_matcher = KeywordMatcher(self.topic_categories)
+        self.category_weights = [
+            (category_data or {}).get('weight', 1.0)
+            for category_data in self.topic_categories.values()
+        ]
+        self.dedup_config = {
+            **DEFAULT_DEDUP_CONFIG,
+            **config.get('analysis', {}).get('dedup', {})
+        }
+        # Whole batches are scored as one sparse matrix product; built on first batch
+        self._batch_scorer: Optional[BatchScorer] = None
+        self._batch_scorer_failed = False
+        self.scoring_config = config.get('analysis', {}).get('scoring', {})
+        # Terms currently bursting (see TrendTracker); articles mentioning them rank higher
+        self.trend_boost = {
+            **DEFAULT_TRENDS_CONFIG,
+            **config.get('analysis', {}).get('trends', {})
+        }['boost_weight']
+        self.trending_terms: Set[str] = set()
+        self.selection_config = {
+            **DEFAULT_SELECTION_CONFIG,
+            **config.get('analysis', {}).get('selection', {})
+        }
+        # Optional: stories persist across runs as online clusters, which become the topics
+        self.story_clusters = StoryClusters(config)
     
     def identify_trending_topics(self, articles: List[Dict], count: int = 5) -> List[Dict]:
         """Identify top trending topics from articles"""
@@ -24,84 +68,363 @@ class TopicAnalyzer:
             return []
         
         # Score articles based on keywords and categories
+        scores, categories = self.score_batch(articles)
         scored_articles = []
-        for article in articles:
-            score = self._calculate_relevance_score(article)
+        for article, score, category in zip(articles, scores.tolist(), categories):
+            if category is not None:
+                article['category'] = category
             scored_articles.append({
                 **article,
-                'relevance_score': score
+                'relevance_score': score + self._trend_boost(article)
             })
         
-        # Sort by relevance score
-        scored_articles.sort(key=lambda x: x['relevance_score'], reverse=True)
+        if self.story_clusters.enabled:
+            self.cluster_articles(scored_articles)
+            trending_topics = self._cluster_topics(count)
+            logger.info(f"✅ Identified {len(trending_topics)} trending topics")
+            return trending_topics
+        
+        # Collapse the same story reported by several sources
+        scored_articles = self._collapse_stories(scored_articles)
+        
+        # Best few of each category and source by relevance score (heap top-k, no full sort)
+        candidates = self._candidate_pool(scored_articles, count)
         
         # Get top N diverse topics
-        trending_topics = self._select_diverse_topics(scored_articles, count)
+        trending_topics = self._select_diverse_topics(candidates, count)
         
         logger.info(f"✅ Identified {len(trending_topics)} trending topics")
         return trending_topics
     
-    def _calculate_relevance_score(self, article: Dict) -> float:
-        """Calculate relevance score for an article"""
+    def identify_trending_topics_stream(self, articles: Iterable[Dict], count: int = 5,
+                                        on_scored: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """Identify trending topics while consuming an article stream"""
+        logger.info("🔍 Analyzing article stream for trending topics...")
+        
+        incremental = IncrementalTopicAnalyzer(self, count, on_scored=on_scored).consume(articles)
+        trending_topics = incremental.results()
+        
+        logger.info(f"✅ Identified {len(trending_topics)} trending topics from {incremental.processed} articles")
+        return trending_topics
+    
+    def _story_index(self) -> Optional[StoryIndex]:
+        """Near-duplicate index for one analysis run, if enabled"""
+        if not self.dedup_config.get('enabled', True):
+            return None
+        return StoryIndex.from_config(self.config)
+    
+    def _cross_source_score(self, base_score: float, story: Dict) -> float:
+        """Boost a story's score for every additional source covering it"""
+        extra_sources = max(0, len(story.get('sources', ())) - 1)
+        return base_score + self.dedup_config['cross_source_weight'] * extra_sources
+    
+    def _collapse_stories(self, scored_articles: List[Dict]) -> List[Dict]:
+        """Keep one canonical article per story, scored by its cross-source count"""
+        stories = self._story_index()
+        if stories is None:
+            return scored_articles
+        
+        canonical = [article for article in scored_articles if stories.add(article) is article]
+        for story in canonical:
+            story['relevance_score'] = self._cross_source_score(story['relevance_score'], story)
+        
+        if len(canonical) < len(scored_articles):
+            logger.info(f"🧬 Collapsed {len(scored_articles)} articles into {len(canonical)} stories")
+        return canonical
+    
+    def cluster_articles(self, scored_articles: Iterable[Dict]) -> None:
+        """Add scored articles to the story clusters and persist them"""
+        if not self.story_clusters.enabled:
+            return
+        for article in scored_articles:
+            self.story_clusters.add(article)
+        self.story_clusters.save()
+    
+    def _cluster_topics(self, count: int) -> List[Dict]:
+        """Select topics among the active story clusters"""
+        self.story_clusters.save()
+        clusters = self.story_clusters.topics()
+        logger.info(f"🧩 {len(clusters)} active story clusters")
+        return self._select_diverse_topics(self._candidate_pool(clusters, count), count)
+    
+    def mark_topics_posted(self, topics: Iterable[Dict]) -> None:
+        """Stop offering the clusters behind these topics"""
+        if self.story_clusters.enabled:
+            self.story_clusters.mark_posted(
+                topic['cluster_id'] for topic in topics if 'cluster_id' in topic
+            )
+            self.story_clusters.save()
+    
+    def set_trending_terms(self, terms: Iterable[str]) -> None:
+        """Use these bursting terms when ranking the next analysis"""
+        self.trending_terms = set(terms)
+    
+    def _trend_boost(self, article: Dict) -> float:
+        """Relevance added for each bursting term an article mentions"""
+        if not self.trend_boost or not self.trending_terms:
+            return 0.0
+        mentioned = self.trending_terms.intersection(extract_terms(article))
+        return self.trend_boost * len(mentioned)
+    
+    def score_article(self, article: Dict) -> float:
+        """Relevance score of one article, trend boost included (sets its category)
+        
+        Same score as the batch path, for articles scored one at a time
+        (the stream analyzer and ingestion polling).
+        """
+        return self._calculate_relevance_score(article) + self._trend_boost(article)
+    
+    @property
+    def batch_scorer(self) -> Optional[BatchScorer]:
+        """Vectorized scorer, built on first use; None if the keywords don't fit it"""
+        if self._batch_scorer is None and not self._batch_scorer_failed:
+            try:
+                self._batch_scorer = BatchScorer(self.topic_categories)
+            except ValueError as e:
+                logger.warning(f"Batch scoring unavailable, scoring articles one by one: {str(e)}")
+                self._batch_scorer_failed = True
+        return self._batch_scorer
+    
+    def score_batch(self, articles: List[Dict], tfidf: Optional[bool] = None):
+        """Score many articles without copying them; returns (scores array, categories)"""
+        if tfidf is None:
+            tfidf = self.scoring_config.get('tfidf', False)
+        if self.batch_scorer is None:
+            # TF-IDF needs the batch scorer; fall back to plain keyword counts
+            scored = [self._keyword_score(article) for article in articles]
+            return np.array([score for score, _ in scored], dtype=np.float64), [category for _, category in scored]
+        return self.batch_scorer.score_articles(articles, tfidf=tfidf)
+    
+    def _keyword_score(self, article: Dict) -> Tuple[float, Optional[str]]:
+        """Keyword relevance score and last matching category of an article"""
         score = 1.0
+        category = None
         
-        title = article.get('title', '').lower()
-        summary = article.get('summary', '').lower()
-        combined_text = f"{title} {summary}"
+        # Keyword matches for every category in one pass
+        counts = self.keyword_matcher.article_counts(article)
         
-        # Check each category
-        for category_key, category_data in self.topic_categories.items():
-            keywords = category_data.get('keywords', [])
-            weight = category_data.get('weight', 1.0)
-            
-            # Count keyword matches
-            matches = sum(1 for keyword in keywords if keyword.lower() in combined_text)
-            
+        for category_key, matches, weight in zip(self.keyword_matcher.categories, counts,
+                                                 self.category_weights):
             if matches > 0:
                 score += matches * weight
-                article['category'] = category_key
+                category = category_key
         
+        return score, category
+    
+    def _calculate_relevance_score(self, article: Dict) -> float:
+        """Calculate relevance score for an article"""
+        score, category = self._keyword_score(article)
+        if category is not None:
+            article['category'] = category
         return score
     
+    def _pool_size(self, count: int) -> int:
+        """Candidates kept per category and source for selection"""
+        return max(count, count * self.selection_config['pool_per_source'])
+    
+    @staticmethod
+    def _pool_key(article: Dict) -> tuple:
+        """Candidate pool bucket of an article"""
+        return article.get('category', 'general'), article.get('source')
+    
+    def _candidate_pool(self, scored_articles: List[Dict], count: int) -> List[Dict]:
+        """Top candidates of each category and source, best first (ties keep arrival order)"""
+        size = self._pool_size(count)
+        pool_key = self._pool_key
+        heaps: Dict[tuple, List] = {}
+        for index, article in enumerate(scored_articles):
+            score = article['relevance_score']
+            heap = heaps.get(pool_key(article))
+            if heap is None:
+                heaps[pool_key(article)] = [(score, -index, article)]
+            elif len(heap) < size:
+                heapq.heappush(heap, (score, -index, article))
+            elif score > heap[0][0]:
+                # Later arrivals never win ties, so only a strictly higher score gets in
+                heapq.heapreplace(heap, (score, -index, article))
+        
+        candidates = [entry for heap in heaps.values() for entry in heap]
+        candidates.sort(key=lambda entry: entry[:2], reverse=True)
+        return [article for _, _, article in candidates]
+    
     def _select_diverse_topics(self, scored_articles: List[Dict], count: int) -> List[Dict]:
-        """Select diverse topics across different categories"""
-        selected = []
-        categories_used = set()
+        """Select topics by maximal marginal relevance, capping picks per source
         
-        # First pass: one from each category
-        for article in scored_articles:
-            category = article.get('category', 'general')
-            if category not in categories_used:
-                selected.append(article)
-                categories_used.add(category)
-                if len(selected) >= count:
-                    break
-        
-        # Second pass: fill remaining slots with highest scores
-        if len(selected) < count:
-            for article in scored_articles:
-                if article not in selected:
-                    selected.append(article)
-                    if len(selected) >= count:
-                        break
-        
-        return selected[:count]
+        `scored_articles` must be ordered best first; equal picks keep that order.
+        Redundancy only grows as topics are picked, so a candidate's last MMR
+        value bounds its current one: a max-heap of those values is refreshed
+        lazily and similarities are computed for few candidates per pick.
+        """
+        diversity = self.selection_config['diversity']
+        same_category = self.selection_config['category_similarity']
+        max_per_source = self.selection_config['max_per_source']
+        count = min(count, len(scored_articles))
+        if count <= 0:
+            return []
+        
+        top_score = scored_articles[0]['relevance_score'] or 1.0
+        words: Dict[int, frozenset] = {}
+        
+        def features(i: int) -> frozenset:
+            if i not in words:
+                article = scored_articles[i]
+                text = f"{article.get('title') or ''} {article.get('summary') or ''}".lower()
+                words[i] = frozenset(_SIMILARITY_WORD.findall(text))
+            return words[i]
+        
+        def similarity(i: int, j: int) -> float:
+            union = len(features(i) | features(j))
+            overlap = len(features(i) & features(j)) / union if union else 0.0
+            if scored_articles[i].get('category', 'general') == scored_articles[j].get('category', 'general'):
+                return max(overlap, same_category)
+            return overlap
+        
+        # Highest similarity to the picks so far, and how many picks that covers
+        redundancy = [0.0] * len(scored_articles)
+        checked = [0] * len(scored_articles)
+        per_source = Counter()
+        selected: List[int] = []
+        
+        # (-MMR value, position): ties go to the earlier candidate
+        heap = [
+            (-(1 - diversity) * article['relevance_score'] / top_score, i)
+            for i, article in enumerate(scored_articles)
+        ]
+        heapq.heapify(heap)
+        capped: List[tuple] = []
+        enforce_caps = bool(max_per_source)
+        
+        while len(selected) < count:
+            if not heap:
+                # Only sources at their cap have candidates left
+                enforce_caps = False
+                heap, capped = capped, []
+                heapq.heapify(heap)
+            
+            negative_value, i = heapq.heappop(heap)
+            source = scored_articles[i].get('source')
+            if enforce_caps and per_source[source] >= max_per_source:
+                capped.append((negative_value, i))
+                continue
+            
+            if checked[i] < len(selected):
+                for j in selected[checked[i]:]:
+                    redundancy[i] = max(redundancy[i], similarity(i, j))
+                checked[i] = len(selected)
+                value = (1 - diversity) * scored_articles[i]['relevance_score'] / top_score \
+                    - diversity * redundancy[i]
+                heapq.heappush(heap, (-value, i))
+                continue
+            
+            selected.append(i)
+            per_source[source] += 1
+        
+        return [scored_articles[i] for i in selected]
     
     def categorize_article(self, article: Dict) -> str:
         """Determine the category of an article"""
-        title = article.get('title', '').lower()
-        summary = article.get('summary', '').lower()
-        combined_text = f"{title} {summary}"
+        counts = self.keyword_matcher.article_counts(article)
         
         best_category = 'general'
         best_score = 0
         
-        for category_key, category_data in self.topic_categories.items():
-            keywords = category_data.get('keywords', [])
-            matches = sum(1 for keyword in keywords if keyword.lower() in combined_text)
-            
+        for category_key, matches in zip(self.keyword_matcher.categories, counts):
             if matches > best_score:
                 best_score = matches
                 best_category = category_key
         
         return best_category
+
+
+class IncrementalTopicAnalyzer:
+    """Scores articles as they arrive, keeping only the candidates selection can use"""
+    
+    def __init__(self, analyzer: TopicAnalyzer, count: int = 5,
+                 on_scored: Optional[Callable[[Dict], None]] = None):
+        """Initialize with the analyzer used for scoring and selection"""
+        self.analyzer = analyzer
+        self.count = count
+        self.on_scored = on_scored
+        self.processed = 0
+        
+        # Min-heaps of (score, -sequence, article) per category and source.
+        # Selection only considers the best `pool_size` of each (as the batch
+        # path does), so nothing else needs to be kept.
+        self.pool_size = analyzer._pool_size(count)
+        self._heaps: Dict[str, List] = {}
+        self._sequence = itertools.count()
+        
+        # Near-duplicates fold into the first article of their story, whose
+        # score grows with each new source; keep its base score and arrival order
+        self.stories = analyzer._story_index()
+        self._story_keys: Dict[int, tuple] = {}
+    
+    def add(self, article: Dict) -> None:
+        """Score one article and keep it if it can still be selected"""
+        self.processed += 1
+        score = self.analyzer.score_article(article)
+        scored = {**article, 'relevance_score': score}
+        if self.on_scored:
+            self.on_scored(scored)
+        
+        if self.analyzer.story_clusters.enabled:
+            self.analyzer.story_clusters.add(scored)
+        
+        # Earlier arrivals win ties, matching the stable sort of the batch path
+        sequence = -next(self._sequence)
+        
+        if self.stories is not None:
+            story = self.stories.add(scored)
+            if story is not scored:
+                self._rescore(story)
+                return
+            self._story_keys[id(scored)] = (score, sequence)
+        
+        self._push((score, sequence, scored))
+    
+    def _push(self, entry: tuple) -> None:
+        """Keep an entry if it is among the top `pool_size` of its category and source"""
+        heap = self._heaps.setdefault(self.analyzer._pool_key(entry[2]), [])
+        if len(heap) < self.pool_size:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    
+    def _rescore(self, story: Dict) -> None:
+        """Re-rank a story after a duplicate from another source joined it"""
+        base_score, sequence = self._story_keys[id(story)]
+        score = self.analyzer._cross_source_score(base_score, story)
+        if score == story['relevance_score']:
+            return
+        story['relevance_score'] = score
+        
+        heap = self._heaps.get(self.analyzer._pool_key(story), [])
+        for index, entry in enumerate(heap):
+            if entry[2] is story:
+                heap[index] = heap[-1]
+                heap.pop()
+                heapq.heapify(heap)
+                break
+        self._push((score, sequence, story))
+    
+    def consume(self, articles: Iterable[Dict]) -> 'IncrementalTopicAnalyzer':
+        """Score every article from a (lazy) iterable"""
+        for article in articles:
+            self.add(article)
+        return self
+    
+    async def aconsume(self, articles: AsyncIterable[Dict]) -> 'IncrementalTopicAnalyzer':
+        """Score every article from an async iterator"""
+        async for article in articles:
+            self.add(article)
+        return self
+    
+    def results(self) -> List[Dict]:
+        """Select the diverse top topics from the retained candidates"""
+        if self.analyzer.story_clusters.enabled:
+            return self.analyzer._cluster_topics(self.count)
+        candidates = [entry for heap in self._heaps.values() for entry in heap]
+        candidates.sort(key=lambda entry: entry[:2], reverse=True)
+        return self.analyzer._select_diverse_topics(
+            [article for _, _, article in candidates], self.count
+        )
@@ -0,0 +1,170 @@
+"""
+Trend tracker - decayed term and entity counts for burst detection
+"""
+from typing import Dict, Iterable, List, Optional, Set
+import math
+import re
+import time
+
+from loguru import logger
+
+# Exponential decay time constants (seconds) of the stored counters
+WINDOWS = {'1h': 3600, '24h': 86400, '7d': 604800}
+
+DEFAULT_TRENDS_CONFIG = {
+    'enabled': True,
+    'min_count': 3.0,        # Decayed short-window count a bursting term needs
+    'burst_ratio': 3.0,      # Short-window rate over the 7-day baseline rate
+    'prior': 2.0,            # Pseudo-count added to the baseline so new terms need evidence
+    'max_terms': 20,         # Bursting terms reported per run
+    'boost_weight': 0.0,     # Relevance added per bursting term in an article (0 = off)
+    'prune_below': 0.1,      # Forget terms whose 7-day count decayed below this
+}
+
+_TOKEN = re.compile(r"[A-Za-z0-9][\w'.+-]*[A-Za-z0-9+]|[A-Za-z0-9]")
+_CLAUSE_BREAK = re.compile(r'[.:;!?|()"\u2013\u2014]+(?:\s|$)|\s[-\u2013\u2014]\s')
+_STOPWORDS = frozenset("""
+    a about above after again against all also an and any are as at be because been before being
+    below between both but by can could did do does doing down during each even every few for from
+    further get gets got had has have having he her here hers him his how however i if in into is it
+    its itself just like made make makes many may me more most much must my new news no nor not now
+    of off on once one only or other our out over own per report reports said same says see she
+    should since so some still such than that the their them then there these they this those
+    through to too under until up us use used using very via was way we week were what when where
+    which while who whom why will with within without would year years yet you your
+""".split())
+
+
+def extract_terms(article: Dict) -> Dict[str, str]:
+    """Distinct terms of an article's title and summary, mapped to their kind
+
+    Terms are lowercase words that aren't stopwords or numbers. Entities are
+    runs of two or three capitalized words within a clause ("Sam Altman");
+    longer runs are usually Title Case headlines and are skipped.
+    """
+    terms: Dict[str, str] = {}
+    for text in (article.get('title') or '', article.get('summary') or ''):
+        for clause in _CLAUSE_BREAK.split(text):
+            run: List[str] = []
+            for word in _TOKEN.findall(clause) + ['']:
+                lower = word.lower()
+                if len(lower) >= 3 and lower not in _STOPWORDS and not lower.isdigit():
+                    terms.setdefault(lower, 'term')
+
+                if word[:1].isupper() and (run or lower not in _STOPWORDS):
+                    run.append(word)
+                    continue
+                if 2 <= len(run) <= 3:
+                    terms[' '.join(run).lower()] = 'entity'
+                run = []
+    return terms
+
+
+class TrendTracker:
+    """Keeps exponentially decayed term counts over 1h/24h/7d windows in SQLite
+
+    Each window is a single number per term: on update the stored count is
+    decayed by exp(-elapsed / window) and the new occurrences are added, so
+    ingesting an article touches only its own terms and finding bursts never
+    rescans article history.
+    """
+
+    def __init__(self, config: Dict, db_manager):
+        """Initialize tracker on a database connection"""
+        self.config = {**DEFAULT_TRENDS_CONFIG, **config.get('analysis', {}).get('trends', {})}
+        self.enabled = self.config['enabled']
+        self.db_manager = db_manager
+        self._last_prune = 0.0
+
+    @staticmethod
+    def _decayed(row: Dict, now: float) -> Dict[str, float]:
+        """A stored row's counts decayed to `now`"""
+        elapsed = max(0.0, now - row['updated_at'])
+        return {
+            window: row[f'count_{window}'] * math.exp(-elapsed / seconds)
+            for window, seconds in WINDOWS.items()
+        }
+
+    def observe(self, articles: Iterable[Dict], now: Optional[float] = None) -> int:
+        """Add newly ingested articles to the counters; return how many were counted"""
+        if not self.enabled:
+            return 0
+        now = now if now is not None else time.time()
+
+        # Document frequency: a term counts once per article
+        occurrences: Dict[str, int] = {}
+        kinds: Dict[str, str] = {}
+        observed = 0
+        for article in articles:
+            observed += 1
+            for term, kind in extract_terms(article).items():
+                occurrences[term] = occurrences.get(term, 0) + 1
+                kinds[term] = kind
+        if not occurrences:
+            return observed
+
+        stored = self.db_manager.get_term_counts(list(occurrences))
+        rows = []
+        for term, added in occurrences.items():
+            counts = self._decayed(stored[term], now) if term in stored else dict.fromkeys(WINDOWS, 0.0)
+            rows.append({
+                'term': term,
+                'kind': kinds[term],
+                **{f'count_{window}': counts[window] + added for window in WINDOWS},
+                'updated_at': now,
+            })
+        self.db_manager.save_term_counts(rows)
+
+        if now - self._last_prune >= WINDOWS['1h']:
+            self.prune(now)
+        return observed
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop terms whose weekly count has decayed below `prune_below`"""
+        now = now if now is not None else time.time()
+        self._last_prune = now
+        deleted = 0
+        # Untouched for `age`, a count below prune_below * e^(age / 7d) is now below prune_below
+        for days in (1, 2, 4, 8, 16, 32):
+            age = days * WINDOWS['24h']
+            deleted += self.db_manager.delete_stale_terms(
+                now - age, self.config['prune_below'] * math.exp(age / WINDOWS['7d'])
+            )
+        if deleted:
+            logger.debug(f"Pruned {deleted} faded terms")
+        return deleted
+
+    def burst_score(self, counts: Dict[str, float]) -> float:
+        """Short-window rate over the smoothed 7-day baseline rate (best of 1h and 24h)"""
+        baseline = (counts['7d'] + self.config['prior']) / WINDOWS['7d']
+        best = 0.0
+        for window in ('1h', '24h'):
+            if counts[window] >= self.config['min_count']:
+                best = max(best, counts[window] / WINDOWS[window] / baseline)
+        return best
+
+    def trending_terms(self, now: Optional[float] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Terms bursting now, strongest first"""
+        if not self.enabled:
+            return []
+        now = now if now is not None else time.time()
+        limit = limit or self.config['max_terms']
+
+        # Only terms seen within the last day are considered, not the whole vocabulary
+        trending = []
+        for row in self.db_manager.get_term_counts_since(now - WINDOWS['24h']):
+            counts = self._decayed(row, now)
+            score = self.burst_score(counts)
+            if score >= self.config['burst_ratio']:
+                trending.append({
+                    'term': row['term'],
+                    'kind': row['kind'],
+                    'burst': round(score, 2),
+                    **{f'count_{window}': round(counts[window], 2) for window in WINDOWS},
+                })
+        trending.sort(key=lambda item: item['burst'], reverse=True)
+        return trending[:limit]
+
+    def trending_set(self, now: Optional[float] = None) -> Set[str]:
+        """Just the bursting terms"""
+        return {item['term'] for item in self.trending_terms(now)}
@@ -1,68 +1,143 @@
 """
 Automation orchestrator - coordinates all automation components
 """
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+from functools import cached_property
 from loguru import logger
 from datetime import datetime
 import schedule
 import time
 
-from src.scrapers.scraper_manager import ScraperManager
-from src.analyzers.topic_analyzer import TopicAnalyzer
-from src.generators.post_generator import PostGenerator
-from src.schedulers.post_scheduler import PostScheduler
-from src.trackers.engagement_tracker import EngagementTracker
-from src.database.db_manager import DatabaseManager
+if TYPE_CHECKING:
+    from src.analyzers.topic_analyzer import TopicAnalyzer
+    from src.analyzers.trend_tracker import TrendTracker
+    from src.database.db_manager import DatabaseManager
+    from src.generators.post_generator import PostGenerator
+    from src.schedulers.ingestion_scheduler import IngestionScheduler
+    from src.schedulers.post_scheduler import PostScheduler
+    from src.scrapers.article_extractor import ArticleExtractor
+    from src.scrapers.scraper_manager import ScraperManager
+    from src.trackers.engagement_tracker import EngagementTracker
 
 
 class AutomationOrchestrator:
-    """Orchestrates the entire automation workflow"""
+    """Orchestrates the entire automation workflow
+    
+    Components are imported and created on first use, so each CLI mode only
+    pays for what it touches (--test-scrape never loads numpy or an AI SDK).
+    """
     
     def __init__(self, config: Dict, dry_run: bool = False):
         """Initialize orchestrator with configuration"""
         self.config = config
         self.dry_run = dry_run
         
-        # Initialize components
-        self.db_manager = DatabaseManager()
-        self.scraper_manager = ScraperManager(config)
-        self.topic_analyzer = TopicAnalyzer(config)
-        self.post_generator = PostGenerator(config)
-        self.post_scheduler = PostScheduler(config, dry_run=dry_run)
-        self.engagement_tracker = EngagementTracker(config)
-        
         logger.info("✅ Orchestrator initialized")
     
+    @cached_property
+    def db_manager(self) -> 'DatabaseManager':
+        """Database connection"""
+        from src.database.db_manager import DatabaseManager
+        return DatabaseManager()
+    
+    @cached_property
+    def scraper_manager(self) -> 'ScraperManager':
+        """Scrapers, with the seen-URL index for incremental runs"""
+        from src.scrapers.scraper_manager import ScraperManager
+        from src.database.seen_index import SeenUrlIndex
+        scraper_manager = ScraperManager(self.config)
+        
+        # Delta-only runs: drop articles whose URL is already in the articles table
+        if self.config.get('scraping', {}).get('incremental', True):
+            scraper_manager.set_seen_index(SeenUrlIndex.from_database(self.db_manager))
+        return scraper_manager
+    
+    @cached_property
+    def article_extractor(self) -> 'ArticleExtractor':
+        """Full-text extraction for shortlisted topics"""
+        from src.scrapers.article_extractor import ArticleExtractor
+        return ArticleExtractor(self.config)
+    
+    @cached_property
+    def topic_analyzer(self) -> 'TopicAnalyzer':
+        """Scoring and topic selection"""
+        from src.analyzers.topic_analyzer import TopicAnalyzer
+        return TopicAnalyzer(self.config)
+    
+    @cached_property
+    def trend_tracker(self) -> 'TrendTracker':
+        """Bursting term detection"""
+        from src.analyzers.trend_tracker import TrendTracker
+        return TrendTracker(self.config, self.db_manager)
+    
+    @cached_property
+    def post_generator(self) -> 'PostGenerator':
+        """Post generation (the AI SDK loads on its first call); stores per-call metrics"""
+        from src.generators.post_generator import PostGenerator
+        return PostGenerator(self.config, self.db_manager)
+    
+    @cached_property
+    def post_scheduler(self) -> 'PostScheduler':
+        """LinkedIn publishing"""
+        from src.schedulers.post_scheduler import PostScheduler
+        return PostScheduler(self.config, dry_run=self.dry_run)
+    
+    @cached_property
+    def engagement_tracker(self) -> 'EngagementTracker':
+        """Engagement metrics"""
+        from src.trackers.engagement_tracker import EngagementTracker
+        return EngagementTracker(self.config)
+    
+    @cached_property
+    def ingestion(self) -> 'IngestionScheduler':
+        """Optional: poll sources continuously so the daily run reads from the database"""
+        from src.schedulers.ingestion_scheduler import IngestionScheduler
+        return IngestionScheduler(self.config, self.scraper_manager, self.topic_analyzer)
+    
     def run_once(self) -> None:
         """Execute complete workflow once"""
         logger.info("🔄 Starting single execution cycle...")
         
         try:
-            # Step 1: Scrape content
-            logger.info("📰 Scraping content from sources...")
-            articles = self.scraper_manager.scrape_all_sources()
-            logger.info(f"✅ Scraped {len(articles)} articles")
-            
-            # Step 2: Analyze and identify trending topics
-            logger.info("🔍 Analyzing topics...")
-            trending_topics = self.topic_analyzer.identify_trending_topics(
-                articles, 
-                count=self.config.get('content', {}).get('daily_topics_count', 5)
-            )
+            count = self.config.get('content', {}).get('daily_topics_count', 5)
+            if self.ingestion.enabled:
+                # Step 1-2: Articles were scraped and scored by the ingestion loop
+                self.ingestion.run_pending()
+                articles = self.ingestion.fresh_articles()
+                self._refresh_trends()
+                logger.info(f"📚 Analyzing {len(articles)} fresh articles from the database...")
+                trending_topics = self.topic_analyzer.identify_trending_topics(articles, count=count)
+            else:
+                # Step 1-2: Scrape content and score articles as each source completes
+                logger.info("📰 Scraping and analyzing content from sources...")
+                self._refresh_trends()
+                from src.database.db_manager import ArticleBatchWriter
+                # Trends were refreshed above, so counting each stored batch
+                # only shapes the next run's trends
+                with ArticleBatchWriter(self.db_manager, on_flush=self.trend_tracker.observe) as article_writer:
+                    trending_topics = self.topic_analyzer.identify_trending_topics_stream(
+                        self.scraper_manager.scrape_stream(),
+                        count=count,
+                        on_scored=article_writer.add
+                    )
+                logger.info(f"💾 Stored {article_writer.written} new articles")
+                self.scraper_manager.save_feed_state()
             logger.info(f"✅ Identified {len(trending_topics)} trending topics")
             
-            # Step 3: Generate LinkedIn posts
+            # Optional: full article bodies, fetched for the shortlist only
+            self.article_extractor.enrich(trending_topics)
+            
+            # Step 3: Generate LinkedIn posts (provider calls run concurrently)
             logger.info("✍️ Generating LinkedIn posts...")
-            posts = []
+            posts = self.post_generator.generate_posts(trending_topics)
             for topic in trending_topics:
-                post = self.post_generator.generate_post(topic)
-                posts.append(post)
                 logger.info(f"  ✓ Generated post for: {topic['title']}")
             
             # Step 4: Save to database
             logger.info("💾 Saving posts to database...")
             for post in posts:
                 self.db_manager.save_post(post)
+            self.topic_analyzer.mark_topics_posted(trending_topics)
             
             # Step 5: Schedule posts
             logger.info("📅 Scheduling posts...")
@@ -79,6 +154,15 @@ class AutomationOrchestrator:
             logger.error(f"❌ Error in execution cycle: {str(e)}")
             raise
     
+    def _refresh_trends(self) -> None:
+        """Pass the currently bursting terms to the topic analyzer"""
+        trending = self.trend_tracker.trending_terms()
+        if trending:
+            logger.info("📈 Bursting terms: " + ", ".join(
+                f"{item['term']} (x{item['burst']})" for item in trending[:10]
+            ))
+        self.topic_analyzer.set_trending_terms(item['term'] for item in trending)
+    
     def run_scheduled(self) -> None:
         """Run on schedule indefinitely"""
         logger.info("⏰ Setting up scheduled automation...")
@@ -95,6 +179,10 @@ class AutomationOrchestrator:
         
         logger.info(f"✅ Scheduled daily run at {default_time}")
         logger.info("✅ Scheduled engagement tracking every 6 hours")
+        # Checked from config so the analyzer and scrapers load at the first run, not at startup
+        ingestion_enabled = self.config.get('ingestion', {}).get('enabled', False)
+        if ingestion_enabled:
+            self.ingestion.start()
         logger.info("⏳ Waiting for scheduled time... (Press Ctrl+C to stop)")
         
         try:
@@ -103,6 +191,9 @@ class AutomationOrchestrator:
                 time.sleep(60)  # Check every minute
         except KeyboardInterrupt:
             logger.info("⚠️ Scheduler stopped by user")
+        finally:
+            if ingestion_enabled:
+                self.ingestion.stop()
     
     def test_scraping(self) -> None:
         """Test scraping functionality"""
@@ -167,9 +258,9 @@ class AutomationOrchestrator:
             }
         ]
         
-        for i, topic in enumerate(sample_topics[:count], 1):
-            logger.info(f"\n📝 Generating post {i}/{count}...")
-            post = self.post_generator.generate_post(topic)
+        posts = self.post_generator.generate_posts(sample_topics[:count])
+        for i, post in enumerate(posts, 1):
+            logger.info(f"\n📝 Post {i}/{len(posts)}")
             
             logger.info(f"\n{'='*60}")
             logger.info(f"Topic: {post['topic_title']}")
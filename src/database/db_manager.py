@@ -2,7 +2,8 @@
 Database Manager - handles all database operations
 """
 import sqlite3
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from datetime import datetime
 from loguru import logger
 from pathlib import Path
 import os
@@ -107,8 +108,202 @@ class DatabaseManager:
             logger.error(f"Error saving engagement: {str(e)}")
             return False
     
+    def upsert_articles(self, articles: Iterable[Dict]) -> int:
+        """Insert or update scraped articles in bulk, keyed by URL"""
+        rows = [
+            (
+                article.get('title', ''),
+                article.get('url'),
+                article.get('summary'),
+                article.get('source'),
+                article.get('published'),
+                article.get('scraped_at') or datetime.now().isoformat(),
+                article.get('category'),
+                article.get('relevance_score')
+            )
+            for article in articles
+            if article.get('url')
+        ]
+        if not rows:
+            return 0
+        
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany("""
+                INSERT INTO articles (
+                    title, url, summary, source, published_at,
+                    scraped_at, category, relevance_score
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    title = excluded.title,
+                    summary = excluded.summary,
+                    category = COALESCE(excluded.category, articles.category),
+                    relevance_score = COALESCE(excluded.relevance_score, articles.relevance_score)
+            """, rows)
+            self.conn.commit()
+            return len(rows)
+        
+        except Exception as e:
+            logger.error(f"Error saving articles: {str(e)}")
+            return 0
+    
+    def iter_article_urls(self) -> Iterator[str]:
+        """Iterate over every stored article URL"""
+        try:
+            cursor = self.conn.cursor()
+            for row in cursor.execute("SELECT url FROM articles"):
+                yield row[0]
+        
+        except Exception as e:
+            logger.error(f"Error reading article URLs: {str(e)}")
+    
+    def get_fresh_articles(self, since: str) -> List[Dict]:
+        """Get articles scraped since a timestamp that no post has used yet"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT title, url, summary, source, published_at AS published,
+                       scraped_at, category, relevance_score
+                FROM articles
+                WHERE scraped_at >= ?
+                  AND url NOT IN (SELECT source_url FROM posts WHERE source_url IS NOT NULL)
+                ORDER BY scraped_at, id
+            """, (since,))
+            return [dict(row) for row in cursor.fetchall()]
+        
+        except Exception as e:
+            logger.error(f"Error fetching fresh articles: {str(e)}")
+            return []
+    
+    def get_term_counts(self, terms: List[str]) -> Dict[str, Dict]:
+        """Get stored decayed counts for the given terms"""
+        counts = {}
+        try:
+            cursor = self.conn.cursor()
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(terms), 500):
+                chunk = terms[start:start + 500]
+                cursor.execute(
+                    f"SELECT * FROM term_counts WHERE term IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                counts.update((row['term'], dict(row)) for row in cursor.fetchall())
+        
+        except Exception as e:
+            logger.error(f"Error fetching term counts: {str(e)}")
+        return counts
+    
+    def get_term_counts_since(self, since: float) -> List[Dict]:
+        """Get counts of terms updated since a Unix timestamp"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT * FROM term_counts WHERE updated_at >= ?", (since,))
+            return [dict(row) for row in cursor.fetchall()]
+        
+        except Exception as e:
+            logger.error(f"Error fetching term counts: {str(e)}")
+            return []
+    
+    def save_term_counts(self, rows: List[Dict]) -> bool:
+        """Insert or replace decayed term counts"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO term_counts (
+                    term, kind, count_1h, count_24h, count_7d, updated_at
+                ) VALUES (:term, :kind, :count_1h, :count_24h, :count_7d, :updated_at)
+            """, rows)
+            self.conn.commit()
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error saving term counts: {str(e)}")
+            return False
+    
+    def delete_stale_terms(self, updated_before: float, max_count_7d: float) -> int:
+        """Delete terms not seen since a timestamp whose weekly count is small"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "DELETE FROM term_counts WHERE updated_at < ? AND count_7d < ?",
+                (updated_before, max_count_7d)
+            )
+            self.conn.commit()
+            return cursor.rowcount
+        
+        except Exception as e:
+            logger.error(f"Error pruning term counts: {str(e)}")
+            return 0
+    
+    def save_llm_calls(self, calls: List[Dict]) -> bool:
+        """Save per-call provider metrics"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany("""
+                INSERT INTO llm_calls (
+                    provider, model, kind, ttft, latency, input_tokens,
+                    output_tokens, retries, cut_off, error, created_at
+                ) VALUES (
+                    :provider, :model, :kind, :ttft, :latency, :input_tokens,
+                    :output_tokens, :retries, :cut_off, :error, :created_at
+                )
+            """, calls)
+            self.conn.commit()
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error saving LLM calls: {str(e)}")
+            return False
+    
+    def get_llm_calls(self, since: str) -> List[Dict]:
+        """Get provider calls made since a timestamp"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT * FROM llm_calls WHERE created_at >= ? ORDER BY created_at, id",
+                (since,)
+            )
+            return [dict(row) for row in cursor.fetchall()]
+        
+        except Exception as e:
+            logger.error(f"Error fetching LLM calls: {str(e)}")
+            return []
+    
     def close(self):
         """Close database connection"""
         if self.conn:
             self.conn.close()
             logger.info("Database connection closed")
+
+
+class ArticleBatchWriter:
+    """Buffers scored articles and upserts them in bulk"""
+    
+    def __init__(self, db_manager: DatabaseManager, batch_size: int = 200,
+                 on_flush: Optional[Callable[[List[Dict]], None]] = None):
+        """Initialize writer; `on_flush` also receives each batch once it is written"""
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.on_flush = on_flush
+        self.written = 0
+        self._buffer: List[Dict] = []
+    
+    def add(self, article: Dict) -> None:
+        """Queue an article, flushing when the batch is full"""
+        self._buffer.append(article)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write all queued articles"""
+        if self._buffer:
+            self.written += self.db_manager.upsert_articles(self._buffer)
+            if self.on_flush:
+                self.on_flush(self._buffer)
+            self._buffer = []
+    
+    def __enter__(self) -> 'ArticleBatchWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
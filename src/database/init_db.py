@@ -65,6 +65,42 @@ def initialize_database():
         )
     """)
     
+    # Create term counts table (decayed term/entity frequencies for trend detection)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS term_counts (
+            term TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            count_1h REAL NOT NULL DEFAULT 0,
+            count_24h REAL NOT NULL DEFAULT 0,
+            count_7d REAL NOT NULL DEFAULT 0,
+            updated_at REAL NOT NULL
+        )
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_term_counts_updated ON term_counts (updated_at)"
+    )
+    
+    # Create LLM calls table (latency and token counts per provider call)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS llm_calls (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            provider TEXT NOT NULL,
+            model TEXT,
+            kind TEXT NOT NULL,
+            ttft REAL,
+            latency REAL NOT NULL,
+            input_tokens INTEGER NOT NULL,
+            output_tokens INTEGER NOT NULL,
+            retries INTEGER NOT NULL DEFAULT 0,
+            cut_off INTEGER NOT NULL DEFAULT 0,
+            error TEXT,
+            created_at TEXT NOT NULL
+        )
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_llm_calls_created ON llm_calls (created_at)"
+    )
+    
     conn.commit()
     conn.close()
     
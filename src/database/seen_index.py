@@ -0,0 +1,57 @@
+"""
+Seen-URL index - in-memory set of article URLs already stored in the database
+"""
+from typing import Iterable
+from urllib.parse import urldefrag
+import hashlib
+import threading
+
+from loguru import logger
+
+
+class SeenUrlIndex:
+    """Compact hash set of known article URLs (64-bit digests, not strings)"""
+    
+    def __init__(self, urls: Iterable[str] = ()):
+        """Initialize index with already known URLs"""
+        self._lock = threading.Lock()
+        self._hashes = set()
+        self.update(urls)
+    
+    @classmethod
+    def from_database(cls, db_manager) -> 'SeenUrlIndex':
+        """Load every URL from the articles table"""
+        index = cls(db_manager.iter_article_urls())
+        logger.info(f"📚 Loaded {len(index)} known article URLs")
+        return index
+    
+    @staticmethod
+    def _key(url: str) -> int:
+        """Hash a URL, ignoring surrounding whitespace and fragments"""
+        normalized = urldefrag(url.strip())[0]
+        return int.from_bytes(hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest(), 'big')
+    
+    def __contains__(self, url: str) -> bool:
+        if not url:
+            return False
+        return self._key(url) in self._hashes
+    
+    def __len__(self) -> int:
+        return len(self._hashes)
+    
+    def add(self, url: str) -> bool:
+        """Add a URL; return False if it was already known"""
+        if not url:
+            return False
+        key = self._key(url)
+        with self._lock:
+            if key in self._hashes:
+                return False
+            self._hashes.add(key)
+            return True
+    
+    def update(self, urls: Iterable[str]) -> None:
+        """Add many URLs"""
+        keys = [self._key(url) for url in urls if url]
+        with self._lock:
+            self._hashes.update(keys)
@@ -0,0 +1,82 @@
+"""
+Call metrics - token counting and per-model latency summaries for LLM provider calls
+"""
+from typing import Dict, Iterable, List, Optional
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: Optional[str]):
+    """tiktoken encoding for a model (cl100k_base for non-OpenAI models), or None without tiktoken"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model or '')
+    except KeyError:
+        pass
+    except Exception:
+        # Known model whose encoding could not be loaded (download or network error)
+        return None
+    try:
+        return tiktoken.get_encoding('cl100k_base')
+    except Exception:
+        # The encoding is downloaded on first use; offline without a cached copy
+        return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Tokens in text, counted with tiktoken or estimated at 4 characters per token
+
+    Claude and Gemini tokenizers differ from OpenAI's, so their counts are
+    comparable across providers rather than exact billing figures.
+    """
+    if not text:
+        return 0
+    # Counting runs after a call has succeeded, so it must never raise
+    encoding = _encoding(model)
+    if encoding is not None:
+        try:
+            return len(encoding.encode(text, disallowed_special=()))
+        except Exception:
+            pass
+    return max(1, len(text) // 4)
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of a list (None if empty)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def summarize_calls(calls: Iterable[Dict]) -> List[Dict]:
+    """Per provider and model: call count, errors, retries, cutoffs, TTFT/latency p50 and p95, tokens"""
+    groups: Dict[tuple, List[Dict]] = {}
+    for call in calls:
+        groups.setdefault((call['provider'], call['model']), []).append(call)
+
+    summary = []
+    for (provider, model), group in sorted(groups.items(), key=lambda item: (item[0][0], item[0][1] or '')):
+        succeeded = [call for call in group if not call.get('error')]
+        ttfts = [call['ttft'] for call in succeeded if call.get('ttft') is not None]
+        latencies = [call['latency'] for call in succeeded]
+        output_tokens = sum(call['output_tokens'] for call in succeeded)
+        summary.append({
+            'provider': provider,
+            'model': model,
+            'calls': len(group),
+            'errors': len(group) - len(succeeded),
+            'retries': sum(call.get('retries', 0) for call in group),
+            'cut_off': sum(1 for call in succeeded if call.get('cut_off')),
+            'ttft_p50': _percentile(ttfts, 0.5),
+            'ttft_p95': _percentile(ttfts, 0.95),
+            'latency_p50': _percentile(latencies, 0.5),
+            'latency_p95': _percentile(latencies, 0.95),
+            'input_tokens': sum(call['input_tokens'] for call in group),
+            'output_tokens': output_tokens,
+            'tokens_per_second': output_tokens / sum(latencies) if latencies and sum(latencies) else None,
+        })
+    return summary
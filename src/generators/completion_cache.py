@@ -0,0 +1,149 @@
+"""
+Completion cache - persistent prompt/response cache for LLM provider calls
+"""
+from typing import Dict, Optional
+from pathlib import Path
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from loguru import logger
+
+
+class CompletionCache:
+    """Provider responses in SQLite, keyed by a hash of the full request, with TTL and LRU cap
+
+    With `bypass`, cached responses are never returned but fresh ones are
+    still stored, so a forced regeneration refreshes the cache.
+    """
+
+    def __init__(self, path: str = 'data/cache/completions.db', enabled: bool = True,
+                 ttl: int = 604800, max_entries: int = 2000, bypass: bool = False):
+        """Initialize cache database"""
+        self.path = Path(path)
+        self.enabled = enabled
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.bypass = bypass
+        self._lock = threading.Lock()
+        self.conn = None
+        self.hits = 0
+        self.misses = 0
+        self.latency_saved = 0.0
+
+        if self.enabled:
+            self._init_db()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'CompletionCache':
+        """Build a cache from the `content.generation.cache` config section"""
+        cache_config = config.get('content', {}).get('generation', {}).get('cache', {})
+        bypass = cache_config.get('bypass', False) or \
+            os.getenv('LLM_CACHE_BYPASS', 'false').lower() == 'true'
+        return cls(
+            path=cache_config.get('path', 'data/cache/completions.db'),
+            enabled=cache_config.get('enabled', True),
+            ttl=cache_config.get('ttl', 604800),
+            max_entries=cache_config.get('max_entries', 2000),
+            bypass=bypass,
+        )
+
+    def _init_db(self) -> None:
+        """Create the completions table"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS completions (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT,
+                response TEXT NOT NULL,
+                latency REAL NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_completions_accessed ON completions (accessed_at)")
+        self.conn.commit()
+
+    @staticmethod
+    def key(provider: str, model: Optional[str], prompt: str, params: Dict) -> str:
+        """Hash of everything that determines a response"""
+        request = json.dumps(
+            {'provider': provider, 'model': model, 'prompt': prompt, 'params': params},
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(request.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a fresh cached response, counting the hit or miss"""
+        if not self.enabled or self.bypass:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response, latency, stored_at FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[2] > self.ttl:
+                self.misses += 1
+                return None
+
+            self.conn.execute("UPDATE completions SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            self.hits += 1
+            self.latency_saved += row[1]
+            return row[0]
+
+    def put(self, key: str, provider: str, model: Optional[str], response: str, latency: float) -> None:
+        """Store a response and the seconds the provider took to produce it"""
+        if not self.enabled or not response:
+            return
+
+        now = time.time()
+        with self._lock:
+            try:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO completions "
+                    "(key, provider, model, response, latency, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, provider, model, response, latency, now, now)
+                )
+                self._evict(now)
+                self.conn.commit()
+            except Exception as e:
+                logger.warning(f"Could not cache completion: {str(e)}")
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the cap (caller holds the lock)"""
+        self.conn.execute("DELETE FROM completions WHERE stored_at < ?", (now - self.ttl,))
+        excess = self.conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                "DELETE FROM completions WHERE key IN "
+                "(SELECT key FROM completions ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,)
+            )
+
+    def stats(self) -> Dict:
+        """Get hit/miss counts, provider seconds saved and entry count"""
+        entries = 0
+        if self.enabled:
+            with self._lock:
+                entries = self.conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'latency_saved': round(self.latency_saved, 3),
+            'entries': entries,
+        }
+
+    def log_stats(self) -> None:
+        """Log cache effectiveness for this run"""
+        stats = self.stats()
+        if stats['hits'] or stats['misses']:
+            logger.info(f"🗃️ Completion cache: {stats['hits']} hits, {stats['misses']} misses, "
+                        f"{stats['latency_saved']:.1f}s of provider time saved")
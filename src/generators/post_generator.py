@@ -1,25 +1,130 @@
 """
 Post Generator - creates SEO-optimized LinkedIn posts using AI
 """
-from typing import Dict, List
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+import asyncio
+import json
 import os
+import re
+import time
 from loguru import logger
 import random
 from datetime import datetime
 
+from src.generators.call_metrics import count_tokens, summarize_calls
+from src.generators.completion_cache import CompletionCache
+from src.scrapers.rate_limiter import TokenBucket
+
+SYSTEM_PROMPT = "You are a professional LinkedIn content creator who writes engaging, SEO-optimized posts."
+MAX_OUTPUT_TOKENS = 300
+TEMPERATURE = 0.7
+
+DEFAULT_GENERATION_CONFIG = {
+    'max_concurrency': 4,        # Provider calls in flight at once in generate_posts
+    'requests_per_minute': {     # Per provider; keep at or below your account's limit
+        'openai': 60,
+        'anthropic': 50,
+        'gemini': 15,
+    },
+    'batch_size': 1,             # Topics per request in generate_posts (1 = one prompt per topic)
+    'early_cutoff': True,        # Stop streaming a post once it passes post_length.max words
+    'max_retries': 2,            # Retries of a failed call on rate limits, timeouts and 5xx
+    'retry_backoff': 1.0,        # Seconds before the first retry, doubled for each next one
+}
+
+_JSON_OBJECT = re.compile(r'\{[^{}]*\}')
+_WORD = re.compile(r'\S+')
+_SENTENCE_END = re.compile(r'[.!?][)"\'\u201d]*(?=\s|$)')
+_TRANSIENT_STATUS = {408, 409, 429}
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a provider error is worth retrying (rate limit, timeout, overload, connection)"""
+    # OpenAI and Anthropic errors carry `status_code`, Google API errors `code`
+    status = getattr(error, 'status_code', None) or getattr(error, 'code', None)
+    if isinstance(status, int):
+        return status in _TRANSIENT_STATUS or status >= 500
+    name = type(error).__name__
+    return isinstance(error, (ConnectionError, TimeoutError)) or 'Timeout' in name or 'Connection' in name
+
+
+class _StreamReader:
+    """Collects streamed text, timing the first token and stopping past a word limit"""
+    
+    def __init__(self, word_limit: Optional[int]):
+        self.word_limit = word_limit
+        self.started = time.perf_counter()
+        self.first_token = None
+        self.text = ''
+        self.cut_off = False
+    
+    def add(self, delta: str) -> bool:
+        """Append a text delta; True once the text is past the word limit"""
+        if not delta:
+            return False
+        if self.first_token is None:
+            self.first_token = time.perf_counter()
+        self.text += delta
+        if self.word_limit and len(self.text.split()) > self.word_limit:
+            self.cut_off = True
+        return self.cut_off
+
 
 class PostGenerator:
     """Generates LinkedIn posts from topics using AI"""
     
-    def __init__(self, config: Dict):
-        """Initialize post generator"""
+    def __init__(self, config: Dict, db_manager=None):
+        """Initialize post generator (per-call metrics are stored when a db_manager is given)"""
         self.config = config
+        self.db_manager = db_manager
         self.content_config = config.get('content', {})
         self.seo_config = config.get('seo', {})
+        self.generation_config = {
+            **DEFAULT_GENERATION_CONFIG,
+            **self.content_config.get('generation', {})
+        }
+        # Provider SDKs are imported and configured on first use of `client`
+        self._client = None
+        # Async counterpart of `client` used by generate_posts
+        self._async_client = None
+        self._clients_loaded = False
+        self.model = None
         
         # Determine AI provider
         self.ai_provider = os.getenv('AI_PROVIDER', 'gemini')
         
+        # Requests per minute as a token bucket shared by every call to the provider
+        rpm = {
+            **DEFAULT_GENERATION_CONFIG['requests_per_minute'],
+            **self.generation_config['requests_per_minute']
+        }.get(self.ai_provider, 60)
+        self.max_concurrency = max(1, self.generation_config['max_concurrency'])
+        self.batch_size = max(1, self.generation_config['batch_size'])
+        self.rate_limit = TokenBucket(rpm / 60.0, min(self.max_concurrency, rpm))
+        self.max_retries = max(0, self.generation_config['max_retries'])
+        # Latency and token counts of each provider call, saved by generate_post(s)
+        self.calls: List[Dict] = []
+        # Identical requests (reruns, re-picked topics) are answered from disk
+        self.cache = CompletionCache.from_config(config)
+    
+    @property
+    def client(self):
+        """Provider client (None if unavailable), created on first use"""
+        self._load_clients()
+        return self._client
+    
+    @property
+    def async_client(self):
+        """Async provider client (None if unavailable), created on first use"""
+        self._load_clients()
+        return self._async_client
+    
+    def _load_clients(self) -> None:
+        """Import and configure the provider SDK once"""
+        if self._clients_loaded:
+            return
+        self._clients_loaded = True
+        
         if self.ai_provider == 'openai':
             self._init_openai()
         elif self.ai_provider == 'anthropic':
@@ -32,18 +137,20 @@ class PostGenerator:
     def _init_openai(self):
         """Initialize OpenAI client"""
         try:
-            from openai import OpenAI
+            from openai import AsyncOpenAI, OpenAI
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
-                self.client = OpenAI(api_key=api_key)
+                # Retries are ours (_complete), so they are counted and rate limited
+                self._client = OpenAI(api_key=api_key, max_retries=0)
+                self._async_client = AsyncOpenAI(api_key=api_key, max_retries=0)
                 self.model = os.getenv('AI_MODEL', 'gpt-4-turbo')
                 logger.info("✅ OpenAI client initialized")
             else:
                 logger.warning("OpenAI API key not found")
-                self.client = None
+                self._client = None
         except ImportError:
             logger.warning("OpenAI package not installed")
-            self.client = None
+            self._client = None
     
     def _init_anthropic(self):
         """Initialize Anthropic client"""
@@ -51,15 +158,16 @@ class PostGenerator:
             import anthropic
             api_key = os.getenv('ANTHROPIC_API_KEY')
             if api_key:
-                self.client = anthropic.Anthropic(api_key=api_key)
+                self._client = anthropic.Anthropic(api_key=api_key, max_retries=0)
+                self._async_client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
                 self.model = os.getenv('AI_MODEL', 'claude-3-sonnet-20240229')
                 logger.info("✅ Anthropic client initialized")
             else:
                 logger.warning("Anthropic API key not found")
-                self.client = None
+                self._client = None
         except ImportError:
             logger.warning("Anthropic package not installed")
-            self.client = None
+            self._client = None
     
     def _init_gemini(self):
         """Initialize Google Gemini client"""
@@ -80,20 +188,22 @@ class PostGenerator:
                     HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE
                 }
                 
-                self.client = genai.GenerativeModel(
+                self._client = genai.GenerativeModel(
                     self.model,
                     safety_settings=safety_settings
                 )
+                # The same model object has generate_content_async
+                self._async_client = self._client
                 logger.info(f"✅ Gemini client initialized with model: {self.model}")
             else:
                 logger.warning("Gemini API key not found")
-                self.client = None
+                self._client = None
         except ImportError:
             logger.warning("Google Generative AI package not installed")
-            self.client = None
+            self._client = None
         except Exception as e:
             logger.error(f"Error initializing Gemini: {str(e)}")
-            self.client = None
+            self._client = None
     
     def generate_post(self, topic: Dict) -> Dict:
         """Generate a complete LinkedIn post from a topic"""
@@ -104,7 +214,50 @@ class PostGenerator:
             content = self._generate_with_ai(topic)
         else:
             content = self._generate_fallback(topic)
+        self.save_call_metrics()
+        
+        return self._build_post(topic, content)
+    
+    def generate_posts(self, topics: List[Dict]) -> List[Dict]:
+        """Generate posts for several topics with concurrent provider calls (same order as topics)"""
+        if not topics:
+            return []
+        if not self.async_client:
+            return [self.generate_post(topic) for topic in topics]
+        
+        started = time.perf_counter()
+        posts = asyncio.run(self.agenerate_posts(topics))
+        logger.info(f"⚡ Generated {len(posts)} posts in {time.perf_counter() - started:.1f}s "
+                    f"(up to {self.max_concurrency} concurrent {self.ai_provider} calls)")
+        self.cache.log_stats()
+        self.save_call_metrics(log_summary=True)
+        return posts
+    
+    async def agenerate_posts(self, topics: List[Dict]) -> List[Dict]:
+        """Async generate_posts: every request is started at once, throttled by concurrency and RPM
+        
+        With `batch_size` > 1, consecutive topics share one request.
+        """
+        slots = asyncio.Semaphore(self.max_concurrency)
         
+        async def generate(group: List[Dict]) -> List[str]:
+            for topic in group:
+                logger.info(f"✍️ Generating post for: {topic.get('title', 'Unknown')}")
+            if len(group) == 1:
+                return [await self._agenerate_with_ai(group[0], slots)]
+            return await self._agenerate_batch(group, slots)
+        
+        groups = [topics[start:start + self.batch_size] for start in range(0, len(topics), self.batch_size)]
+        # gather returns results in argument order, whatever order calls finish in
+        contents = await asyncio.gather(*(generate(group) for group in groups))
+        return [
+            self._build_post(topic, content)
+            for group, group_contents in zip(groups, contents)
+            for topic, content in zip(group, group_contents)
+        ]
+    
+    def _build_post(self, topic: Dict, content: str) -> Dict:
+        """Assemble a post record from its topic and generated content"""
         # Generate hashtags
         hashtags = self._generate_hashtags(topic)
         
@@ -126,76 +279,397 @@ class PostGenerator:
         return post
     
     def _generate_with_ai(self, topic: Dict) -> str:
-        """Generate post content using AI"""
+        """Generate post content using AI (cached)"""
         prompt = self._create_prompt(topic)
+        key = self._cache_key(prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
         
         try:
-            if self.ai_provider == 'openai':
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are a professional LinkedIn content creator who writes engaging, SEO-optimized posts."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=300,
-                    temperature=0.7
-                )
-                return response.choices[0].message.content.strip()
-            
-            elif self.ai_provider == 'anthropic':
-                message = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=300,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
-                )
-                return message.content[0].text.strip()
-            
-            elif self.ai_provider == 'gemini':
-                response = self.client.generate_content(
-                    prompt,
-                    generation_config={
-                        'temperature': 0.7,
-                        'max_output_tokens': 300,
-                    }
-                )
-                return response.text.strip()
+            content, latency = self._complete(prompt)
+            self.cache.put(key, self.ai_provider, self.model, content, latency)
+            return content
+        except Exception as e:
+            logger.error(f"AI generation failed: {str(e)}")
+            return self._generate_fallback(topic)
+    
+    async def _agenerate_with_ai(self, topic: Dict, slots: asyncio.Semaphore) -> str:
+        """Generate post content with the async client; only cache misses take a slot and RPM token"""
+        prompt = self._create_prompt(topic)
+        key = self._cache_key(prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
         
+        try:
+            async with slots:
+                content, latency = await self._acomplete(prompt)
+            self.cache.put(key, self.ai_provider, self.model, content, latency)
+            return content
         except Exception as e:
             logger.error(f"AI generation failed: {str(e)}")
             return self._generate_fallback(topic)
     
+    async def _agenerate_batch(self, topics: List[Dict], slots: asyncio.Semaphore) -> List[str]:
+        """Generate several posts with one JSON request; items missing from the reply fall back"""
+        prompt = self._create_batch_prompt(topics)
+        max_tokens = MAX_OUTPUT_TOKENS * len(topics)
+        key = self._cache_key(prompt, max_tokens, json_mode=True)
+        text = self.cache.get(key)
+        
+        if text is None:
+            try:
+                async with slots:
+                    text, latency = await self._acomplete(prompt, max_tokens, json_mode=True)
+            except Exception as e:
+                logger.error(f"Batched AI generation failed: {str(e)}")
+                text, latency = '', None
+            posts = self._parse_batch(text, len(topics))
+            # Only complete replies are cached; a partial one would keep falling back
+            if latency is not None and all(posts):
+                self.cache.put(key, self.ai_provider, self.model, text, latency)
+        else:
+            posts = self._parse_batch(text, len(topics))
+        
+        missing = sum(1 for post in posts if not post)
+        if missing:
+            logger.warning(f"Batched reply lacked {missing} of {len(topics)} posts; using fallback for those")
+        return [post or self._generate_fallback(topic) for topic, post in zip(topics, posts)]
+    
+    @staticmethod
+    def _parse_batch(text: str, count: int) -> List[Optional[str]]:
+        """Posts by topic number from a batched JSON reply (None where missing or malformed)
+        
+        Accepts {"posts": [...]} or a bare list, entries as {"id", "post"}
+        objects or strings, with or without code fences. If the JSON doesn't
+        parse (e.g. the reply was cut off), each complete {...} entry is
+        salvaged on its own.
+        """
+        posts: List[Optional[str]] = [None] * count
+        if not text:
+            return posts
+        
+        # Outermost JSON value, ignoring code fences or prose around it
+        start = min((i for i in (text.find('{'), text.find('[')) if i >= 0), default=-1)
+        end = max(text.rfind('}'), text.rfind(']'))
+        try:
+            data = json.loads(text[start:end + 1]) if 0 <= start < end else None
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            data = data.get('posts')
+        if not isinstance(data, list):
+            data = []
+            for match in _JSON_OBJECT.finditer(text):
+                try:
+                    data.append(json.loads(match.group()))
+                except ValueError:
+                    continue
+        
+        for position, entry in enumerate(data):
+            index = position
+            if isinstance(entry, dict):
+                try:
+                    index = int(entry.get('id', position + 1)) - 1
+                except (TypeError, ValueError):
+                    continue
+                entry = entry.get('post')
+            if isinstance(entry, str) and entry.strip() and 0 <= index < count and posts[index] is None:
+                posts[index] = entry.strip()
+        return posts
+    
+    def _cache_key(self, prompt: str, max_tokens: int = MAX_OUTPUT_TOKENS, json_mode: bool = False) -> str:
+        """Completion cache key of a prompt for the configured provider and model"""
+        return self.cache.key(self.ai_provider, self.model, prompt, {
+            'system': SYSTEM_PROMPT,
+            'max_tokens': max_tokens,
+            'temperature': TEMPERATURE,
+            **({'json': True} if json_mode else {}),
+        })
+    
+    def _complete(self, prompt: str, max_tokens: int = MAX_OUTPUT_TOKENS, json_mode: bool = False) -> tuple:
+        """Stream a completion, retrying transient errors; returns (text, seconds the provider took)
+        
+        Each call's time to first token, latency, token counts and retries
+        are recorded in `self.calls`.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limit.acquire()
+            reader = _StreamReader(self._word_limit(json_mode))
+            stream = self._stream(prompt, max_tokens, json_mode)
+            try:
+                for delta in stream:
+                    if reader.add(delta):
+                        break
+            except Exception as e:
+                if attempt == self.max_retries or not _is_transient(e):
+                    self._record_call(prompt, json_mode, reader, attempt, e)
+                    raise
+                time.sleep(self._retry_delay(attempt, e))
+                continue
+            finally:
+                stream.close()
+            call = self._record_call(prompt, json_mode, reader, attempt)
+            return self._finish_text(reader), call['latency']
+    
+    async def _acomplete(self, prompt: str, max_tokens: int = MAX_OUTPUT_TOKENS, json_mode: bool = False) -> tuple:
+        """Async _complete using the provider's async client"""
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limit.aacquire()
+            reader = _StreamReader(self._word_limit(json_mode))
+            stream = self._astream(prompt, max_tokens, json_mode)
+            try:
+                async for delta in stream:
+                    if reader.add(delta):
+                        break
+            except Exception as e:
+                if attempt == self.max_retries or not _is_transient(e):
+                    self._record_call(prompt, json_mode, reader, attempt, e)
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, e))
+                continue
+            finally:
+                # Breaking out of `async for` doesn't close the generator (or the connection)
+                await stream.aclose()
+            call = self._record_call(prompt, json_mode, reader, attempt)
+            return self._finish_text(reader), call['latency']
+    
+    def _stream(self, prompt: str, max_tokens: int, json_mode: bool) -> Iterator[str]:
+        """Completion text as it arrives from the provider's streaming API"""
+        if self.ai_provider == 'openai':
+            stream = self.client.chat.completions.create(
+                **self._openai_request(prompt, max_tokens, json_mode), stream=True
+            )
+            try:
+                for chunk in stream:
+                    if chunk.choices:
+                        yield chunk.choices[0].delta.content or ''
+            finally:
+                stream.response.close()
+        
+        elif self.ai_provider == 'anthropic':
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            ) as stream:
+                yield from stream.text_stream
+        
+        elif self.ai_provider == 'gemini':
+            response = self.client.generate_content(
+                prompt,
+                generation_config=self._gemini_config(max_tokens, json_mode),
+                stream=True
+            )
+            for chunk in response:
+                # The closing chunk may carry only the finish reason
+                if chunk.parts:
+                    yield chunk.text
+        
+        else:
+            raise ValueError(f"Unsupported AI provider: {self.ai_provider}")
+    
+    async def _astream(self, prompt: str, max_tokens: int, json_mode: bool) -> AsyncIterator[str]:
+        """Async _stream using the provider's async client"""
+        if self.ai_provider == 'openai':
+            stream = await self.async_client.chat.completions.create(
+                **self._openai_request(prompt, max_tokens, json_mode), stream=True
+            )
+            try:
+                async for chunk in stream:
+                    if chunk.choices:
+                        yield chunk.choices[0].delta.content or ''
+            finally:
+                await stream.response.aclose()
+        
+        elif self.ai_provider == 'anthropic':
+            async with self.async_client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        
+        elif self.ai_provider == 'gemini':
+            response = await self.async_client.generate_content_async(
+                prompt,
+                generation_config=self._gemini_config(max_tokens, json_mode),
+                stream=True
+            )
+            async for chunk in response:
+                if chunk.parts:
+                    yield chunk.text
+        
+        else:
+            raise ValueError(f"Unsupported AI provider: {self.ai_provider}")
+    
+    def _word_limit(self, json_mode: bool) -> Optional[int]:
+        """Words after which a streamed post is cut off (None for batched JSON replies)"""
+        if json_mode or not self.generation_config['early_cutoff']:
+            return None
+        return self.content_config.get('post_length', {}).get('max', 150)
+    
+    def _finish_text(self, reader: _StreamReader) -> str:
+        """Completion text; a cut-off post is trimmed to the word limit, at a sentence end if one is close"""
+        text = reader.text.strip()
+        if not reader.cut_off:
+            return text
+        
+        words = list(_WORD.finditer(text))
+        text = text[:words[reader.word_limit - 1].end()]
+        min_words = self.content_config.get('post_length', {}).get('min', 100)
+        sentence_ends = list(_SENTENCE_END.finditer(text))
+        if sentence_ends:
+            trimmed = text[:sentence_ends[-1].end()]
+            if len(trimmed.split()) >= min_words:
+                text = trimmed
+        logger.debug(f"✂️ Stopped streaming at {reader.word_limit} words; kept {len(text.split())}")
+        return text
+    
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Exponential backoff before retrying a failed call"""
+        delay = self.generation_config['retry_backoff'] * (2 ** attempt)
+        logger.warning(f"🔁 {self.ai_provider} call failed ({str(error)}); "
+                       f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+        return delay
+    
+    def _record_call(self, prompt: str, json_mode: bool, reader: _StreamReader,
+                     retries: int, error: Optional[Exception] = None) -> Dict:
+        """Record the latency and token counts of a provider call (timed on its final attempt)"""
+        # Only OpenAI requests include the system prompt
+        sent = f"{SYSTEM_PROMPT}\n{prompt}" if self.ai_provider == 'openai' else prompt
+        call = {
+            'provider': self.ai_provider,
+            'model': self.model,
+            'kind': 'batch' if json_mode else 'post',
+            'ttft': reader.first_token - reader.started if reader.first_token else None,
+            'latency': time.perf_counter() - reader.started,
+            'input_tokens': count_tokens(sent, self.model),
+            # Tokens received (billed), including any past the cutoff
+            'output_tokens': count_tokens(reader.text, self.model),
+            'retries': retries,
+            'cut_off': int(reader.cut_off),
+            'error': str(error) if error else None,
+            'created_at': datetime.now().isoformat(),
+        }
+        self.calls.append(call)
+        return call
+    
+    def save_call_metrics(self, log_summary: bool = False) -> None:
+        """Store the recorded provider calls and clear them, optionally logging per-model stats"""
+        if not self.calls:
+            return
+        calls, self.calls = self.calls, []
+        
+        if log_summary:
+            for stats in summarize_calls(calls):
+                ttft = f"{stats['ttft_p50']:.2f}s" if stats['ttft_p50'] is not None else 'n/a'
+                latency = f"{stats['latency_p50']:.2f}s" if stats['latency_p50'] is not None else 'n/a'
+                logger.info(f"📡 {stats['provider']}/{stats['model']}: {stats['calls']} calls, "
+                            f"TTFT p50 {ttft}, latency p50 {latency}, "
+                            f"{stats['input_tokens']} in / {stats['output_tokens']} out tokens, "
+                            f"{stats['retries']} retries, {stats['cut_off']} cut off, {stats['errors']} failed")
+        if self.db_manager:
+            self.db_manager.save_llm_calls(calls)
+    
+    def _openai_request(self, prompt: str, max_tokens: int, json_mode: bool) -> Dict:
+        """Chat completion arguments; JSON mode constrains the reply to a JSON object"""
+        request = {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'max_tokens': max_tokens,
+            'temperature': TEMPERATURE,
+        }
+        if json_mode:
+            request['response_format'] = {"type": "json_object"}
+        return request
+    
+    @staticmethod
+    def _gemini_config(max_tokens: int, json_mode: bool) -> Dict:
+        """Gemini generation config; JSON mode sets the response MIME type"""
+        generation_config = {
+            'temperature': TEMPERATURE,
+            'max_output_tokens': max_tokens,
+        }
+        if json_mode:
+            generation_config['response_mime_type'] = 'application/json'
+        return generation_config
+    
     def _create_prompt(self, topic: Dict) -> str:
         """Create prompt for AI generation"""
-        post_length = self.content_config.get('post_length', {})
-        min_length = post_length.get('min', 100)
-        max_length = post_length.get('max', 150)
-        
         prompt = f"""Create a professional LinkedIn post about this topic:
 
-Title: {topic.get('title', '')}
+{self._topic_details(topic)}
+Requirements:
+{self._requirements()}
+
+Write only the post content, no hashtags (those will be added separately)."""
+        
+        return prompt
+    
+    def _create_batch_prompt(self, topics: List[Dict]) -> str:
+        """Create one prompt asking for a post per topic as JSON (requirements stated once)"""
+        sections = '\n'.join(
+            f"Topic {number}:\n{self._topic_details(topic)}"
+            for number, topic in enumerate(topics, 1)
+        )
+        
+        prompt = f"""Create {len(topics)} professional LinkedIn posts, one for each topic below.
+
+{sections}
+Requirements for each post:
+{self._requirements()}
+
+Write only the post content, no hashtags (those will be added separately).
+Respond with JSON only, in this format, with one entry per topic where "id" is the topic number:
+{{"posts": [{{"id": 1, "post": "..."}}, {{"id": 2, "post": "..."}}]}}"""
+        
+        return prompt
+    
+    def _topic_details(self, topic: Dict) -> str:
+        """Prompt lines describing a topic"""
+        return f"""Title: {topic.get('title', '')}
 Summary: {topic.get('summary', '')}
 Source: {topic.get('source', '')}
-
-Requirements:
-- Length: {min_length}-{max_length} words
+{self._body_excerpt(topic)}"""
+    
+    def _requirements(self) -> str:
+        """Requirement bullets shared by single and batched prompts"""
+        post_length = self.content_config.get('post_length', {})
+        min_length = post_length.get('min', 100)
+        max_length = post_length.get('max', 150)
+        
+        return f"""- Length: {min_length}-{max_length} words
 - Start with a catchy hook line
 - Include key insights in plain language
 - Professional, insightful, and slightly conversational tone
 - End with a one-line call to action (question to engage readers)
 - Naturally include SEO keywords
 - Avoid clickbait or sensationalism
-- Focus on value for professionals and creators
-
-Write only the post content, no hashtags (those will be added separately)."""
-        
-        return prompt
+- Focus on value for professionals and creators"""
+    
+    def _body_excerpt(self, topic: Dict) -> str:
+        """Prompt section with the extracted article body, if any"""
+        body = topic.get('body', '')
+        if not body:
+            return ''
+        return f"Article excerpt:\n{body[:1500]}\n"
     
     def _generate_fallback(self, topic: Dict) -> str:
         """Generate post without AI (fallback)"""
         title = topic.get('title', '')
         summary = topic.get('summary', '')
+        if len(summary) < 200 and topic.get('body'):
+            summary = ' '.join(topic['body'].split())
         
         hooks = [
             "Here's something you need to know:",
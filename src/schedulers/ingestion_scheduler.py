@@ -0,0 +1,165 @@
+"""
+Ingestion Scheduler - polls each source on its own adaptive interval
+"""
+from typing import Dict, List, Optional
+from loguru import logger
+from datetime import datetime, timedelta
+from pathlib import Path
+import json
+import threading
+import time
+
+from src.analyzers.trend_tracker import TrendTracker
+from src.database.db_manager import ArticleBatchWriter, DatabaseManager
+from src.utils.shared_state import save_json_atomic
+
+DEFAULT_INGESTION_CONFIG = {
+    'enabled': False,
+    'default_interval': 1800,   # Seconds between polls unless a source sets `poll_interval`
+    'min_interval': 300,
+    'max_interval': 21600,
+    'target_new': 3,            # New articles per poll the interval adapts towards
+    'fresh_hours': 24,          # Age of stored articles the daily run considers
+    'state_path': 'data/cache/poll_state.json',
+}
+
+
+class IngestionScheduler:
+    """Background loop that scrapes sources independently and stores scored articles"""
+
+    def __init__(self, config: Dict, scraper_manager, topic_analyzer,
+                 db_manager: Optional[DatabaseManager] = None):
+        """Initialize scheduler and restore per-source intervals"""
+        self.config = config
+        self.ingestion_config = {**DEFAULT_INGESTION_CONFIG, **config.get('ingestion', {})}
+        self.enabled = self.ingestion_config['enabled']
+        self.scraper_manager = scraper_manager
+        self.topic_analyzer = topic_analyzer
+        # Own connection: polling runs on a background thread
+        self.db_manager = db_manager or DatabaseManager()
+        self.trends = TrendTracker(config, self.db_manager)
+
+        self.state_path = Path(self.ingestion_config['state_path'])
+        self.state: Dict[str, Dict] = self._load_state()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _load_state(self) -> Dict[str, Dict]:
+        """Load intervals and next poll times from the last run"""
+        if not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load poll state {self.state_path}: {str(e)}")
+            return {}
+
+    def _save_state(self) -> None:
+        """Persist poll state atomically"""
+        try:
+            save_json_atomic(self.state_path, self.state, indent=2)
+        except Exception as e:
+            logger.warning(f"Could not save poll state {self.state_path}: {str(e)}")
+
+    def _source_state(self, name: str) -> Dict:
+        """Get (or create) the poll state of a source"""
+        if name not in self.state:
+            source_config = self.scraper_manager.sources_config.get(name) or {}
+            interval = source_config.get('poll_interval', self.ingestion_config['default_interval'])
+            self.state[name] = {'interval': interval, 'next_poll': 0.0, 'last_new': 0}
+        return self.state[name]
+
+    def _adapt_interval(self, name: str, new_count: int) -> float:
+        """Poll busy sources sooner and quiet ones less often"""
+        state = self._source_state(name)
+        source_config = self.scraper_manager.sources_config.get(name) or {}
+        min_interval = source_config.get('min_poll_interval', self.ingestion_config['min_interval'])
+        max_interval = source_config.get('max_poll_interval', self.ingestion_config['max_interval'])
+
+        if new_count == 0:
+            factor = 1.5
+        else:
+            # A full page of new items means some may have been missed: halve
+            factor = min(1.5, max(0.5, self.ingestion_config['target_new'] / new_count))
+
+        state['interval'] = min(max_interval, max(min_interval, state['interval'] * factor))
+        return state['interval']
+
+    def due_sources(self, now: Optional[float] = None) -> List[str]:
+        """Enabled sources whose next poll time has passed"""
+        now = now if now is not None else time.time()
+        return [
+            name for name in self.scraper_manager.registry.enabled_sources()
+            if self._source_state(name)['next_poll'] <= now
+        ]
+
+    def poll(self, name: str) -> int:
+        """Poll one source, score and store its new articles; return how many were new"""
+        try:
+            articles = self.scraper_manager.poll_source(name)
+        except Exception as e:
+            logger.error(f"  ✗ {name}: poll failed - {str(e)}")
+            articles = []
+
+        scored_articles = []
+        with ArticleBatchWriter(self.db_manager) as writer:
+            for article in articles:
+                score = self.topic_analyzer.score_article(article)
+                scored_articles.append({**article, 'relevance_score': score})
+                writer.add(scored_articles[-1])
+        self.scraper_manager.save_feed_state()
+        self.trends.observe(articles)
+        self.topic_analyzer.cluster_articles(scored_articles)
+
+        state = self._source_state(name)
+        interval = self._adapt_interval(name, len(articles))
+        state['last_new'] = len(articles)
+        state['next_poll'] = time.time() + interval
+        self._save_state()
+
+        logger.info(f"  📥 {name}: {len(articles)} new articles, next poll in {interval / 60:.0f} min")
+        return len(articles)
+
+    def run_pending(self) -> int:
+        """Poll every due source once; return the number of new articles stored"""
+        with self._lock:
+            return sum(self.poll(name) for name in self.due_sources())
+
+    def seconds_until_next_poll(self) -> float:
+        """Time until the earliest scheduled poll"""
+        sources = self.scraper_manager.registry.enabled_sources()
+        if not sources:
+            return self.ingestion_config['max_interval']
+        next_poll = min(self._source_state(name)['next_poll'] for name in sources)
+        return max(0.0, next_poll - time.time())
+
+    def fresh_articles(self) -> List[Dict]:
+        """Stored articles from the freshness window that no post has used"""
+        since = datetime.now() - timedelta(hours=self.ingestion_config['fresh_hours'])
+        return self.db_manager.get_fresh_articles(since.isoformat())
+
+    def _run(self) -> None:
+        """Polling loop"""
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                logger.error(f"❌ Ingestion loop error: {str(e)}")
+            self._stop.wait(min(60.0, self.seconds_until_next_poll()))
+
+    def start(self) -> None:
+        """Start polling on a background thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='ingestion', daemon=True)
+        self._thread.start()
+        logger.info("✅ Started per-source ingestion polling")
+
+    def stop(self) -> None:
+        """Stop the polling thread"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
@@ -0,0 +1,158 @@
+"""
+Article extractor - fetches and extracts full article bodies for shortlisted topics
+"""
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import TimeoutError
+from multiprocessing.pool import Pool
+import time
+
+from loguru import logger
+
+from src.scrapers.circuit_breaker import CircuitBreaker, get_source_health, guarded_get
+from src.scrapers.http_session import get_transport
+from src.scrapers.response_cache import ResponseCache, get_response_cache
+
+DEFAULT_EXTRACTION_CONFIG = {
+    'enabled': False,
+    'workers': 2,               # Extraction processes
+    'time_budget': 15,          # Seconds per article, fetch + extraction
+    'max_chars': 5000,          # Body text kept per article
+    'min_paragraph_chars': 40,  # Shorter blocks are treated as boilerplate (lxml fallback)
+    'cache_path': 'data/cache/bodies',
+    'cache_ttl': 604800,        # Extracted bodies rarely change; keep them a week
+}
+
+# Elements that never hold the article body
+BOILERPLATE_TAGS = ('script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'figure')
+
+
+def extract_main_text(html: bytes, url: str = '', min_paragraph_chars: int = 40) -> str:
+    """Extract the main text of an article page (runs in a worker process)"""
+    try:
+        from newspaper import Article
+
+        article = Article(url or 'http://localhost/')
+        article.download(input_html=html.decode('utf-8', errors='replace'))
+        article.parse()
+        if article.text:
+            return article.text.strip()
+    except ImportError:
+        pass
+    except Exception:
+        pass
+
+    return _extract_with_lxml(html, min_paragraph_chars)
+
+
+def _extract_with_lxml(html: bytes, min_paragraph_chars: int) -> str:
+    """Paragraph-density fallback: keep substantial <p> blocks from the densest container"""
+    import lxml.html
+
+    try:
+        root = lxml.html.fromstring(html)
+    except Exception:
+        return ''
+
+    for element in root.iter(*BOILERPLATE_TAGS):
+        element.drop_tree()
+
+    # Group paragraphs by parent and keep the container holding the most text
+    containers: Dict = {}
+    for paragraph in root.iter('p'):
+        text = ' '.join(paragraph.text_content().split())
+        if len(text) >= min_paragraph_chars:
+            containers.setdefault(paragraph.getparent(), []).append(text)
+
+    if not containers:
+        return ''
+    best = max(containers.values(), key=lambda texts: sum(len(text) for text in texts))
+    return '\n\n'.join(best)
+
+
+class ArticleExtractor:
+    """Optional pipeline stage adding a `body` to top-scored articles"""
+
+    def __init__(self, config: Dict):
+        """Initialize from the `scraping.body_extraction` config section"""
+        # Per-source breaker overrides, keyed by the `source` name articles carry
+        self.breaker_overrides = {
+            source.get('name'): source.get('circuit_breaker', {})
+            for source in config.get('sources', {}).values() if source
+        }
+        self.extraction_config = {
+            **DEFAULT_EXTRACTION_CONFIG,
+            **config.get('scraping', {}).get('body_extraction', {}),
+        }
+        self.enabled = self.extraction_config['enabled']
+        self.offline = get_response_cache().offline
+        self.body_cache = ResponseCache(
+            path=self.extraction_config['cache_path'],
+            enabled=self.enabled,
+            default_ttl=self.extraction_config['cache_ttl'],
+            max_size_mb=50,
+        )
+
+    def enrich(self, articles: List[Dict]) -> List[Dict]:
+        """Add `body` to each article in place; articles over budget keep only their summary"""
+        if not self.enabled or not articles:
+            return articles
+
+        started = time.perf_counter()
+        ttl = None if self.offline else self.body_cache.default_ttl
+        pending = []
+        for article in articles:
+            url = article.get('url', '')
+            cached = self.body_cache.get(url, ttl=ttl) if url else None
+            if cached is not None:
+                article['body'] = cached.decode('utf-8')
+            elif url and not self.offline:
+                pending.append(article)
+
+        if pending:
+            # Leaving the block terminates the workers, including extractions that blew their budget
+            with Pool(processes=self.extraction_config['workers']) as processes:
+                with ThreadPoolExecutor(max_workers=len(pending)) as threads:
+                    bodies = list(threads.map(lambda article: self._extract(article, processes), pending))
+            get_source_health().save()
+
+            for article, body in zip(pending, bodies):
+                if body:
+                    article['body'] = body
+                    self.body_cache.put(article['url'], body.encode('utf-8'))
+
+        extracted = sum(1 for article in articles if article.get('body'))
+        logger.info(f"📖 Extracted {extracted}/{len(articles)} article bodies "
+                    f"in {time.perf_counter() - started:.1f}s")
+        return articles
+
+    def _breaker(self, article: Dict) -> CircuitBreaker:
+        """Circuit breaker of the article's source, shared with its scraper"""
+        source = article.get('source', 'Unknown')
+        return get_source_health().breaker(source, self.breaker_overrides.get(source))
+
+    def _extract(self, article: Dict, processes: Pool) -> Optional[str]:
+        """Fetch one article and extract its body within the time budget"""
+        url = article['url']
+        budget = self.extraction_config['time_budget']
+        deadline = time.monotonic() + budget
+
+        transport = get_transport()
+        response = guarded_get(self._breaker(article), transport, url,
+                               timeout=min(budget, transport.timeout_for(url)))
+        if response is None:
+            return None
+
+        try:
+            result = processes.apply_async(
+                extract_main_text, (response.content, url, self.extraction_config['min_paragraph_chars'])
+            )
+            body = result.get(timeout=max(0.0, deadline - time.monotonic()))
+        except TimeoutError:
+            logger.warning(f"Body extraction over {budget}s budget, skipping: {url}")
+            return None
+        except Exception as e:
+            logger.warning(f"Body extraction failed for {url}: {str(e)}")
+            return None
+
+        return body[:self.extraction_config['max_chars']] if body else None
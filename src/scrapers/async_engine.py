@@ -0,0 +1,92 @@
+"""
+Async scraping engine - bounded-concurrency HTTP fetching for scrapers
+"""
+from typing import Callable, Dict, Optional, TypeVar
+from urllib.parse import urlparse
+import asyncio
+
+import httpx
+from loguru import logger
+
+from src.scrapers.http_session import HttpTransport, get_transport
+
+T = TypeVar('T')
+
+
+class AsyncScrapeEngine:
+    """Runs scraper I/O on one event loop with global and per-host concurrency caps"""
+
+    def __init__(self, max_concurrency: int = 20, per_host_limit: int = 2,
+                 transport: Optional[HttpTransport] = None):
+        """Initialize engine limits (the HTTP client is created on enter)"""
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.transport = transport or get_transport()
+
+        self.client: Optional[httpx.AsyncClient] = None
+        self._global_slots: Optional[asyncio.Semaphore] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'AsyncScrapeEngine':
+        """Build an engine from the `scraping:` config section"""
+        scraping_config = config.get('scraping', {})
+        return cls(
+            max_concurrency=scraping_config.get('max_concurrency', 20),
+            per_host_limit=scraping_config.get('per_host_limit', 2),
+        )
+
+    async def __aenter__(self) -> 'AsyncScrapeEngine':
+        self._global_slots = asyncio.Semaphore(self.max_concurrency)
+        self._host_slots = {}
+        self.client = self.transport.async_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get (or lazily create) the semaphore guarding a host"""
+        host = urlparse(url).netloc.lower()
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_slots[host]
+
+    async def get(self, url: str, headers: Optional[Dict] = None,
+                  timeout: Optional[float] = None) -> Optional[httpx.Response]:
+        """Issue a GET under the concurrency caps; returns None on transport errors"""
+        if self.client is None:
+            raise RuntimeError("AsyncScrapeEngine must be used as an async context manager")
+
+        await self.transport.rate_limiter.aacquire(url)
+        async with self._global_slots, self._host_semaphore(url):
+            try:
+                return await self.client.get(
+                    url,
+                    headers=headers,
+                    timeout=timeout if timeout is not None else self.transport.timeout_for(url),
+                    extensions={'trace': self.transport.trace},
+                )
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {str(e)}")
+                return None
+
+    async def fetch(self, url: str, headers: Optional[Dict] = None,
+                    timeout: Optional[float] = None) -> Optional[bytes]:
+        """Fetch a URL and return the response body, or None on failure"""
+        response = await self.get(url, headers=headers, timeout=timeout)
+        if response is None:
+            return None
+        try:
+            response.raise_for_status()
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {str(e)}")
+            return None
+        return response.content
+
+    async def run_sync(self, url: str, func: Callable[[], T]) -> T:
+        """Run a blocking callable in a worker thread under the host's limits"""
+        async with self._global_slots, self._host_semaphore(url):
+            return await asyncio.to_thread(func)
@@ -3,13 +3,20 @@ Base scraper class with common functionality
 """
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
-import requests
 from bs4 import BeautifulSoup
 from loguru import logger
 import time
+import asyncio
 from datetime import datetime
 import feedparser
 
+from src.scrapers.circuit_breaker import get_source_health, guarded_get
+from src.scrapers.feed_cache import get_feed_cache
+from src.scrapers.feed_parser import FeedFormatError, iter_entries
+from src.scrapers.html_text import clean_text
+from src.scrapers.http_session import USER_AGENT, get_transport
+from src.scrapers.response_cache import get_response_cache
+
 
 class BaseScraper(ABC):
     """Base class for all scrapers"""
@@ -24,68 +31,244 @@ class BaseScraper(ABC):
         self.max_articles = config.get('max_articles', 10)
         
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': USER_AGENT
         }
         
+        # Shared pooled transport; per-source `http:` overrides apply to our hosts
+        self.transport = get_transport()
+        self.transport.register_source(config)
+        self.feed_cache = get_feed_cache()
+        self.response_cache = get_response_cache()
+        self.cache_ttl = config.get('cache_ttl', self.response_cache.default_ttl)
+        self.breaker = get_source_health().breaker(self.name, config.get('circuit_breaker', {}))
+        
         self.article_count = 0
+        # Optional SeenUrlIndex; known URLs are dropped before cleaning
+        self.seen_urls = None
+        # True when the last feed fetch found nothing new (304 or identical body)
+        self.feed_unchanged = False
     
     @abstractmethod
     def scrape(self) -> List[Dict]:
         """Scrape articles from source - must be implemented by subclasses"""
         pass
     
-    def fetch_page(self, url: str, timeout: int = 10) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page"""
+    async def ascrape(self, engine) -> List[Dict]:
+        """Async scrape contract - default shim runs the sync scrape() in a worker thread"""
+        return await engine.run_sync(self.url, self.scrape)
+    
+    def fetch_page(self, url: str, timeout: Optional[float] = None) -> Optional[BeautifulSoup]:
+        """Fetch and parse a web page (served from the response cache when fresh)"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=timeout)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            content = self._cached_page(url)
+            if content is None:
+                if self.response_cache.offline:
+                    logger.warning(f"Offline mode: no cached copy of {url}")
+                    return None
+                response = self._get(url, headers=self.headers, timeout=timeout)
+                if response is None:
+                    return None
+                content = response.content
+                self._store_page(url, content)
+            return BeautifulSoup(content, 'html.parser')
         except Exception as e:
             logger.error(f"Error fetching {url}: {str(e)}")
             return None
     
+    def _get(self, url: str, headers: Optional[Dict] = None, timeout: Optional[float] = None):
+        """GET through the source's circuit breaker; returns a 2xx/304 response or None"""
+        return guarded_get(self.breaker, self.transport, url, headers=headers, timeout=timeout)
+    
+    async def _aget(self, engine, url: str, headers: Optional[Dict] = None,
+                    timeout: Optional[float] = None):
+        """Async GET through the source's circuit breaker; returns a 2xx/304 response or None"""
+        if not self.breaker.allow_request():
+            logger.warning(f"⛔ {self.name}: circuit open, skipping {url}")
+            return None
+        
+        started = time.monotonic()
+        response = await engine.get(url, headers=headers, timeout=timeout)
+        try:
+            if response is None:
+                raise ConnectionError("no response")
+            if response.status_code != 304:
+                response.raise_for_status()
+        except Exception as e:
+            self.breaker.record_failure(time.monotonic() - started)
+            if response is not None:
+                logger.error(f"Error fetching {url}: {str(e)}")
+            return None
+        
+        self.breaker.record_success(response.elapsed.total_seconds())
+        return response
+    
+    def _cached_page(self, url: str) -> Optional[bytes]:
+        """Look up a page in the response cache, honouring the source TTL"""
+        if self.response_cache.offline:
+            return self.response_cache.get(url)
+        if not self.cache_ttl:
+            return None
+        return self.response_cache.get(url, ttl=self.cache_ttl)
+    
+    def _store_page(self, url: str, content: bytes) -> None:
+        """Store a fetched body for later runs and offline mode"""
+        self.response_cache.put(url, content)
+    
     def fetch_rss(self, feed_url: Optional[str] = None) -> List[Dict]:
-        """Fetch articles from RSS feed"""
+        """Fetch new articles from RSS feed using conditional GET"""
         feed_url = feed_url or self.rss_feed
         if not feed_url:
             return []
         
+        self.feed_unchanged = False
+        if self.response_cache.offline:
+            return self._offline_feed(feed_url)
+        
         try:
-            feed = feedparser.parse(feed_url)
-            articles = []
-            
-            for entry in feed.entries[:self.max_articles]:
-                article = {
-                    'title': entry.get('title', ''),
-                    'url': entry.get('link', ''),
-                    'summary': self._clean_text(entry.get('summary', '')),
-                    'published': entry.get('published', datetime.now().isoformat()),
-                    'source': self.name,
-                    'source_url': self.url,
-                    'scraped_at': datetime.now().isoformat()
-                }
-                articles.append(article)
-            
-            self.article_count = len(articles)
-            return articles
-            
+            headers = {**self.headers, **self.feed_cache.conditional_headers(feed_url)}
+            response = self._get(feed_url, headers=headers)
+            if response is None:
+                return []
+            if response.status_code == 304:
+                return self._feed_not_modified(feed_url)
+            self._store_page(feed_url, response.content)
+            return self._process_feed(feed_url, response.content, response.headers)
         except Exception as e:
             logger.error(f"Error fetching RSS from {feed_url}: {str(e)}")
             return []
     
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize text"""
-        if not text:
-            return ""
+    async def afetch_page(self, engine, url: str, timeout: Optional[float] = None) -> Optional[BeautifulSoup]:
+        """Fetch and parse a web page through the async engine"""
+        content = await asyncio.to_thread(self._cached_page, url)
+        if content is None:
+            if self.response_cache.offline:
+                logger.warning(f"Offline mode: no cached copy of {url}")
+                return None
+            response = await self._aget(engine, url, headers=self.headers, timeout=timeout)
+            if response is None:
+                return None
+            content = response.content
+            await asyncio.to_thread(self._store_page, url, content)
+        return await asyncio.to_thread(BeautifulSoup, content, 'html.parser')
+    
+    async def afetch_rss(self, engine, feed_url: Optional[str] = None) -> List[Dict]:
+        """Fetch new articles from RSS feed through the async engine"""
+        feed_url = feed_url or self.rss_feed
+        if not feed_url:
+            return []
+        
+        self.feed_unchanged = False
+        if self.response_cache.offline:
+            return await asyncio.to_thread(self._offline_feed, feed_url)
         
-        # Remove HTML tags
-        soup = BeautifulSoup(text, 'html.parser')
-        text = soup.get_text()
+        headers = {**self.headers, **self.feed_cache.conditional_headers(feed_url)}
+        response = await self._aget(engine, feed_url, headers=headers)
+        if response is None:
+            return []
+        if response.status_code == 304:
+            return self._feed_not_modified(feed_url)
         
-        # Remove extra whitespace
-        text = ' '.join(text.split())
+        try:
+            await asyncio.to_thread(self._store_page, feed_url, response.content)
+            # Parsing is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(
+                self._process_feed, feed_url, response.content, response.headers
+            )
+        except Exception as e:
+            logger.error(f"Error fetching RSS from {feed_url}: {str(e)}")
+            return []
+    
+    def _offline_feed(self, feed_url: str) -> List[Dict]:
+        """Parse the cached copy of a feed without touching the network or feed state"""
+        content = self.response_cache.get(feed_url)
+        if content is None:
+            logger.warning(f"Offline mode: no cached copy of {feed_url}")
+            return []
         
-        return text.strip()
+        articles = self._parse_feed(content)
+        for article in articles:
+            del article['entry_id']
+        return articles
+    
+    def _feed_not_modified(self, feed_url: str) -> List[Dict]:
+        """Handle a feed that has not changed since the last fetch"""
+        logger.debug(f"{self.name}: feed not modified ({feed_url})")
+        self.feed_unchanged = True
+        self.article_count = 0
+        return []
+    
+    def _process_feed(self, feed_url: str, content: bytes, response_headers) -> List[Dict]:
+        """Store validators and parse the feed unless its body is unchanged"""
+        if not self.feed_cache.update_validators(feed_url, response_headers, content):
+            return self._feed_not_modified(feed_url)
+        
+        # Every entry read counts as seen, including skipped ones; parsing stops at
+        # max_articles, so entries further down are left for later polls
+        entry_ids = []
+        articles = self._parse_feed(content, seen=self.feed_cache.seen_entries(feed_url), entry_ids=entry_ids)
+        self.feed_cache.mark_seen(feed_url, entry_ids)
+        for article in articles:
+            del article['entry_id']
+        
+        self.feed_unchanged = not articles
+        return articles
+    
+    def _parse_feed(self, source, seen: Optional[set] = None,
+                    entry_ids: Optional[List[str]] = None) -> List[Dict]:
+        """Parse a raw feed document into article dicts, skipping seen entries
+        
+        If `entry_ids` is given, the id of every entry read is appended to it.
+        """
+        seen = seen or set()
+        try:
+            # Streams entries and stops reading once max_articles new ones are found
+            articles = self._collect_entries(iter_entries(source), seen, entry_ids)
+        except FeedFormatError as e:
+            logger.debug(f"{self.name}: streaming parse failed ({str(e)}), using feedparser")
+            if entry_ids is not None:
+                entry_ids.clear()
+            articles = self._collect_entries(feedparser.parse(source).entries, seen, entry_ids)
+        
+        self.article_count = len(articles)
+        return articles
+    
+    def _collect_entries(self, entries, seen: set, entry_ids: Optional[List[str]] = None) -> List[Dict]:
+        """Turn feed entries into article dicts until max_articles new ones are found"""
+        articles = []
+        
+        for entry in entries:
+            if len(articles) >= self.max_articles:
+                break
+            
+            entry_id = entry.get('id') or entry.get('link', '')
+            if entry_ids is not None:
+                entry_ids.append(entry_id)
+            if entry_id in seen or self._is_known_url(entry.get('link', '')):
+                continue
+            
+            article = {
+                'title': entry.get('title', ''),
+                'url': entry.get('link', ''),
+                'summary': self._clean_text(entry.get('summary', '')),
+                'published': entry.get('published', datetime.now().isoformat()),
+                'source': self.name,
+                'source_url': self.url,
+                'scraped_at': datetime.now().isoformat(),
+                'entry_id': entry_id
+            }
+            articles.append(article)
+        
+        return articles
+    
+    def _is_known_url(self, url: str) -> bool:
+        """Check whether an article URL was handled in an earlier run"""
+        return self.seen_urls is not None and url in self.seen_urls
+    
+    def _clean_text(self, text: str) -> str:
+        """Clean and normalize text"""
+        # Same output as BeautifulSoup(text).get_text() + whitespace collapse,
+        # without building a tree; plain strings skip parsing entirely
+        return clean_text(text)
     
     def _extract_text_from_element(self, element, selector: str) -> str:
         """Safely extract text from element"""
@@ -0,0 +1,254 @@
+"""
+Circuit breaker - per-source failure isolation, backoff and health stats
+"""
+from typing import Dict, Optional
+from pathlib import Path
+import json
+import random
+import threading
+import time
+
+from loguru import logger
+
+from src.utils.shared_state import SharedInstance, save_json_atomic
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+DEFAULT_BREAKER_CONFIG = {
+    'failure_threshold': 3,     # Consecutive failures before opening
+    'base_backoff': 60,         # Seconds open after the first trip
+    'max_backoff': 3600,        # Cap for exponential backoff
+    'jitter': 0.2,              # +/- fraction applied to each backoff
+}
+
+# Weight of the newest sample in the latency / error-rate moving averages
+EWMA_ALPHA = 0.2
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open probe -> closed"""
+
+    def __init__(self, name: str, config: Optional[Dict] = None):
+        """Initialize breaker in the closed state"""
+        self.name = name
+        self.config = {**DEFAULT_BREAKER_CONFIG, **(config or {})}
+        self._lock = threading.Lock()
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0                 # Consecutive trips, drives the backoff exponent
+        self.open_until = 0.0          # Wall-clock time, so it survives restarts
+        self._probe_in_flight = False
+
+        # Health statistics
+        self.requests = 0
+        self.failures = 0
+        self.latency_ewma: Optional[float] = None
+        self.error_rate_ewma = 0.0
+
+    def allow_request(self) -> bool:
+        """Check whether a request may go out now"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+
+            if self.state == OPEN:
+                if time.time() < self.open_until:
+                    return False
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+
+            # Half-open: let exactly one probe through
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful request"""
+        with self._lock:
+            self._observe(latency, failed=False)
+            if self.state != CLOSED:
+                logger.info(f"✅ {self.name}: circuit closed after successful probe")
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self.trips = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, latency: float) -> None:
+        """Record a failed request, opening the circuit if needed"""
+        with self._lock:
+            self._observe(latency, failed=True)
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.config['failure_threshold']:
+                self._trip()
+
+    def _trip(self) -> None:
+        """Open the circuit with exponential backoff and jitter (caller holds the lock)"""
+        backoff = min(
+            self.config['max_backoff'],
+            self.config['base_backoff'] * (2 ** self.trips)
+        )
+        jitter = self.config['jitter']
+        backoff *= random.uniform(1 - jitter, 1 + jitter)
+
+        self.trips += 1
+        self.state = OPEN
+        self.open_until = time.time() + backoff
+        logger.warning(f"⛔ {self.name}: circuit open for {backoff:.0f}s after "
+                       f"{self.consecutive_failures} consecutive failures")
+
+    def _observe(self, latency: float, failed: bool) -> None:
+        """Update health statistics (caller holds the lock)"""
+        self.requests += 1
+        if failed:
+            self.failures += 1
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += EWMA_ALPHA * (latency - self.latency_ewma)
+        self.error_rate_ewma += EWMA_ALPHA * ((1.0 if failed else 0.0) - self.error_rate_ewma)
+
+    def to_dict(self) -> Dict:
+        """Serialize persistent state"""
+        with self._lock:
+            return {
+                'state': self.state if self.state != HALF_OPEN else OPEN,
+                'consecutive_failures': self.consecutive_failures,
+                'trips': self.trips,
+                'open_until': self.open_until,
+                'requests': self.requests,
+                'failures': self.failures,
+                'latency_ewma': self.latency_ewma,
+                'error_rate_ewma': self.error_rate_ewma,
+            }
+
+    def load(self, state: Dict) -> None:
+        """Restore persistent state"""
+        with self._lock:
+            self.state = state.get('state', CLOSED)
+            self.consecutive_failures = state.get('consecutive_failures', 0)
+            self.trips = state.get('trips', 0)
+            self.open_until = state.get('open_until', 0.0)
+            self.requests = state.get('requests', 0)
+            self.failures = state.get('failures', 0)
+            self.latency_ewma = state.get('latency_ewma')
+            self.error_rate_ewma = state.get('error_rate_ewma', 0.0)
+
+
+def guarded_get(breaker: CircuitBreaker, transport, url: str, headers: Optional[Dict] = None,
+                timeout: Optional[float] = None):
+    """GET through a source's circuit breaker; returns a 2xx/304 response or None"""
+    if not breaker.allow_request():
+        logger.warning(f"⛔ {breaker.name}: circuit open, skipping {url}")
+        return None
+
+    started = time.monotonic()
+    try:
+        response = transport.get(url, headers=headers, timeout=timeout)
+        if response.status_code != 304:
+            response.raise_for_status()
+    except Exception as e:
+        breaker.record_failure(time.monotonic() - started)
+        logger.error(f"Error fetching {url}: {str(e)}")
+        return None
+
+    breaker.record_success(response.elapsed.total_seconds())
+    return response
+
+
+class SourceHealth:
+    """Registry of per-source breakers, persisted between runs"""
+
+    def __init__(self, path: str = 'data/cache/source_health.json', defaults: Optional[Dict] = None):
+        """Initialize registry and load persisted state"""
+        self.path = Path(path)
+        self.defaults = defaults or {}
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._saved: Dict[str, Dict] = {}
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'SourceHealth':
+        """Build a registry from the `scraping.circuit_breaker` config section"""
+        breaker_config = dict(config.get('scraping', {}).get('circuit_breaker', {}))
+        path = breaker_config.pop('path', 'data/cache/source_health.json')
+        return cls(path=path, defaults=breaker_config)
+
+    def _load(self) -> None:
+        """Load persisted breaker state"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._saved = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load source health {self.path}: {str(e)}")
+
+    def breaker(self, name: str, overrides: Optional[Dict] = None) -> CircuitBreaker:
+        """Get (or create and restore) the breaker for a source"""
+        with self._lock:
+            if name not in self._breakers:
+                breaker = CircuitBreaker(name, {**self.defaults, **(overrides or {})})
+                if name in self._saved:
+                    breaker.load(self._saved[name])
+                self._breakers[name] = breaker
+            return self._breakers[name]
+
+    def is_open(self, name: str) -> bool:
+        """Check, without consuming a probe, whether a source is still backing off
+
+        Falls back to the persisted state, so a source can be skipped before
+        its scraper (and breaker) has been built in this process.
+        """
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is not None:
+                state, open_until = breaker.state, breaker.open_until
+            else:
+                saved = self._saved.get(name, {})
+                state, open_until = saved.get('state', CLOSED), saved.get('open_until', 0.0)
+        return state == OPEN and time.time() < open_until
+
+    def stats(self) -> Dict[str, Dict]:
+        """Get health state for every known source"""
+        with self._lock:
+            return {name: breaker.to_dict() for name, breaker in self._breakers.items()}
+
+    def save(self) -> None:
+        """Persist breaker state atomically"""
+        active = {name: stats for name, stats in self.stats().items()
+                  if stats['requests'] or stats['state'] != CLOSED}
+        state = {**self._saved, **active}
+        try:
+            save_json_atomic(self.path, state, indent=2)
+        except Exception as e:
+            logger.warning(f"Could not save source health {self.path}: {str(e)}")
+
+    def log_stats(self) -> None:
+        """Log latency and error rate per source"""
+        for name, stats in self.stats().items():
+            if not stats['requests']:
+                continue
+            latency = stats['latency_ewma'] or 0.0
+            logger.info(f"🩺 {name}: {stats['state']}, latency {latency:.2f}s, "
+                        f"error rate {stats['error_rate_ewma']:.0%} "
+                        f"({stats['failures']}/{stats['requests']} failed)")
+
+
+_source_health: SharedInstance[SourceHealth] = SharedInstance(SourceHealth)
+
+
+def configure_source_health(config: Dict) -> SourceHealth:
+    """(Re)create the shared health registry from configuration"""
+    return _source_health.configure(lambda: SourceHealth.from_config(config))
+
+
+def get_source_health() -> SourceHealth:
+    """Get the shared health registry, creating one with defaults if needed"""
+    return _source_health.get()
@@ -0,0 +1,141 @@
+"""
+Feed cache - conditional-GET validators and seen entries per feed
+"""
+from typing import Dict, Iterable, Set
+from pathlib import Path
+import hashlib
+import json
+import threading
+
+from loguru import logger
+
+from src.utils.shared_state import SharedInstance, save_json_atomic
+
+
+class FeedCache:
+    """Stores ETag / Last-Modified / body hash and seen entry ids for each feed
+
+    Updates are kept in memory until `save()`, which the caller runs once the
+    scraped articles have been stored: a run that discards its articles
+    (e.g. --test-scrape) must not make the next run see an unchanged feed.
+    """
+
+    def __init__(self, path: str = 'data/cache/feeds.json', enabled: bool = True,
+                 max_seen: int = 1000):
+        """Initialize cache and load persisted state"""
+        self.path = Path(path)
+        self.enabled = enabled
+        self.max_seen = max_seen
+        self._lock = threading.Lock()
+        self._feeds: Dict[str, Dict] = {}
+        self._dirty = False
+
+        if self.enabled:
+            self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'FeedCache':
+        """Build a cache from the `scraping.feed_cache` config section"""
+        cache_config = config.get('scraping', {}).get('feed_cache', {})
+        return cls(
+            path=cache_config.get('path', 'data/cache/feeds.json'),
+            enabled=cache_config.get('enabled', True),
+            max_seen=cache_config.get('max_seen', 1000),
+        )
+
+    def _load(self) -> None:
+        """Load persisted feed state"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._feeds = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load feed cache {self.path}: {str(e)}")
+            self._feeds = {}
+
+    def save(self) -> None:
+        """Persist feed state atomically if it changed since the last save"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._dirty:
+                self._save()
+                self._dirty = False
+
+    def _save(self) -> None:
+        """Write feed state atomically (caller holds the lock)"""
+        try:
+            save_json_atomic(self.path, self._feeds)
+        except Exception as e:
+            logger.warning(f"Could not save feed cache {self.path}: {str(e)}")
+
+    def conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        """Get If-None-Match / If-Modified-Since headers for a feed"""
+        if not self.enabled:
+            return {}
+
+        with self._lock:
+            state = self._feeds.get(feed_url, {})
+            headers = {}
+            if state.get('etag'):
+                headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                headers['If-Modified-Since'] = state['last_modified']
+            return headers
+
+    def update_validators(self, feed_url: str, response_headers, content: bytes) -> bool:
+        """Record the response validators; return False if the body is unchanged"""
+        if not self.enabled:
+            return True
+
+        body_hash = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            state = self._feeds.setdefault(feed_url, {})
+            changed = state.get('body_hash') != body_hash
+            state['etag'] = response_headers.get('ETag')
+            state['last_modified'] = response_headers.get('Last-Modified')
+            state['body_hash'] = body_hash
+            self._dirty = True
+            return changed
+
+    def seen_entries(self, feed_url: str) -> Set[str]:
+        """Get the ids of entries already returned for a feed"""
+        if not self.enabled:
+            return set()
+
+        with self._lock:
+            return set(self._feeds.get(feed_url, {}).get('seen', []))
+
+    def mark_seen(self, feed_url: str, entry_ids: Iterable[str]) -> None:
+        """Record entry ids as seen, keeping the most recent `max_seen`
+
+        `seen` is kept newest first: this fetch's ids (in feed order, newest
+        entries first) go in front, so trimming drops the oldest ids.
+        """
+        if not self.enabled:
+            return
+
+        entry_ids = list(dict.fromkeys(entry_id for entry_id in entry_ids if entry_id))
+        if not entry_ids:
+            return
+
+        new_ids = set(entry_ids)
+        with self._lock:
+            state = self._feeds.setdefault(feed_url, {})
+            seen = [entry_id for entry_id in state.get('seen', []) if entry_id not in new_ids]
+            state['seen'] = (entry_ids + seen)[:self.max_seen]
+            self._dirty = True
+
+
+_feed_cache: SharedInstance[FeedCache] = SharedInstance(FeedCache)
+
+
+def configure_feed_cache(config: Dict) -> FeedCache:
+    """(Re)create the shared feed cache from configuration"""
+    return _feed_cache.configure(lambda: FeedCache.from_config(config))
+
+
+def get_feed_cache() -> FeedCache:
+    """Get the shared feed cache, creating one with defaults if needed"""
+    return _feed_cache.get()
@@ -0,0 +1,119 @@
+"""
+Streaming feed parser - iterates RSS/Atom entries with lxml iterparse
+"""
+from typing import Dict, Iterator, Optional
+from io import BytesIO
+
+from lxml import etree
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+RSS1 = '{http://purl.org/rss/1.0/}'
+RDF = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}'
+CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+
+ENTRY_TAGS = ('item', f'{RSS1}item', f'{ATOM}entry')
+
+
+class FeedFormatError(Exception):
+    """Raised when a document can't be streamed and should go to feedparser"""
+
+
+def _local(tag) -> str:
+    """Tag name without namespace"""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def _text(element) -> str:
+    """Element content as feedparser reports it: text, or inner markup for inline XHTML"""
+    children = list(element)
+    if not children:
+        return element.text or ''
+
+    # Atom type="xhtml" wraps content in a single <div>
+    if len(children) == 1 and _local(children[0].tag) == 'div' and not (element.text or '').strip():
+        element = children[0]
+        children = list(element)
+    return (element.text or '') + ''.join(
+        etree.tostring(child, encoding='unicode', with_tail=True) for child in children
+    )
+
+
+def _atom_link(entry) -> str:
+    """Alternate link of an Atom entry"""
+    fallback = ''
+    for link in entry.iterchildren(f'{ATOM}link'):
+        rel = link.get('rel', 'alternate')
+        if rel == 'alternate':
+            return link.get('href', '')
+        fallback = fallback or link.get('href', '')
+    return fallback
+
+
+def _entry(element) -> Dict[str, Optional[str]]:
+    """Fields of one entry, using feedparser's names and precedence"""
+    fields: Dict[str, Optional[str]] = {}
+    content = None
+
+    for child in element:
+        tag = child.tag
+        name = _local(tag)
+        if name == 'title' and 'title' not in fields:
+            fields['title'] = _text(child)
+        elif name in ('guid', 'id') and 'id' not in fields:
+            fields['id'] = (child.text or '').strip()
+        elif name == 'link' and 'link' not in fields and not tag.startswith(ATOM):
+            fields['link'] = (child.text or '').strip()
+        elif name in ('description', 'summary') and 'summary' not in fields:
+            fields['summary'] = _text(child)
+        elif (tag == CONTENT_ENCODED or tag == f'{ATOM}content') and content is None:
+            content = _text(child)
+        elif name in ('pubDate', 'published') and 'published' not in fields:
+            fields['published'] = (child.text or '').strip()
+
+    if element.tag == f'{ATOM}entry':
+        fields['link'] = _atom_link(element)
+    elif 'link' not in fields and element.get(f'{RDF}about'):
+        fields['link'] = element.get(f'{RDF}about')
+
+    if 'summary' not in fields and content is not None:
+        fields['summary'] = content
+    return fields
+
+
+def iter_entries(content: bytes) -> Iterator[Dict[str, Optional[str]]]:
+    """Yield entries one at a time, freeing each element once it has been read
+
+    Stopping iteration early stops parsing, so callers that need only the
+    first few new entries never touch the rest of the document.
+    Raises FeedFormatError if the document isn't a well-formed RSS/Atom feed,
+    even after some entries were yielded; callers should then start over.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    parser = etree.iterparse(
+        BytesIO(content),
+        events=('end',),
+        tag=ENTRY_TAGS,
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+    )
+    found = False
+    try:
+        for _, element in parser:
+            found = True
+            entry = _entry(element)
+
+            # Free the entry and everything already parsed before it
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+            yield entry
+    except etree.XMLSyntaxError as e:
+        raise FeedFormatError(str(e)) from e
+
+    if not found:
+        raise FeedFormatError("No RSS/Atom entries found")
@@ -0,0 +1,109 @@
+"""
+Fast HTML-to-text extraction for feed summaries and scraped snippets
+"""
+from html.parser import HTMLParser
+from typing import List
+
+from bs4 import BeautifulSoup
+from bs4.dammit import EntitySubstitution
+
+# Tags whose text BeautifulSoup's get_text() leaves out
+# (Script, Stylesheet, TemplateString and Ruby* string containers)
+EXCLUDED_CONTAINERS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+# Elements that never stay open, so they never enclose text
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen',
+    'link', 'menuitem', 'meta', 'param', 'source', 'spacer', 'track', 'wbr',
+    'basefont', 'bgsound', 'command', 'frame', 'image', 'isindex', 'nextid',
+])
+
+
+class _TextExtractor(HTMLParser):
+    """Streaming tokenizer that collects the same text BeautifulSoup would"""
+
+    def __init__(self):
+        # Entities are decoded by hand to mirror bs4's html.parser tree builder
+        super().__init__(convert_charrefs=False)
+        self.parts: List[str] = []
+        self.open_tags: List[str] = []
+        self.excluded_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+        self.open_tags.append(tag)
+        if tag in EXCLUDED_CONTAINERS:
+            self.excluded_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        # <tag/> opens and immediately closes; it cannot hold text
+        pass
+
+    def handle_endtag(self, tag):
+        # Pop back to the most recent matching open tag; ignore strays
+        for index in range(len(self.open_tags) - 1, -1, -1):
+            if self.open_tags[index] == tag:
+                closed = self.open_tags[index:]
+                del self.open_tags[index:]
+                self.excluded_depth -= sum(1 for name in closed if name in EXCLUDED_CONTAINERS)
+                return
+
+    def handle_data(self, data):
+        if not self.excluded_depth:
+            self.parts.append(data)
+
+    def handle_entityref(self, name):
+        character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+        self.handle_data(character if character is not None else f"&{name}")
+
+    def handle_charref(self, name):
+        if name[0] in 'xX':
+            codepoint = int(name.lstrip('xX'), 16)
+        else:
+            codepoint = int(name)
+
+        data = None
+        if codepoint < 256:
+            # Numeric references below 256 are often Windows-1252 bytes
+            try:
+                data = bytearray([codepoint]).decode('windows-1252')
+            except UnicodeDecodeError:
+                pass
+        if not data:
+            try:
+                data = chr(codepoint)
+            except (ValueError, OverflowError):
+                pass
+        self.handle_data(data or "\N{REPLACEMENT CHARACTER}")
+
+    def unknown_decl(self, data):
+        # CDATA sections count as text; other declarations do not
+        if data.upper().startswith('CDATA['):
+            self.parts.append(data[len('CDATA['):])
+
+
+def html_to_text(text: str) -> str:
+    """Strip markup and decode entities, matching BeautifulSoup(...).get_text()"""
+    if not text:
+        return ""
+
+    # Plain strings (already-extracted text, most titles) need no parsing
+    if '<' not in text and '&' not in text:
+        return text
+
+    extractor = _TextExtractor()
+    try:
+        extractor.feed(text)
+        extractor.close()
+    except Exception:
+        # Markup html.parser rejects: defer to BeautifulSoup's own handling
+        return BeautifulSoup(text, 'html.parser').get_text()
+    return ''.join(extractor.parts)
+
+
+def clean_text(text: str) -> str:
+    """Strip markup and collapse whitespace"""
+    if not text:
+        return ""
+    return ' '.join(html_to_text(text).split())
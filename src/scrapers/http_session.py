@@ -0,0 +1,210 @@
+"""
+Shared HTTP transport - pooled keep-alive sessions used by every scraper
+"""
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import threading
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from loguru import logger
+
+from src.scrapers.rate_limiter import RateLimiter
+from src.utils.shared_state import SharedInstance
+
+try:
+    import brotli  # noqa: F401  (enables 'br' decoding in urllib3 and httpx)
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+DEFAULT_HTTP_CONFIG = {
+    'pool_size': 10,
+    'timeout': 10,
+    'retries': 2,
+    'backoff_factor': 0.5,
+}
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HttpTransport:
+    """One pooled, keep-alive transport shared by all scrapers and feed fetches"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        """Initialize the shared session from the `scraping.http` config section"""
+        config = config or {}
+        self.http_config = {
+            **DEFAULT_HTTP_CONFIG,
+            **config.get('scraping', {}).get('http', {}),
+        }
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive',
+        })
+
+        default_adapter = self._build_adapter(self.http_config)
+        self.session.mount('https://', default_adapter)
+        self.session.mount('http://', default_adapter)
+        self._adapters = [default_adapter]
+
+        # Per-host overrides registered by sources (host -> http config)
+        self._host_configs: Dict[str, Dict] = {}
+
+        # Politeness applies to outbound requests only, never to cache hits or parsing
+        self.rate_limiter = RateLimiter(config)
+
+        # Async connection accounting (sync pools keep their own counters)
+        self._lock = threading.Lock()
+        self._async_requests = 0
+        self._async_new_connections = 0
+
+    def _build_adapter(self, http_config: Dict) -> HTTPAdapter:
+        """Create a pooled adapter with retry/backoff for idempotent requests"""
+        retries = Retry(
+            total=http_config['retries'],
+            backoff_factor=http_config['backoff_factor'],
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False,
+        )
+        return HTTPAdapter(
+            pool_connections=http_config['pool_size'],
+            pool_maxsize=http_config['pool_size'],
+            max_retries=retries,
+        )
+
+    def register_source(self, source_config: Dict) -> None:
+        """Apply a source's `http:` and `rate_limit:` overrides to every host it fetches from"""
+        self.rate_limiter.register_source(source_config)
+
+        overrides = source_config.get('http')
+        if not overrides:
+            return
+
+        http_config = {**self.http_config, **overrides}
+        adapter = self._build_adapter(http_config)
+
+        for url in (source_config.get('url'), source_config.get('rss_feed')):
+            if not url:
+                continue
+            parsed = urlparse(url)
+            host = parsed.netloc.lower()
+            if host in self._host_configs:
+                continue
+            self._host_configs[host] = http_config
+            # requests picks the longest matching prefix, so this wins over the default
+            self.session.mount(f"{parsed.scheme}://{host}/", adapter)
+            self._adapters.append(adapter)
+
+    def config_for(self, url: str) -> Dict:
+        """Get the effective HTTP config for a URL"""
+        return self._host_configs.get(urlparse(url).netloc.lower(), self.http_config)
+
+    def timeout_for(self, url: str) -> float:
+        """Get the configured timeout for a URL"""
+        return self.config_for(url)['timeout']
+
+    def get(self, url: str, headers: Optional[Dict] = None,
+            timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """Issue a pooled GET request once the host's rate limit allows it"""
+        self.rate_limiter.acquire(url)
+        return self.session.get(
+            url,
+            headers=headers,
+            timeout=timeout if timeout is not None else self.timeout_for(url),
+            **kwargs
+        )
+
+    @staticmethod
+    def _build_async_transport(http_config: Dict, keepalive: int) -> httpx.AsyncHTTPTransport:
+        """Create an async pool; httpx ignores client-level limits once a transport is given"""
+        return httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=keepalive),
+            # httpx retries connection failures only; status retries stay sync-side
+            retries=http_config['retries'],
+        )
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Create an async client with the same headers, pool and retry settings"""
+        # Hosts with `http:` overrides get their own pool, like their sync adapters
+        mounts = {
+            f"all://{host}": self._build_async_transport(http_config, http_config['pool_size'])
+            for host, http_config in self._host_configs.items()
+        }
+        return httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            timeout=self.http_config['timeout'],
+            follow_redirects=True,
+            # The default pool is shared by every other host
+            transport=self._build_async_transport(self.http_config, self.http_config['pool_size'] * 4),
+            mounts=mounts,
+        )
+
+    async def trace(self, event_name: str, info: Dict) -> None:
+        """httpx trace hook - counts requests and newly opened connections"""
+        if event_name == 'http11.send_request_headers.started' or \
+                event_name == 'http2.send_request_headers.started':
+            with self._lock:
+                self._async_requests += 1
+        elif event_name == 'connection.connect_tcp.complete':
+            with self._lock:
+                self._async_new_connections += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Count requests, new connections and reused connections"""
+        requests_made = 0
+        new_connections = 0
+
+        for adapter in set(self._adapters):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_made += pool.num_requests
+                new_connections += pool.num_connections
+
+        with self._lock:
+            requests_made += self._async_requests
+            new_connections += self._async_new_connections
+
+        return {
+            'requests': requests_made,
+            'new_connections': new_connections,
+            'reused_connections': max(0, requests_made - new_connections),
+        }
+
+    def log_stats(self) -> None:
+        """Log connection reuse statistics"""
+        stats = self.stats()
+        logger.info(
+            f"🔌 HTTP: {stats['requests']} requests, "
+            f"{stats['reused_connections']} reused / {stats['new_connections']} new connections"
+        )
+        self.rate_limiter.log_stats()
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session.close()
+
+
+# Reconfiguring closes the previous transport's connection pool
+_transport: SharedInstance[HttpTransport] = SharedInstance(HttpTransport, on_replace=lambda transport: transport.close())
+
+
+def configure_transport(config: Dict) -> HttpTransport:
+    """(Re)create the shared transport from configuration"""
+    return _transport.configure(lambda: HttpTransport(config))
+
+
+def get_transport() -> HttpTransport:
+    """Get the shared transport, creating one with defaults if needed"""
+    return _transport.get()
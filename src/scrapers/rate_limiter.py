@@ -0,0 +1,132 @@
+"""
+Rate limiter - per-host token buckets for outbound scraper requests
+"""
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import asyncio
+import threading
+import time
+
+from loguru import logger
+
+DEFAULT_RATE_LIMIT = {
+    'requests_per_second': 1.0,
+    'burst': 3,
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket usable from threads and async tasks alike"""
+
+    def __init__(self, rate: float, burst: float):
+        """Initialize bucket full"""
+        self.rate = max(rate, 1e-6)
+        self.burst = max(burst, 1.0)
+        self.tokens = self.burst
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token now and return how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            # Going negative reserves a future token, so waiters queue fairly
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is available; return seconds waited"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self) -> float:
+        """Await until a token is available; return seconds waited"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """Registry of per-host buckets with wait-time accounting per source"""
+
+    def __init__(self, config: Optional[Dict] = None):
+        """Initialize from the `scraping.rate_limit` config section"""
+        config = config or {}
+        self.default_config = {
+            **DEFAULT_RATE_LIMIT,
+            **config.get('scraping', {}).get('rate_limit', {}),
+        }
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._host_sources: Dict[str, str] = {}
+        self._waited: Dict[str, float] = {}
+        self._requests: Dict[str, int] = {}
+
+    def register_source(self, source_config: Dict) -> None:
+        """Create buckets for a source's hosts using its `rate_limit:` overrides"""
+        limit_config = {**self.default_config, **source_config.get('rate_limit', {})}
+        name = source_config.get('name', 'Unknown')
+
+        with self._lock:
+            for url in (source_config.get('url'), source_config.get('rss_feed')):
+                if not url:
+                    continue
+                host = urlparse(url).netloc.lower()
+                if host in self._buckets:
+                    continue
+                self._buckets[host] = TokenBucket(
+                    limit_config['requests_per_second'], limit_config['burst']
+                )
+                self._host_sources[host] = name
+
+    def _bucket(self, url: str):
+        """Get the bucket and source name for a URL, creating a default bucket"""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(
+                    self.default_config['requests_per_second'], self.default_config['burst']
+                )
+                self._host_sources[host] = host
+            return self._buckets[host], self._host_sources[host]
+
+    def _record(self, source: str, waited: float) -> None:
+        with self._lock:
+            self._waited[source] = self._waited.get(source, 0.0) + waited
+            self._requests[source] = self._requests.get(source, 0) + 1
+
+    def acquire(self, url: str) -> float:
+        """Wait for the host's bucket before a blocking request"""
+        bucket, source = self._bucket(url)
+        waited = bucket.acquire()
+        self._record(source, waited)
+        return waited
+
+    async def aacquire(self, url: str) -> float:
+        """Wait for the host's bucket before an async request"""
+        bucket, source = self._bucket(url)
+        waited = await bucket.aacquire()
+        self._record(source, waited)
+        return waited
+
+    def stats(self) -> Dict[str, Dict]:
+        """Get requests and seconds spent waiting, per source"""
+        with self._lock:
+            return {
+                source: {'requests': self._requests[source], 'waited': round(self._waited[source], 3)}
+                for source in self._requests
+            }
+
+    def log_stats(self) -> None:
+        """Log per-source politeness waits"""
+        for source, stats in self.stats().items():
+            if stats['waited'] > 0:
+                logger.info(f"⏳ {source}: waited {stats['waited']:.2f}s over {stats['requests']} requests")
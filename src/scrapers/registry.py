@@ -0,0 +1,98 @@
+"""
+Scraper registry - lazy discovery and construction of scrapers per source
+"""
+from typing import Callable, Dict, List, Optional
+import importlib
+
+from loguru import logger
+
+# Built-in scrapers by `sources:` key, as "module:Class" so nothing is imported up front
+BUILTIN_SCRAPERS = {
+    'techcrunch': 'src.scrapers.techcrunch_scraper:TechCrunchScraper',
+    'analytics_insight': 'src.scrapers.analytics_insight_scraper:AnalyticsInsightScraper',
+    'business_insider': 'src.scrapers.business_insider_scraper:BusinessInsiderScraper',
+    'weforum': 'src.scrapers.weforum_scraper:WeForumScraper',
+    'producthunt': 'src.scrapers.producthunt_scraper:ProductHuntScraper',
+    'forbes': 'src.scrapers.forbes_scraper:ForbesScraper',
+}
+
+# Third-party packages can register scrapers under this entry-point group
+ENTRY_POINT_GROUP = 'linkedin_automation.scrapers'
+
+
+def import_dotted_path(path: str):
+    """Import "package.module:Attr" (or "package.module.Attr")"""
+    if ':' in path:
+        module_name, attr = path.split(':', 1)
+    else:
+        module_name, _, attr = path.rpartition('.')
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _entry_point(name: str):
+    """Find an installed entry point for a source key"""
+    from importlib.metadata import entry_points
+
+    try:
+        candidates = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:  # Python < 3.10
+        candidates = entry_points().get(ENTRY_POINT_GROUP, [])
+
+    for entry_point in candidates:
+        if entry_point.name == name:
+            return entry_point
+    return None
+
+
+class ScraperRegistry:
+    """Maps `sources:` entries to scraper classes, importing and building on first use"""
+
+    def __init__(self, sources_config: Dict, on_build: Optional[Callable] = None):
+        """Initialize registry from the `sources:` config section"""
+        self.sources_config = sources_config
+        self.on_build = on_build
+        self._instances: Dict[str, object] = {}
+
+    def has_source(self, name: str) -> bool:
+        """Check whether a source is configured or built in"""
+        return name in self.sources_config or name in BUILTIN_SCRAPERS
+
+    def enabled_sources(self) -> List[str]:
+        """Keys of configured sources that are enabled"""
+        return [
+            name for name, source_config in self.sources_config.items()
+            if (source_config or {}).get('enabled', True)
+        ]
+
+    def resolve(self, name: str) -> type:
+        """Find the scraper class for a source: config `scraper:`, built-in, then entry point"""
+        source_config = self.sources_config.get(name) or {}
+
+        path = source_config.get('scraper') or BUILTIN_SCRAPERS.get(name)
+        if path:
+            return import_dotted_path(path)
+
+        entry_point = _entry_point(name)
+        if entry_point is not None:
+            return entry_point.load()
+
+        raise ValueError(f"No scraper registered for source: {name}")
+
+    def get(self, name: str):
+        """Get the scraper for a source, importing and instantiating it on first use"""
+        if name not in self._instances:
+            if not self.has_source(name) and _entry_point(name) is None:
+                raise ValueError(f"Unknown source: {name}")
+
+            scraper_class = self.resolve(name)
+            scraper = scraper_class(self.sources_config.get(name) or {})
+            if self.on_build:
+                self.on_build(scraper)
+            self._instances[name] = scraper
+            logger.debug(f"Loaded scraper {scraper_class.__name__} for {name}")
+
+        return self._instances[name]
+
+    def built(self) -> Dict[str, object]:
+        """Scrapers instantiated so far"""
+        return dict(self._instances)
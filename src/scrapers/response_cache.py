@@ -0,0 +1,193 @@
+"""
+Response cache - persistent, content-addressed on-disk cache for fetched pages
+"""
+from typing import Dict, Optional
+from pathlib import Path
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from loguru import logger
+
+from src.utils.shared_state import SharedInstance
+
+
+class ResponseCache:
+    """Compressed response bodies on disk with per-source TTL and LRU size cap"""
+
+    def __init__(self, path: str = 'data/cache/http', enabled: bool = True,
+                 default_ttl: int = 3600, max_size_mb: float = 200,
+                 offline: bool = False):
+        """Initialize cache directory and index"""
+        self.path = Path(path)
+        self.enabled = enabled or offline
+        self.default_ttl = default_ttl
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.offline = offline
+        self._lock = threading.Lock()
+        self.conn = None
+
+        if self.enabled:
+            self._init_index()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'ResponseCache':
+        """Build a cache from the `scraping.response_cache` config section"""
+        scraping_config = config.get('scraping', {})
+        cache_config = scraping_config.get('response_cache', {})
+        offline = scraping_config.get('offline', False) or \
+            os.getenv('SCRAPER_OFFLINE', 'false').lower() == 'true'
+        return cls(
+            path=cache_config.get('path', 'data/cache/http'),
+            enabled=cache_config.get('enabled', True),
+            default_ttl=cache_config.get('ttl', 3600),
+            max_size_mb=cache_config.get('max_size_mb', 200),
+            offline=offline,
+        )
+
+    def _init_index(self) -> None:
+        """Create the SQLite index of cached URLs and bodies"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path / 'index.db'), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body_hash TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS bodies (
+                body_hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self.conn.commit()
+
+    def _body_file(self, body_hash: str) -> Path:
+        """Path of a compressed body, sharded by hash prefix"""
+        return self.path / body_hash[:2] / f"{body_hash}.z"
+
+    def get(self, url: str, ttl: Optional[int] = None) -> Optional[bytes]:
+        """Get a cached body; `ttl` of None ignores expiry (offline reads)"""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT body_hash, stored_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            body_hash, stored_at = row
+            if ttl is not None and now - stored_at > ttl:
+                return None
+
+            try:
+                content = zlib.decompress(self._body_file(body_hash).read_bytes())
+            except Exception as e:
+                logger.debug(f"Dropping unreadable cache entry for {url}: {str(e)}")
+                self.conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self.conn.commit()
+                return None
+
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url))
+            self.conn.commit()
+            return content
+
+    def put(self, url: str, content: bytes) -> None:
+        """Store a body under its content hash and point the URL at it"""
+        if not self.enabled or not content:
+            return
+
+        body_hash = hashlib.sha256(content).hexdigest()
+        now = time.time()
+        with self._lock:
+            try:
+                body_file = self._body_file(body_hash)
+                if not body_file.exists():
+                    body_file.parent.mkdir(parents=True, exist_ok=True)
+                    compressed = zlib.compress(content, 6)
+                    tmp_file = body_file.with_suffix('.tmp')
+                    tmp_file.write_bytes(compressed)
+                    tmp_file.replace(body_file)
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO bodies (body_hash, size) VALUES (?, ?)",
+                        (body_hash, len(compressed))
+                    )
+
+                old = self.conn.execute(
+                    "SELECT body_hash FROM responses WHERE url = ?", (url,)
+                ).fetchone()
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO responses (url, body_hash, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (url, body_hash, now, now)
+                )
+                if old and old[0] != body_hash:
+                    self._drop_body_if_unreferenced(old[0])
+
+                self._evict()
+                self.conn.commit()
+            except Exception as e:
+                logger.warning(f"Could not cache response for {url}: {str(e)}")
+
+    def _drop_body_if_unreferenced(self, body_hash: str) -> None:
+        """Delete a body once no URL points at it (caller holds the lock)"""
+        in_use = self.conn.execute(
+            "SELECT 1 FROM responses WHERE body_hash = ? LIMIT 1", (body_hash,)
+        ).fetchone()
+        if in_use:
+            return
+        self.conn.execute("DELETE FROM bodies WHERE body_hash = ?", (body_hash,))
+        self._body_file(body_hash).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Evict least recently used URLs until under the size cap (caller holds the lock)"""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM bodies").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self.conn.execute(
+            "SELECT url, body_hash FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        for url, body_hash in rows:
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            size_row = self.conn.execute(
+                "SELECT size FROM bodies WHERE body_hash = ?", (body_hash,)
+            ).fetchone()
+            self._drop_body_if_unreferenced(body_hash)
+            if size_row and not self.conn.execute(
+                    "SELECT 1 FROM bodies WHERE body_hash = ?", (body_hash,)).fetchone():
+                total -= size_row[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Get entry count and on-disk size"""
+        if not self.enabled:
+            return {'entries': 0, 'bytes': 0}
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            size = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM bodies").fetchone()[0]
+        return {'entries': entries, 'bytes': size}
+
+
+_response_cache: SharedInstance[ResponseCache] = SharedInstance(lambda: ResponseCache(enabled=False))
+
+
+def configure_response_cache(config: Dict) -> ResponseCache:
+    """(Re)create the shared response cache from configuration"""
+    return _response_cache.configure(lambda: ResponseCache.from_config(config))
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the shared response cache, creating a disabled one if needed"""
+    return _response_cache.get()
@@ -1,17 +1,21 @@
 """
 Scraper Manager - coordinates all web scraping operations
 """
-from typing import Dict, List
+from typing import AsyncIterator, Dict, Iterator, List
 from loguru import logger
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import queue
+import threading
+import time
 import yaml
 
-from src.scrapers.techcrunch_scraper import TechCrunchScraper
-from src.scrapers.analytics_insight_scraper import AnalyticsInsightScraper
-from src.scrapers.business_insider_scraper import BusinessInsiderScraper
-from src.scrapers.weforum_scraper import WeForumScraper
-from src.scrapers.producthunt_scraper import ProductHuntScraper
-from src.scrapers.forbes_scraper import ForbesScraper
+from src.scrapers.async_engine import AsyncScrapeEngine
+from src.scrapers.circuit_breaker import configure_source_health
+from src.scrapers.feed_cache import configure_feed_cache
+from src.scrapers.http_session import configure_transport
+from src.scrapers.registry import ScraperRegistry
+from src.scrapers.response_cache import configure_response_cache
 
 
 class ScraperManager:
@@ -21,57 +25,215 @@ class ScraperManager:
         """Initialize scraper manager with configuration"""
         self.config = config
         self.sources_config = config.get('sources', {})
+        self.scraping_config = config.get('scraping', {})
+        self.transport = configure_transport(config)
+        self.feed_cache = configure_feed_cache(config)
+        self.response_cache = configure_response_cache(config)
+        self.source_health = configure_source_health(config)
+        if self.response_cache.offline:
+            logger.info("📦 Offline mode: serving pages and feeds from the response cache")
         
-        # Initialize scrapers
-        self.scrapers = {
-            'techcrunch': TechCrunchScraper(self.sources_config.get('techcrunch', {})),
-            'analytics_insight': AnalyticsInsightScraper(self.sources_config.get('analytics_insight', {})),
-            'business_insider': BusinessInsiderScraper(self.sources_config.get('business_insider', {})),
-            'weforum': WeForumScraper(self.sources_config.get('weforum', {})),
-            'producthunt': ProductHuntScraper(self.sources_config.get('producthunt', {})),
-            'forbes': ForbesScraper(self.sources_config.get('forbes', {}))
-        }
+        # Scrapers are imported and built on first use, keyed by `sources:` entries
+        self.registry = ScraperRegistry(self.sources_config, on_build=self._on_scraper_built)
         
-        logger.info(f"✅ Initialized {len(self.scrapers)} scrapers")
+        self.seen_urls = None
+        
+        # Wall-clock seconds per source for the latest run
+        self.source_timings: Dict[str, float] = {}
+        
+        logger.info(f"✅ Registered {len(self.registry.enabled_sources())} enabled sources")
+    
+    @property
+    def scrapers(self) -> Dict:
+        """Scrapers built so far"""
+        return self.registry.built()
+    
+    def _on_scraper_built(self, scraper) -> None:
+        """Hand shared run state to a freshly built scraper"""
+        scraper.seen_urls = self.seen_urls
+    
+    def set_seen_index(self, seen_urls) -> None:
+        """Share a SeenUrlIndex so scrapers drop already-handled articles"""
+        self.seen_urls = seen_urls
+        for scraper in self.scrapers.values():
+            scraper.seen_urls = seen_urls
+    
+    def _new_articles(self, articles: List[Dict]) -> List[Dict]:
+        """Drop articles already yielded this run or known from earlier runs"""
+        if self.seen_urls is None:
+            return articles
+        return [article for article in articles if self.seen_urls.add(article.get('url', ''))]
+    
+    def _circuit_open(self, name: str) -> bool:
+        """Whether a source's circuit is open, checked without building its scraper"""
+        source_name = (self.sources_config.get(name) or {}).get('name', 'Unknown')
+        return self.source_health.is_open(source_name)
+    
+    def _enabled_scrapers(self) -> Dict:
+        """Get scrapers whose source is enabled and not backing off"""
+        enabled = {}
+        for name in self.registry.enabled_sources():
+            if self._circuit_open(name):
+                logger.warning(f"  ⛔ {name}: circuit open, skipping this run")
+                continue
+            try:
+                enabled[name] = self.registry.get(name)
+            except Exception as e:
+                logger.error(f"  ✗ {name}: Could not load scraper - {str(e)}")
+        return enabled
+    
+    def _finish_run(self) -> None:
+        """Log transport and health statistics and persist breaker state"""
+        self.transport.log_stats()
+        self.source_health.log_stats()
+        self.source_health.save()
     
     def scrape_all_sources(self, max_workers: int = 3) -> List[Dict]:
         """Scrape all enabled sources in parallel"""
-        all_articles = []
+        return list(self.scrape_stream(max_workers=max_workers))
+    
+    async def ascrape_all_sources(self) -> List[Dict]:
+        """Scrape all enabled sources concurrently on one event loop"""
+        return [article async for article in self.ascrape_stream()]
+    
+    def scrape_stream(self, max_workers: int = 3) -> Iterator[Dict]:
+        """Yield articles as each source finishes, so consumers overlap with network I/O"""
+        if self.scraping_config.get('mode', 'threads') == 'async':
+            yield from self._bridge_async_stream()
+            return
         
-        # Filter enabled scrapers
-        enabled_scrapers = {
-            name: scraper for name, scraper in self.scrapers.items()
-            if self.sources_config.get(name, {}).get('enabled', True)
-        }
+        enabled_scrapers = self._enabled_scrapers()
         
         logger.info(f"📰 Scraping {len(enabled_scrapers)} sources...")
+        self.source_timings = {}
+        
+        def timed_scrape(name, scraper):
+            started = time.perf_counter()
+            try:
+                return scraper.scrape()
+            finally:
+                self.source_timings[name] = time.perf_counter() - started
         
         # Scrape in parallel
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_source = {
-                executor.submit(scraper.scrape): name
+                executor.submit(timed_scrape, name, scraper): name
                 for name, scraper in enabled_scrapers.items()
             }
             
             for future in as_completed(future_to_source):
                 source_name = future_to_source[future]
                 try:
-                    articles = future.result()
-                    all_articles.extend(articles)
+                    articles = self._new_articles(future.result())
                     logger.info(f"  ✓ {source_name}: {len(articles)} articles")
                 except Exception as e:
                     logger.error(f"  ✗ {source_name}: Failed - {str(e)}")
+                    continue
+                yield from articles
         
-        return all_articles
+        self._finish_run()
+    
+    async def ascrape_stream(self) -> AsyncIterator[Dict]:
+        """Async iterator over articles, yielding as each source finishes"""
+        enabled_scrapers = self._enabled_scrapers()
+        
+        logger.info(f"📰 Scraping {len(enabled_scrapers)} sources (async)...")
+        self.source_timings = {}
+        
+        async def run(name, scraper):
+            started = time.perf_counter()
+            try:
+                return name, await scraper.ascrape(engine), None
+            except Exception as e:
+                return name, [], e
+            finally:
+                self.source_timings[name] = time.perf_counter() - started
+        
+        async with AsyncScrapeEngine.from_config(self.config) as engine:
+            tasks = [run(name, scraper) for name, scraper in enabled_scrapers.items()]
+            for finished in asyncio.as_completed(tasks):
+                source_name, articles, error = await finished
+                if error:
+                    logger.error(f"  ✗ {source_name}: Failed - {str(error)}")
+                    continue
+                articles = self._new_articles(articles)
+                logger.info(f"  ✓ {source_name}: {len(articles)} articles")
+                for article in articles:
+                    yield article
+        
+        self._finish_run()
+    
+    def _bridge_async_stream(self) -> Iterator[Dict]:
+        """Run ascrape_stream on a background loop and hand articles over a bounded queue"""
+        items: queue.Queue = queue.Queue(maxsize=self.scraping_config.get('stream_buffer', 256))
+        stop = threading.Event()
+        done = object()
+        
+        def put(item) -> bool:
+            # Block for backpressure, but give up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    items.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        async def produce():
+            async for article in self.ascrape_stream():
+                try:
+                    items.put_nowait(article)
+                except queue.Full:
+                    if not await asyncio.to_thread(put, article):
+                        return
+        
+        def run_loop():
+            try:
+                asyncio.run(produce())
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+        
+        producer = threading.Thread(target=run_loop, name='scrape-stream', daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = items.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+    
+    def save_feed_state(self) -> None:
+        """Persist feed validators and seen entries once the run's articles are stored
+        
+        Not called by runs that discard their articles (--test-scrape), so those
+        leave the next run's view of each feed untouched.
+        """
+        self.feed_cache.save()
     
     def scrape_source(self, source_name: str) -> List[Dict]:
         """Scrape a specific source"""
-        if source_name not in self.scrapers:
-            raise ValueError(f"Unknown source: {source_name}")
-        
-        scraper = self.scrapers[source_name]
+        scraper = self.registry.get(source_name)
         return scraper.scrape()
     
+    def poll_source(self, source_name: str) -> List[Dict]:
+        """Scrape one source for articles not seen before, honouring its circuit breaker"""
+        if self._circuit_open(source_name):
+            logger.debug(f"{source_name}: circuit open, skipping poll")
+            return []
+        scraper = self.registry.get(source_name)
+        
+        try:
+            return self._new_articles(scraper.scrape())
+        finally:
+            self._finish_run()
+    
     def get_source_counts(self) -> Dict[str, int]:
         """Get article count per source"""
         counts = {}
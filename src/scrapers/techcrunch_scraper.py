@@ -16,28 +16,45 @@ class TechCrunchScraper(BaseScraper):
         # TechCrunch has RSS feed
         if self.rss_feed:
             articles = self.fetch_rss()
-            if articles:
+            if articles or self.feed_unchanged:
                 return articles
         
         # Fallback to web scraping
         return self._scrape_web()
     
+    async def ascrape(self, engine) -> List[Dict]:
+        """Scrape articles from TechCrunch through the async engine"""
+        logger.info(f"📰 Scraping {self.name}...")
+        
+        if self.rss_feed:
+            articles = await self.afetch_rss(engine)
+            if articles or self.feed_unchanged:
+                return articles
+        
+        soup = await self.afetch_page(engine, self.url)
+        if not soup:
+            return []
+        return self._parse_web(soup)
+    
     def _scrape_web(self) -> List[Dict]:
         """Scrape TechCrunch website directly"""
+        soup = self.fetch_page(self.url)
+        if not soup:
+            return []
+        return self._parse_web(soup)
+    
+    def _parse_web(self, soup) -> List[Dict]:
+        """Extract articles from a fetched TechCrunch page"""
         articles = []
         
         try:
-            soup = self.fetch_page(self.url)
-            if not soup:
-                return articles
-            
             # Find article elements (adjust selectors based on actual site structure)
             article_elements = soup.select('article.post-block')[:self.max_articles]
             
             for element in article_elements:
                 try:
                     title_elem = element.select_one('h2.post-block__title a')
-                    if not title_elem:
+                    if not title_elem or self._is_known_url(title_elem.get('href', '')):
                         continue
                     
                     article = {
@@ -51,8 +68,6 @@ class TechCrunchScraper(BaseScraper):
                     if article['title'] and article['url']:
                         articles.append(article)
                     
-                    self.rate_limit(0.5)
-                    
                 except Exception as e:
                     logger.debug(f"Error parsing article: {str(e)}")
                     continue
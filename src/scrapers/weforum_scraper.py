@@ -7,3 +7,8 @@ class WeForumScraper(BaseScraper):
         if self.rss_feed:
             return self.fetch_rss()
         return []
+    
+    async def ascrape(self, engine) -> List[Dict]:
+        if self.rss_feed:
+            return await self.afetch_rss(engine)
+        return []
@@ -0,0 +1,51 @@
+"""
+Shared state - atomic JSON state files and process-wide shared instances
+"""
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
+from pathlib import Path
+import json
+import threading
+
+T = TypeVar('T')
+
+
+def save_json_atomic(path: Union[str, Path], data: Any, indent: Optional[int] = None) -> None:
+    """Write `data` as JSON to a temporary file, then move it over `path`
+
+    Readers never see a half-written file; errors are left to the caller.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent)
+    tmp_path.replace(path)
+
+
+class SharedInstance(Generic[T]):
+    """One instance shared by every caller in the process, e.g. a transport or cache
+
+    Modules expose it through `configure_x(config)` / `get_x()` functions.
+    """
+
+    def __init__(self, default: Callable[[], T], on_replace: Optional[Callable[[T], None]] = None):
+        """`default` builds the instance when `get()` runs before `configure()`"""
+        self._default = default
+        self._on_replace = on_replace
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def configure(self, build: Callable[[], T]) -> T:
+        """(Re)create the shared instance, passing the old one to `on_replace`"""
+        with self._lock:
+            if self._instance is not None and self._on_replace:
+                self._on_replace(self._instance)
+            self._instance = build()
+            return self._instance
+
+    def get(self) -> T:
+        """Get the shared instance, creating the default one if needed"""
+        with self._lock:
+            if self._instance is None:
+                self._instance = self._default()
+            return self._instance